@@ -1,4 +1,7 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
@@ -7,4 +10,29 @@ class CoreConfig(AppConfig):
     verbose_name = "Core"
 
     def ready(self) -> None:
-        pass
+        if settings.DATABASES["mongodb"].get("CHECK_INDEXES"):
+            self._check_indexes()
+
+    def _check_indexes(self) -> None:
+        from apps.core.repositories.registry import get_repositories  # noqa: PLC0415
+
+        logger = logging.getLogger("django")
+
+        try:
+            for repository in get_repositories():
+                drift = repository.get_index_drift()
+
+                if drift["missing"]:
+                    logger.warning(
+                        f"Missing indexes on {repository.collection_name}: "
+                        f"{drift['missing']}, run `manage.py ensure_indexes`"
+                    )
+
+                if drift["mismatched"]:
+                    logger.warning(
+                        f"Mismatched indexes on {repository.collection_name}: "
+                        f"{drift['mismatched']}, drop and recreate them"
+                    )
+
+        except Exception as e:
+            logger.error(f"Failed to check MongoDB indexes: {e!r}")
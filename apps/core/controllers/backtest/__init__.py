@@ -1,10 +1,9 @@
 import logging
-from datetime import UTC, datetime
-from typing import Any, ClassVar, Dict, List, Optional, Type
+from typing import Any, ClassVar, Dict, List, Type
 
+from asgiref.sync import sync_to_async
 from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from django.http import HttpResponse, HttpResponseBase
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
@@ -12,23 +11,52 @@ from rest_framework.request import Request
 from apps.core.authentication import APIKeyAuthentication
 from apps.core.controllers.base import BaseController
 from apps.core.enums.backtest_status import BacktestStatus
+from apps.core.enums.field_type import FieldType
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.backtest import BacktestModel
-from apps.core.tasks import make_backtest_report
+from apps.core.tasks import make_backtest_report, purge_backtest
 
 from .schemas.delete import delete_schema
 from .schemas.get import get_schema
 from .schemas.post import post_schema
 from .schemas.put import update_schema
+from .validators.post import BacktestPostValidator
+from .validators.put import BacktestUpdateValidator
 
 
 class BacktestController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FILTERABLE_FIELDS: ClassVar[Dict[str, FieldType]] = {
+        "_id": FieldType.OBJECT_ID,
+        "asset": FieldType.STRING,
+        "strategies": FieldType.STRING,
+        "status": FieldType.STRING,
+        "from_date": FieldType.DATETIME,
+        "to_date": FieldType.DATETIME,
+        "created_at": FieldType.DATETIME,
+        "updated_at": FieldType.DATETIME,
+    }
+    SELECTABLE_FIELDS: ClassVar[List[str]] = [
+        "asset",
+        "strategies",
+        "status",
+        "from_date",
+        "to_date",
+        "snapshot_coalesce_window",
+        "created_at",
+        "updated_at",
+    ]
+    CONDITIONAL_GET: ClassVar[bool] = True
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
     authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
         APIKeyAuthentication
     ]
+    _model: BacktestModel
 
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
@@ -41,17 +69,17 @@ class BacktestController(BaseController):
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponseBase:
+        return await super().get(request)
 
     @extend_schema(**post_schema())
-    def post(self, request: Request) -> JsonResponse:
+    async def post(self, request: Request) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
 
-        validation_errors = self._is_post_data_valid(body)
-        if validation_errors:
+        payload, validation_errors = BacktestPostValidator.parse(body)
+        if validation_errors or payload is None:
             return self.response(
                 success=False,
                 message="Invalid request data",
@@ -60,20 +88,11 @@ class BacktestController(BaseController):
             )
 
         backtest_id = None
-        backtest_data = dict(body)
-
-        from_date = body.get("from_date", 0)
-        from_date = float(from_date if from_date is not None else 0)
-        backtest_data["from_date"] = datetime.fromtimestamp(from_date, tz=UTC)
-
-        to_date = body.get("to_date", 0)
-        to_date = float(to_date if to_date is not None else 0)
-        backtest_data["to_date"] = datetime.fromtimestamp(to_date, tz=UTC)
-
+        backtest_data = payload.model_dump(exclude_unset=True)
         backtest_data["status"] = BacktestStatus.RUNNING.value
 
         try:
-            backtest_id = self._model.store(data=backtest_data)
+            backtest_id = await self._model.astore(data=backtest_data)
 
         except Exception as e:
             logger.error(f"Failed to create backtest: {e}")
@@ -93,14 +112,14 @@ class BacktestController(BaseController):
         )
 
     @extend_schema(**update_schema())
-    def put(self, request: Request, id: str) -> JsonResponse:
+    async def put(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
         data = getattr(request, "data", {})
         body = data if isinstance(data, dict) else {}
         backtest = None
 
-        validation_errors = self._is_update_data_valid(body)
-        if validation_errors:
+        payload, validation_errors = BacktestUpdateValidator.parse(body)
+        if validation_errors or payload is None:
             return self.response(
                 success=False,
                 message="Invalid request data",
@@ -108,18 +127,24 @@ class BacktestController(BaseController):
                 status=HttpStatus.BAD_REQUEST,
             )
 
+        to_update = payload.model_dump(exclude_unset=True, exclude_none=True)
+
         try:
-            backtest = self._model.find(
+            backtest = await self._model.afind_one_and_update(
                 query_filters={
                     "_id": ObjectId(id),
-                }
-            )[0]
+                    "status": {"$ne": BacktestStatus.DELETING.value},
+                },
+                data=to_update,
+                projection_fields={"status": 1},
+                return_previous=True,
+            )
         except Exception as e:
-            logger.error(f"Failed to find backtest: {e}")
+            logger.error(f"Failed to update backtest: {e}")
 
             return self.response(
                 success=False,
-                message="Failed to find backtest",
+                message="Failed to update backtest",
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
@@ -130,42 +155,18 @@ class BacktestController(BaseController):
                 status=HttpStatus.NOT_FOUND,
             )
 
-        to_update = {}
         previous_status = backtest.get("status")
-        new_status = body.get("status")
-
-        if "asset" in body:
-            to_update["asset"] = body.get("asset")
-
-        if "start_at" in body:
-            start_at = body.get("start_at")
-            start_at = float(start_at if start_at is not None else 0)
-            start_at = datetime.fromtimestamp(start_at, tz=UTC)
-            to_update["start_at"] = start_at
-
-        if "end_at" in body:
-            end_at = body.get("end_at")
-            end_at = float(end_at if end_at is not None else 0)
-            end_at = datetime.fromtimestamp(end_at, tz=UTC)
-            to_update["end_at"] = end_at
-
-        if "status" in body:
-            to_update["status"] = body.get("status")
-
-        try:
-            self._model.update(
-                query_filters={"_id": ObjectId(id)},
-                data=to_update,
-            )
-        except Exception as e:
-            logger.error(f"Failed to update backtest: {e}")
+        new_status = to_update.get("status")
 
         if (
             previous_status == BacktestStatus.RUNNING.value
             and new_status == BacktestStatus.COMPLETED.value
         ):
             try:
-                make_backtest_report.apply_async(
+                await sync_to_async(
+                    make_backtest_report.apply_async,
+                    thread_sensitive=False,
+                )(
                     args=[str(id)],
                     countdown=10,
                 )  # type: ignore
@@ -180,27 +181,21 @@ class BacktestController(BaseController):
         )
 
     @extend_schema(**delete_schema())
-    def delete(self, request: Request, id: str) -> JsonResponse:
+    async def delete(self, request: Request, id: str) -> HttpResponse:
         logger = logging.getLogger("django")
-        backtest = None
 
         try:
-            results = self._model.find(
-                query_filters={
-                    "_id": ObjectId(id),
-                }
-            )
-            backtest = results[0] if results else None
+            is_marked = await self._model.amark_deleting(id)
         except Exception as e:
-            logger.error(f"Failed to find backtest: {e}")
+            logger.error(f"Failed to delete backtest: {e}")
 
             return self.response(
                 success=False,
-                message="Failed to find backtest",
+                message="Failed to delete backtest",
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
-        if not backtest:
+        if not is_marked:
             return self.response(
                 success=False,
                 message="Backtest not found",
@@ -208,75 +203,15 @@ class BacktestController(BaseController):
             )
 
         try:
-            self._model.delete(
-                query_filters={
-                    "_id": ObjectId(id),
-                }
-            )
+            await sync_to_async(
+                purge_backtest.apply_async,
+                thread_sensitive=False,
+            )(args=[str(id)])  # type: ignore
         except Exception as e:
-            logger.error(f"Failed to delete backtest: {e}")
-
-            return self.response(
-                success=False,
-                message="Failed to delete backtest",
-                status=HttpStatus.INTERNAL_SERVER_ERROR,
-            )
+            logger.error(f"Failed to trigger purge_backtest task: {e}")
 
         return self.response(
             success=True,
             message="Backtest deleted successfully",
             status=HttpStatus.OK,
         )
-
-    # ───────────────────────────────────────────────────────────
-    # PRIVATE METHODS
-    # ───────────────────────────────────────────────────────────
-    def _is_post_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "asset": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "strategies": {
-                    "type": "string",
-                    "required": True,
-                    "minlength": 1,
-                },
-                "from_date": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-                "to_date": {
-                    "type": "integer",
-                    "required": True,
-                    "coerce": int,
-                },
-            }  # type: ignore
-        )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
-
-    def _is_update_data_valid(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "status": {  # type: ignore
-                    "type": "string",
-                    "required": False,
-                    "allowed": [s.value for s in BacktestStatus],
-                },
-            },
-            allow_unknown=True,
-        )
-
-        is_valid = validator.validate(body)  # type: ignore
-        if not is_valid:
-            return validator.errors  # type: ignore
-
-        return None
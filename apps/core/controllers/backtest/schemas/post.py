@@ -16,6 +16,9 @@ def post_schema() -> Any:
                 "strategies": serializers.CharField(),
                 "from_date": serializers.IntegerField(),
                 "to_date": serializers.IntegerField(),
+                "snapshot_coalesce_window": serializers.IntegerField(
+                    required=False, allow_null=True
+                ),
             },
         ),
         "responses": {
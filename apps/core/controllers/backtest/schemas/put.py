@@ -27,7 +27,9 @@ def update_schema() -> Any:
             name="BacktestUpdateRequest",
             fields={
                 "status": serializers.ChoiceField(
-                    choices=[s.value for s in BacktestStatus],
+                    choices=[
+                        s.value for s in BacktestStatus if s != BacktestStatus.DELETING
+                    ],
                     required=False,
                     default="{running}",
                 ),
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import Field
+
+from apps.core.validators.base import BaseValidator, Timestamp
+
+
+class BacktestPostValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    asset: str = Field(min_length=1)
+    strategies: str = Field(min_length=1)
+    from_date: Timestamp
+    to_date: Timestamp
+    snapshot_coalesce_window: Optional[int] = Field(default=None, ge=0)
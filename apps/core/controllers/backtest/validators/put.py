@@ -0,0 +1,29 @@
+from typing import Any, Optional
+
+from pydantic import ConfigDict, field_validator
+
+from apps.core.enums.backtest_status import BacktestStatus
+from apps.core.validators.base import BaseValidator, Timestamp
+
+
+class BacktestUpdateValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    model_config = ConfigDict(extra="ignore")
+
+    asset: Optional[str] = None
+    start_at: Optional[Timestamp] = None
+    end_at: Optional[Timestamp] = None
+    status: Optional[BacktestStatus] = None
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    @field_validator("status")
+    @classmethod
+    def _validate_status(cls, status: Any) -> Any:
+        if status == BacktestStatus.DELETING.value:
+            raise ValueError("status is managed by the delete endpoint")
+
+        return status
@@ -1,17 +1,56 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import base64
+import binascii
+import hashlib
+import inspect
+import logging
+import re
+from datetime import UTC, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
 
-from bson import ObjectId
-from cerberus import Validator
-from django.http import JsonResponse
+from bson import ObjectId, json_util
+from bson.errors import BSONError
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseBase,
+    StreamingHttpResponse,
+)
+from django.utils.http import http_date, parse_etags
+from pymongo.errors import BulkWriteError
 from rest_framework.request import Request
 from rest_framework.views import APIView
 
+from apps.core.enums.field_type import FieldType
+from apps.core.enums.filter_operator import FilterOperator
 from apps.core.enums.http_status import HttpStatus
 from apps.core.models.base import BaseModel
+from apps.core.renderers import get_renderer
+from apps.core.validators.base import BaseValidator
+from apps.core.validators.pagination import PaginationValidator
 
 
 class BaseController(APIView):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    MAX_BULK_ITEMS: int = 10000
+    FILTERABLE_FIELDS: ClassVar[Dict[str, FieldType]] = {}
+    SELECTABLE_FIELDS: ClassVar[List[str]] = []
+    STREAM_READS: ClassVar[bool] = False
+    CONDITIONAL_GET: ClassVar[bool] = False
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
@@ -20,65 +59,52 @@ class BaseController(APIView):
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
-    def get(self, request: Request) -> JsonResponse:
-        response = {}
-        query_params = request.query_params
+    async def dispatch(
+        self,
+        request: HttpRequest,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        self.args = args
+        self.kwargs = kwargs
+        drf_request = self.initialize_request(request, *args, **kwargs)
+        self.request = drf_request
+        self.headers = self.default_response_headers
 
-        page_param = query_params.get("page", "1")
-        page_size_param = query_params.get("page_size", "10")
-        sort_by_param = query_params.get("sort", "created_at")
-        sort_direction_param = query_params.get("sort_order", "desc")
-        filter_by_param = query_params.get("filter_by", None)
-
-        validation_errors = self._is_pagination_params_valid(
-            page_param,
-            page_size_param,
-            sort_by_param,
-            sort_direction_param,
-            filter_by_param,
-        )
-        if validation_errors:
-            return self.response(
-                success=False,
-                message="Invalid pagination parameters",
-                data={"errors": validation_errors},
-                status=HttpStatus.BAD_REQUEST,
-            )
+        try:
+            self.initial(drf_request, *args, **kwargs)
+            handler = self._get_handler(drf_request)
+            response = handler(drf_request, *args, **kwargs)
 
-        page = int(page_param)  # type: ignore
-        page_size = int(page_size_param)  # type: ignore
-        sort_by = str(sort_by_param)  # type: ignore
-        sort_direction = str(sort_direction_param)  # type: ignore
-        query_filters = None
+            if inspect.isawaitable(response):
+                response = await response
 
-        if filter_by_param:
-            parts = str(filter_by_param).split(":", 1)
-            column = parts[0].strip()
-            value = parts[1].strip()
-            query_filters = {column: {"$regex": value, "$options": "i"}}
+        except Exception as exc:
+            response = self.handle_exception(exc)
 
-        limit = int(page_size)
-        offset = (page - 1) * limit
+        return self.finalize_response(drf_request, response, *args, **kwargs)
 
-        try:
-            results = self._model.find(
-                limit=limit,
-                offset=offset,
-                sort_by=sort_by,
-                sort_direction=sort_direction,
-                query_filters=query_filters,
-            )
+    async def get(self, request: Request) -> HttpResponseBase:
+        params, validation_errors = self._parse_list_params(request)
+        if validation_errors or params is None:
+            return self._build_invalid_list_response(validation_errors)
 
-        except Exception as e:
-            return self.response(
-                success=False,
-                message=str(e),
-                status=HttpStatus.INTERNAL_SERVER_ERROR,
-            )
+        query_filters, validation_errors = self._parse_list_filters(params)
+        if validation_errors:
+            return self._build_invalid_list_response(validation_errors)
+
+        find_params, validation_errors = self._build_find_params(
+            params,
+            query_filters,
+        )
+        if validation_errors or find_params is None:
+            return self._build_invalid_list_response(validation_errors)
 
         try:
-            total = self._model.count(
-                query_filters=query_filters,
+            total, last_modified, etag = await self._get_list_validators(
+                request,
+                query_filters,
+                params.include_total_param == "true",
             )
         except Exception as e:
             return self.response(
@@ -87,20 +113,32 @@ class BaseController(APIView):
                 status=HttpStatus.INTERNAL_SERVER_ERROR,
             )
 
-        response["results"] = [self._serialize(doc) for doc in results]
-        response["pagination"] = {
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "total_pages": (total + page_size - 1) // page_size,
-        }
+        if etag and self._is_etag_matched(request, etag):
+            not_modified = HttpResponse(status=HttpStatus.NOT_MODIFIED.value)
+            self._set_validator_headers(not_modified, etag, last_modified)
+            return not_modified
 
-        return self.response(
-            success=True,
-            message="Data retrieved successfully",
-            data=response,
-            status=HttpStatus.OK,
+        pagination = self._build_pagination(
+            params.page_param,
+            params.page_size_param,
+            total if params.include_total_param == "true" else None,
+            bool(params.cursor_param),
         )
+        cursor_scope = self._build_cursor_scope(params, query_filters)
+
+        if self.STREAM_READS:
+            response = await self._render_streamed_list(
+                find_params,
+                pagination,
+                cursor_scope,
+            )
+        else:
+            response = await self._render_list(find_params, pagination, cursor_scope)
+
+        if etag and response.status_code == HttpStatus.OK.value:
+            self._set_validator_headers(response, etag, last_modified)
+
+        return response
 
     def response(
         self,
@@ -108,7 +146,7 @@ class BaseController(APIView):
         message: Optional[str] = None,
         data: Optional[Dict[str, Any]] = None,
         status: Optional[HttpStatus] = None,
-    ) -> JsonResponse:
+    ) -> HttpResponse:
         response_code = HttpStatus.OK.value if success else HttpStatus.BAD_REQUEST.value
         response: Dict[str, Any] = {
             "success": success,
@@ -120,86 +158,567 @@ class BaseController(APIView):
         if data is not None:
             response["data"] = data
 
-        return JsonResponse(
-            response,
+        renderer = get_renderer()
+
+        return HttpResponse(
+            renderer.render(response),
+            content_type=renderer.content_type,
             status=response_code if status is None else status.value,
         )
 
     # ───────────────────────────────────────────────────────────
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
-    def _is_pagination_params_valid(
-        self,
-        page_param: Union[str, List[str], None],
-        page_size_param: Union[str, List[str], None],
-        sort_by_param: Union[str, List[str], None],
-        sort_direction_param: Union[str, List[str], None],
-        filter_by_param: Union[str, List[str], None] = None,
-    ) -> Optional[Dict[str, Any]]:
-        validator = Validator(
-            {
-                "page_param": {
-                    "type": "integer",
-                    "coerce": int,
-                    "min": 1,
-                },
-                "page_size_param": {
-                    "type": "integer",
-                    "coerce": int,
-                    "min": 1,
-                    "max": 100,
-                },
-                "sort_by_param": {
-                    "type": "string",
-                    "minlength": 1,
-                },
-                "sort_direction_param": {
-                    "type": "string",
-                    "allowed": ["asc", "desc"],
-                },
-                "filter_by_param": {
-                    "type": "string",
-                    "regex": r"^[a-zA-Z_][a-zA-Z0-9_]*:.+$",
-                    "nullable": True,
-                },
-            }  # type: ignore
+    def _get_handler(self, request: Request) -> Callable[..., Any]:
+        method = str(request.method).lower()
+
+        if method not in self.http_method_names:
+            return self.http_method_not_allowed
+
+        return getattr(self, method, self.http_method_not_allowed)
+
+    async def _store_bulk(
+        self,
+        request: Request,
+        validator: Type[BaseValidator],
+        resource_name: str,
+    ) -> HttpResponse:
+        logger = logging.getLogger("django")
+        data = getattr(request, "data", None)
+        items = data if isinstance(data, list) else []
+
+        if not items or len(items) > self.MAX_BULK_ITEMS:
+            return self.response(
+                success=False,
+                message=(
+                    f"Request body must be a JSON array or NDJSON stream of "
+                    f"1 to {self.MAX_BULK_ITEMS} {resource_name}"
+                ),
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        results: List[Dict[str, Any]] = []
+        documents: List[Dict[str, Any]] = []
+
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(
+                    {
+                        "index": index,
+                        "success": False,
+                        "errors": {"item": ["must be of dict type"]},
+                    }
+                )
+                continue
+
+            payload, validation_errors = validator.parse(item)
+            if validation_errors or payload is None:
+                results.append(
+                    {
+                        "index": index,
+                        "success": False,
+                        "errors": validation_errors,
+                    }
+                )
+                continue
+
+            document = payload.model_dump(exclude_unset=True)
+            document["_id"] = ObjectId()
+            documents.append(document)
+            results.append({"index": index, "success": True})
+
+        write_errors: Dict[int, str] = {}
+
+        if documents:
+            try:
+                await self._model.astore_many(data=documents, ordered=False)
+
+            except BulkWriteError as e:
+                write_errors = {
+                    error["index"]: error.get("errmsg", "Write failed")
+                    for error in e.details.get("writeErrors", [])
+                }
+
+            except Exception as e:
+                logger.error(f"Failed to store {resource_name}: {e}")
+
+                return self.response(
+                    success=False,
+                    message=f"Failed to store {resource_name}",
+                    status=HttpStatus.INTERNAL_SERVER_ERROR,
+                )
+
+        stored_results = [result for result in results if result["success"]]
+
+        for document_index, result in enumerate(stored_results):
+            result["_id"] = str(documents[document_index]["_id"])
+
+            if document_index in write_errors:
+                result.pop("_id")
+                result["success"] = False
+                result["errors"] = {"write": [write_errors[document_index]]}
+
+        inserted = sum(1 for result in results if result["success"])
+        failed = len(results) - inserted
+        status = HttpStatus.CREATED
+
+        if failed and inserted:
+            status = HttpStatus.MULTI_STATUS
+        elif failed:
+            status = HttpStatus.BAD_REQUEST
+
+        return self.response(
+            success=inserted > 0,
+            message=f"Stored {inserted} of {len(results)} {resource_name}",
+            data={
+                "inserted": inserted,
+                "failed": failed,
+                "results": results,
+            },
+            status=status,
         )
 
-        is_valid = validator.validate(  # type: ignore
+    def _parse_list_params(
+        self,
+        request: Request,
+    ) -> Tuple[Optional[PaginationValidator], Optional[Dict[str, List[str]]]]:
+        query_params = request.query_params
+
+        return PaginationValidator.parse(
             {
-                "page_param": page_param,
-                "page_size_param": page_size_param,
-                "sort_by_param": sort_by_param,
-                "sort_direction_param": sort_direction_param,
-                "filter_by_param": filter_by_param,
+                "page_param": query_params.get("page", "1"),
+                "page_size_param": query_params.get("page_size", "10"),
+                "sort_by_param": query_params.get("sort", "created_at"),
+                "sort_direction_param": query_params.get("sort_order", "desc"),
+                "filter_by_param": query_params.getlist("filter_by"),
+                "cursor_param": query_params.get("cursor", None),
+                "include_total_param": query_params.get("include_total", "true"),
+                "fields_param": query_params.get("fields", None),
             }
         )
 
-        if not is_valid:
-            return validator.errors  # type: ignore
+    def _parse_list_filters(
+        self,
+        params: PaginationValidator,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, List[str]]]]:
+        if not params.filter_by_param:
+            return None, None
+
+        try:
+            return self._build_query_filters(params.filter_by_param), None
+        except ValueError as e:
+            return None, {"filter_by_param": [str(e)]}
+
+    def _build_find_params(
+        self,
+        params: PaginationValidator,
+        query_filters: Optional[Dict[str, Any]],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, List[str]]]]:
+        projection_fields = None
+        offset = (params.page_param - 1) * params.page_size_param
+        find_filters = query_filters
+
+        if params.fields_param:
+            try:
+                projection_fields = self._build_projection(
+                    params.fields_param,
+                    params.sort_by_param,
+                )
+            except ValueError as e:
+                return None, {"fields_param": [str(e)]}
 
-        return None
+        if params.cursor_param:
+            try:
+                seek_filters = self._build_seek_filters(
+                    params.cursor_param,
+                    self._build_cursor_scope(params, query_filters),
+                    params.sort_by_param,
+                    params.sort_direction_param,
+                )
+            except ValueError as e:
+                return None, {"cursor_param": [str(e)]}
 
-    def _serialize(self, document: Dict[str, Any]) -> Dict[str, Any]:
-        serialized = {}
+            offset = 0
+            find_filters = (
+                {"$and": [query_filters, seek_filters]}
+                if query_filters
+                else seek_filters
+            )
 
-        for key, value in document.items():
-            if isinstance(value, ObjectId):
-                serialized[key] = str(value)
+        return {
+            "limit": params.page_size_param,
+            "offset": offset,
+            "sort_by": params.sort_by_param,
+            "sort_direction": params.sort_direction_param,
+            "query_filters": find_filters,
+            "projection_fields": projection_fields,
+        }, None
 
-            elif isinstance(value, datetime):
-                serialized[key] = value.isoformat()
+    async def _get_list_validators(
+        self,
+        request: Request,
+        query_filters: Optional[Dict[str, Any]],
+        include_total: bool,
+    ) -> Tuple[Optional[int], Optional[datetime], Optional[str]]:
+        if not self.CONDITIONAL_GET:
+            total = await self._count(query_filters) if include_total else None
+            return total, None, None
+
+        version = await self._model.aget_version(query_filters=query_filters)
+        last_modified = self._get_last_modified(version)
+        etag = self._build_etag(request, version)
+
+        return version["count"], last_modified, etag
+
+    async def _render_list(
+        self,
+        find_params: Dict[str, Any],
+        pagination: Dict[str, Any],
+        cursor_scope: List[str],
+    ) -> HttpResponse:
+        limit = find_params["limit"]
+
+        try:
+            results = await self._model.afind(**{**find_params, "limit": limit + 1})
+        except Exception as e:
+            return self.response(
+                success=False,
+                message=str(e),
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        has_more = len(results) > limit
+        results = results[:limit]
+        pagination["next_cursor"] = (
+            self._encode_cursor(results[-1], find_params["sort_by"], cursor_scope)
+            if has_more and results
+            else None
+        )
+
+        return self.response(
+            success=True,
+            message="Data retrieved successfully",
+            data={
+                "results": results,
+                "pagination": pagination,
+            },
+            status=HttpStatus.OK,
+        )
+
+    async def _render_streamed_list(
+        self,
+        find_params: Dict[str, Any],
+        pagination: Dict[str, Any],
+        cursor_scope: List[str],
+    ) -> HttpResponseBase:
+        limit = find_params["limit"]
+        documents = self._model.astream(**{**find_params, "limit": limit + 1})
 
-            elif isinstance(value, dict):
-                serialized[key] = self._serialize(value)
+        try:
+            first_document = await anext(documents, None)
+        except Exception as e:
+            return self.response(
+                success=False,
+                message=str(e),
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        return StreamingHttpResponse(
+            self._render_streamed_page(
+                first_document,
+                documents,
+                find_params,
+                pagination,
+                cursor_scope,
+            ),
+            content_type=get_renderer().content_type,
+        )
+
+    def _build_invalid_list_response(
+        self,
+        validation_errors: Optional[Dict[str, List[str]]],
+    ) -> HttpResponse:
+        return self.response(
+            success=False,
+            message="Invalid pagination parameters",
+            data={"errors": validation_errors},
+            status=HttpStatus.BAD_REQUEST,
+        )
+
+    def _build_query_filters(self, filter_by: List[str]) -> Dict[str, Any]:
+        clauses = [self._build_filter_clause(expression) for expression in filter_by]
+
+        if len(clauses) == 1:
+            return clauses[0]
+
+        return {"$and": clauses}
+
+    def _build_filter_clause(self, expression: str) -> Dict[str, Any]:
+        field, operator, raw_value = self._parse_filter_expression(expression)
+        field_type = self.FILTERABLE_FIELDS.get(field)
+
+        if field_type is None:
+            raise ValueError(f"field '{field}' is not filterable")
+
+        if operator == FilterOperator.PREFIX:
+            if field_type != FieldType.STRING:
+                raise ValueError(f"prefix is not supported on '{field}'")
+
+            return {field: {"$regex": f"^{re.escape(raw_value)}"}}
+
+        if operator == FilterOperator.IN:
+            values = [
+                self._parse_filter_value(value, field_type)
+                for value in raw_value.split(",")
+            ]
+            return {field: {"$in": values}}
+
+        value = self._parse_filter_value(raw_value, field_type)
+
+        if operator == FilterOperator.EQ:
+            return {field: value}
+
+        if field_type not in {FieldType.NUMBER, FieldType.DATETIME}:
+            raise ValueError(f"{operator.value} is not supported on '{field}'")
+
+        return {field: {f"${operator.value}": value}}
+
+    def _build_projection(self, fields: str, sort_by: str) -> Dict[str, int]:
+        selected = fields.split(",")
+        unknown = [field for field in selected if field not in self.SELECTABLE_FIELDS]
+
+        if unknown:
+            raise ValueError(f"fields not selectable: {', '.join(unknown)}")
+
+        projection = dict.fromkeys(selected, 1)
+        projection[sort_by] = 1
+        projection["_id"] = 1
+
+        return projection
+
+    async def _render_streamed_page(
+        self,
+        first_document: Optional[Dict[str, Any]],
+        documents: AsyncIterator[Dict[str, Any]],
+        find_params: Dict[str, Any],
+        pagination: Dict[str, Any],
+        cursor_scope: List[str],
+    ) -> AsyncIterator[bytes]:
+        logger = logging.getLogger("django")
+        renderer = get_renderer()
+        limit = find_params["limit"]
+        last_document = None
+        has_more = False
+        rendered = 0
+
+        yield b'{"success":true,"message":"Data retrieved successfully",'
+        yield b'"data":{"results":['
+
+        document = first_document
+
+        try:
+            while document is not None:
+                if rendered == limit:
+                    has_more = True
+                else:
+                    yield (b"," if rendered else b"") + renderer.render(document)
+                    last_document = document
+                    rendered += 1
+
+                document = await anext(documents, None)
+
+        except Exception as e:
+            logger.error(f"Failed to stream results: {e}")
+            raise
+
+        pagination["next_cursor"] = (
+            self._encode_cursor(last_document, find_params["sort_by"], cursor_scope)
+            if has_more and last_document is not None
+            else None
+        )
+
+        yield b'],"pagination":' + renderer.render(pagination) + b"}}"
+
+    async def _count(self, query_filters: Optional[Dict[str, Any]]) -> int:
+        if not query_filters:
+            return await self._model.aestimated_count()
+
+        return await self._model.acount(
+            query_filters=query_filters,
+            cache_ttl=settings.LIST_TOTAL_CACHE_TTL,
+        )
+
+    def _build_seek_filters(
+        self,
+        cursor: str,
+        cursor_scope: List[str],
+        sort_by: str,
+        sort_direction: str,
+    ) -> Dict[str, Any]:
+        value, last_id = self._decode_cursor(cursor, cursor_scope)
+        operator = "$lt" if sort_direction == "desc" else "$gt"
+
+        if sort_by == "_id":
+            return {"_id": {operator: last_id}}
+
+        if value is None:
+            ties = {sort_by: None, "_id": {operator: last_id}}
+
+            if sort_direction == "desc":
+                return ties
+
+            return {"$or": [ties, {sort_by: {"$ne": None}}]}
+
+        seek = [
+            {sort_by: {operator: value}},
+            {sort_by: value, "_id": {operator: last_id}},
+        ]
+
+        if sort_direction == "desc":
+            seek.append({sort_by: None})
+
+        return {"$or": seek}
+
+    # Helpers
+    def _build_pagination(
+        self,
+        page: int,
+        page_size: int,
+        total: Optional[int],
+        is_cursor: bool,
+    ) -> Dict[str, Any]:
+        pagination: Dict[str, Any] = {
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "total_pages": (
+                (total + page_size - 1) // page_size if total is not None else None
+            ),
+            "next_cursor": None,
+        }
+
+        if is_cursor:
+            pagination.pop("page")
+            pagination.pop("total_pages")
+
+        return pagination
+
+    def _build_etag(self, request: Request, version: Dict[str, Any]) -> str:
+        query = sorted(request.query_params.lists())
+        payload = json_util.dumps(
+            [
+                query,
+                version["generation"],
+                version["count"],
+                version["last_modified"],
+            ]
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f'W/"{digest[:32]}"'
+
+    def _get_last_modified(self, version: Dict[str, Any]) -> Optional[datetime]:
+        updated_at = version["last_modified"]
+
+        if not isinstance(updated_at, datetime):
+            return None
+
+        return updated_at if updated_at.tzinfo else updated_at.replace(tzinfo=UTC)
+
+    def _is_etag_matched(self, request: Request, etag: str) -> bool:
+        if_none_match = request.headers.get("If-None-Match")
+
+        if not if_none_match:
+            return False
+
+        etags = [item.removeprefix("W/") for item in parse_etags(if_none_match)]
+        return "*" in etags or etag.removeprefix("W/") in etags
+
+    def _set_validator_headers(
+        self,
+        response: HttpResponseBase,
+        etag: str,
+        last_modified: Optional[datetime],
+    ) -> None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
+
+        if last_modified:
+            response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+
+    def _parse_filter_expression(
+        self,
+        expression: str,
+    ) -> Tuple[str, FilterOperator, str]:
+        field, _, rest = expression.partition(":")
+        operator, separator, value = rest.partition(":")
+        operators = {item.value: item for item in FilterOperator}
+
+        if separator and operator in operators:
+            return field, operators[operator], value
+
+        return field, FilterOperator.EQ, rest
+
+    def _parse_filter_value(self, value: str, field_type: FieldType) -> Any:
+        try:
+            if field_type == FieldType.NUMBER:
+                return float(value)
+
+            if field_type == FieldType.DATETIME:
+                return self._parse_filter_datetime(value)
+
+            if field_type == FieldType.BOOLEAN:
+                return {"true": True, "false": False}[value.lower()]
+
+            if field_type == FieldType.OBJECT_ID:
+                return ObjectId(value)
+
+        except (BSONError, KeyError, OverflowError, OSError, ValueError) as e:
+            raise ValueError(f"invalid {field_type.value} value '{value}'") from e
+
+        return value
+
+    def _parse_filter_datetime(self, value: str) -> datetime:
+        try:
+            return datetime.fromtimestamp(float(value), tz=UTC)
+        except ValueError:
+            parsed = datetime.fromisoformat(value)
+
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+    def _build_cursor_scope(
+        self,
+        params: PaginationValidator,
+        query_filters: Optional[Dict[str, Any]],
+    ) -> List[str]:
+        payload = json_util.dumps(query_filters or {}, sort_keys=True)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return [params.sort_by_param, params.sort_direction_param, digest[:16]]
+
+    def _encode_cursor(
+        self,
+        document: Mapping[str, Any],
+        sort_by: str,
+        cursor_scope: List[str],
+    ) -> str:
+        payload = json_util.dumps(
+            [*cursor_scope, document.get(sort_by), document.get("_id")]
+        )
+        token = base64.urlsafe_b64encode(payload.encode("utf-8"))
+        return token.decode("ascii").rstrip("=")
+
+    def _decode_cursor(self, cursor: str, cursor_scope: List[str]) -> List[Any]:
+        padding = "=" * (-len(cursor) % 4)
+
+        try:
+            payload = base64.urlsafe_b64decode(cursor + padding).decode("utf-8")
+            decoded = json_util.loads(payload)
+        except (binascii.Error, BSONError, TypeError, ValueError) as e:
+            raise ValueError("invalid cursor") from e
 
-            elif isinstance(value, list):
-                serialized[key] = [
-                    self._serialize(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
+        if not isinstance(decoded, list) or len(decoded) != len(cursor_scope) + 2:
+            raise ValueError("invalid cursor")
 
-            else:
-                serialized[key] = value
+        if decoded[: len(cursor_scope)] != cursor_scope:
+            raise ValueError("cursor does not match the sort and filters")
 
-        return serialized
+        return decoded[len(cursor_scope) :]
@@ -0,0 +1,48 @@
+from typing import Any, ClassVar, List, Type
+
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.services.cache import CacheService
+from apps.core.services.mongodb import MongoDBService
+
+from .schemas.get import get_schema
+
+
+class HealthController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._db_service = MongoDBService()
+        self._cache_service = CacheService()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**get_schema())
+    async def get(self, request: Request) -> HttpResponse:
+        return self.response(
+            success=True,
+            message="Health retrieved successfully",
+            data={
+                "mongodb": {
+                    "pool": self._db_service.get_pool_stats(),
+                },
+                "cache": self._cache_service.get_stats(),
+            },
+            status=HttpStatus.OK,
+        )
@@ -0,0 +1,32 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.schemas.responses import response_200_schema
+
+
+def get_schema() -> Any:
+    return {
+        "tags": ["Health"],
+        "summary": "Get service health",
+        "description": (
+            "Provides runtime statistics of the worker process serving the "
+            "request, such as the MongoDB connection pool usage and read cache "
+            "hit/miss counters."
+        ),
+        "responses": {
+            **response_200_schema(
+                "HealthController",
+                {
+                    "data": inline_serializer(
+                        name="Health",
+                        fields={
+                            "mongodb": serializers.DictField(),
+                            "cache": serializers.DictField(),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
@@ -0,0 +1,39 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.controllers.orders.schemas.post import order_request_schema
+
+
+def post_schema() -> Any:
+    return {
+        "tags": ["Order"],
+        "summary": "Create orders in bulk",
+        "description": (
+            "Creates many order records in a single request. The body is a JSON "
+            "array or an NDJSON stream (application/x-ndjson) of orders. Items are "
+            "validated independently and written with one unordered insert, so "
+            "invalid items are reported without rejecting the rest."
+        ),
+        "request": order_request_schema(many=True),
+        "responses": {
+            201: inline_serializer(
+                name="OrderBulkResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                    "data": inline_serializer(
+                        name="OrderBulkData",
+                        fields={
+                            "inserted": serializers.IntegerField(),
+                            "failed": serializers.IntegerField(),
+                            "results": serializers.ListField(
+                                child=serializers.DictField(),
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
@@ -0,0 +1,61 @@
+import logging
+
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.request import Request
+
+from apps.core.controllers.orders import OrderController
+from apps.core.enums.http_status import HttpStatus
+from apps.core.models.order import OrderModel
+from apps.core.validators.order_statistics import OrderStatisticsQuery
+
+from .schemas.get import get_schema
+
+
+class OrderStatisticsController(OrderController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _model: OrderModel
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**get_schema())
+    async def get(self, request: Request) -> HttpResponse:
+        logger = logging.getLogger("django")
+        query_params = request.query_params
+        params = {
+            "backtest_id": query_params.get("backtest_id"),
+            "backtest": query_params.get("backtest", "true"),
+        }
+
+        if "group_by" in query_params:
+            params["group_by"] = query_params.getlist("group_by")
+
+        query, validation_errors = OrderStatisticsQuery.parse(params)
+        if validation_errors or query is None:
+            return self.response(
+                success=False,
+                message="Invalid statistics parameters",
+                data={"errors": validation_errors},
+                status=HttpStatus.BAD_REQUEST,
+            )
+
+        try:
+            statistics = await self._model.aget_statistics(query=query)
+        except Exception as e:
+            logger.error(f"Failed to get order statistics: {e}")
+
+            return self.response(
+                success=False,
+                message="Failed to get order statistics",
+                status=HttpStatus.INTERNAL_SERVER_ERROR,
+            )
+
+        return self.response(
+            success=True,
+            message="Order statistics retrieved successfully",
+            data=statistics,
+            status=HttpStatus.OK,
+        )
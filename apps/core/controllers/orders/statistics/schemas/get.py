@@ -0,0 +1,61 @@
+from typing import Any
+
+from drf_spectacular.utils import OpenApiParameter, inline_serializer
+from rest_framework import serializers
+
+from apps.core.enums.order_statistics_group import OrderStatisticsGroup
+from apps.core.schemas.responses import response_200_schema
+
+
+def get_schema() -> Any:
+    return {
+        "tags": ["Order"],
+        "summary": "Get order statistics",
+        "description": (
+            "Provides the win rate, gross profit and loss, profit factor, "
+            "average profit percentage and volume of the orders of a backtest, "
+            "overall and grouped by symbol, side or strategy."
+        ),
+        "parameters": [
+            OpenApiParameter(
+                name="backtest_id",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Backtest to compute the statistics for",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="backtest",
+                type=bool,
+                location=OpenApiParameter.QUERY,
+                description="Whether to use backtest or live orders",
+                default=True,
+            ),
+            OpenApiParameter(
+                name="group_by",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description="Field to group the statistics by (repeatable)",
+                enum=[group.value for group in OrderStatisticsGroup],
+                many=True,
+            ),
+        ],
+        "responses": {
+            **response_200_schema(
+                "OrderStatisticsController",
+                {
+                    "data": inline_serializer(
+                        name="OrderStatistics",
+                        fields={
+                            "summary": serializers.DictField(allow_null=True),
+                            "groups": serializers.DictField(
+                                child=serializers.ListField(
+                                    child=serializers.DictField(),
+                                ),
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
@@ -0,0 +1,31 @@
+from typing import Literal, Optional
+
+from pydantic import Field, StrictBool
+
+from apps.core.validators.base import BaseValidator, Timestamp
+
+
+class OrderPostValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    backtest: StrictBool
+    backtest_id: Optional[str] = None
+    strategy_id: str = Field(min_length=1)
+    symbol: str = Field(min_length=1)
+    gateway: str = Field(min_length=1)
+    side: Literal["buy", "sell"]
+    order_type: str = Field(min_length=1)
+    status: str = Field(min_length=1)
+    volume: float
+    executed_volume: float
+    price: float
+    close_price: Optional[float] = None
+    take_profit_price: Optional[float] = None
+    stop_loss_price: Optional[float] = None
+    client_order_id: Optional[str] = None
+    filled: StrictBool
+    profit: Optional[float] = None
+    profit_percentage: Optional[float] = None
+    created_at: Timestamp
+    updated_at: Timestamp
@@ -0,0 +1,33 @@
+from typing import Literal, Optional
+
+from pydantic import ConfigDict, Field, StrictBool
+
+from apps.core.validators.base import BaseValidator, Timestamp
+
+
+class OrderUpdateValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    model_config = ConfigDict(extra="ignore")
+
+    backtest: Optional[StrictBool] = None
+    strategy_id: Optional[str] = Field(default=None, min_length=1)
+    symbol: Optional[str] = Field(default=None, min_length=1)
+    gateway: Optional[str] = Field(default=None, min_length=1)
+    side: Optional[Literal["buy", "sell"]] = None
+    order_type: Optional[str] = Field(default=None, min_length=1)
+    status: Optional[str] = Field(default=None, min_length=1)
+    volume: Optional[float] = None
+    executed_volume: Optional[float] = None
+    price: Optional[float] = None
+    filled: Optional[StrictBool] = None
+    created_at: Optional[Timestamp] = None
+    updated_at: Optional[Timestamp] = None
+    backtest_id: Optional[str] = None
+    close_price: Optional[float] = None
+    take_profit_price: Optional[float] = None
+    stop_loss_price: Optional[float] = None
+    client_order_id: Optional[str] = None
+    profit: Optional[float] = None
+    profit_percentage: Optional[float] = None
@@ -1,18 +1,43 @@
-from typing import Any, ClassVar, List, Type
+from typing import Any, ClassVar, Dict, List, Type
 
-from django.http import JsonResponse
+from django.http import HttpResponseBase
 from drf_spectacular.utils import extend_schema
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.request import Request
 
 from apps.core.authentication import APIKeyAuthentication
 from apps.core.controllers.base import BaseController
+from apps.core.enums.field_type import FieldType
 from apps.core.models.report import ReportModel
 
 from .schemas.get import get_schema
 
 
 class ReportController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FILTERABLE_FIELDS: ClassVar[Dict[str, FieldType]] = {
+        "_id": FieldType.OBJECT_ID,
+        "backtest_id": FieldType.STRING,
+        "status": FieldType.STRING,
+        "created_at": FieldType.DATETIME,
+        "updated_at": FieldType.DATETIME,
+    }
+    SELECTABLE_FIELDS: ClassVar[List[str]] = [
+        "backtest_id",
+        "status",
+        "folder",
+        "artifacts",
+        "metrics",
+        "statistics",
+        "timings",
+        "error",
+        "created_at",
+        "updated_at",
+    ]
+    CONDITIONAL_GET: ClassVar[bool] = True
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
@@ -31,5 +56,5 @@ class ReportController(BaseController):
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     @extend_schema(**get_schema())
-    def get(self, request: Request) -> JsonResponse:
-        return super().get(request)
+    async def get(self, request: Request) -> HttpResponseBase:
+        return await super().get(request)
@@ -0,0 +1,33 @@
+from typing import ClassVar, List, Type
+
+from django.http import HttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.request import Request
+
+from apps.core.controllers.snapshot import SnapshotController
+from apps.core.controllers.snapshot.validators.post import SnapshotPostValidator
+from apps.core.parsers import NDJSONParser
+
+from .schemas.post import post_schema
+
+
+class SnapshotBulkController(SnapshotController):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    parser_classes: ClassVar[List[Type[BaseParser]]] = [
+        JSONParser,
+        NDJSONParser,
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**post_schema())
+    async def post(self, request: Request) -> HttpResponse:
+        return await self._store_bulk(
+            request=request,
+            validator=SnapshotPostValidator,
+            resource_name="snapshots",
+        )
@@ -0,0 +1,41 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.controllers.snapshot.schemas.post import snapshot_request_schema
+
+
+def post_schema() -> Any:
+    return {
+        "tags": ["Snapshot"],
+        "summary": "Create snapshots in bulk",
+        "description": (
+            "Creates many snapshot records in a single request. The body is a JSON "
+            "array or an NDJSON stream (application/x-ndjson) of snapshots. Items are "
+            "validated independently and written with one unordered bulk write, so "
+            "invalid items are reported without rejecting the rest. Snapshots are "
+            "coalesced by the backtest's snapshot_coalesce_window like single "
+            "snapshots, and coalesced items return the id of their window."
+        ),
+        "request": snapshot_request_schema(many=True),
+        "responses": {
+            201: inline_serializer(
+                name="SnapshotBulkResponse",
+                fields={
+                    "success": serializers.BooleanField(),
+                    "message": serializers.CharField(),
+                    "data": inline_serializer(
+                        name="SnapshotBulkData",
+                        fields={
+                            "inserted": serializers.IntegerField(),
+                            "failed": serializers.IntegerField(),
+                            "results": serializers.ListField(
+                                child=serializers.DictField(),
+                            ),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
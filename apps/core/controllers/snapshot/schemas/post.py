@@ -8,30 +8,13 @@ def post_schema() -> Any:
     return {
         "tags": ["Snapshot"],
         "summary": "Create a snapshot",
-        "description": "Creates a new snapshot record in the database.",
-        "request": inline_serializer(
-            name="SnapshotRequest",
-            fields={
-                "backtest": serializers.BooleanField(),
-                "backtest_id": serializers.CharField(),
-                "strategy_id": serializers.CharField(),
-                "event": serializers.CharField(required=False),
-                "nav": serializers.FloatField(required=False),
-                "allocation": serializers.FloatField(required=False),
-                "nav_peak": serializers.FloatField(required=False),
-                "r2": serializers.FloatField(required=False),
-                "cagr": serializers.FloatField(required=False),
-                "calmar_ratio": serializers.FloatField(required=False),
-                "expected_shortfall": serializers.FloatField(required=False),
-                "max_drawdown": serializers.FloatField(required=False),
-                "profit_factor": serializers.FloatField(required=False),
-                "recovery_factor": serializers.FloatField(required=False),
-                "sharpe_ratio": serializers.FloatField(required=False),
-                "sortino_ratio": serializers.FloatField(required=False),
-                "ulcer_index": serializers.FloatField(required=False),
-                "created_at": serializers.IntegerField(required=False),
-            },
+        "description": (
+            "Creates a new snapshot record in the database. When the backtest has "
+            "a snapshot_coalesce_window, snapshots without a significant event "
+            "are kept once per strategy and window, and the snapshot with the "
+            "latest created_at wins."
         ),
+        "request": snapshot_request_schema(),
         "responses": {
             201: inline_serializer(
                 name="SnapshotResponse",
@@ -48,3 +31,30 @@ def post_schema() -> Any:
             ),
         },
     }
+
+
+def snapshot_request_schema(many: bool = False) -> Any:
+    return inline_serializer(
+        name="SnapshotRequest",
+        fields={
+            "backtest": serializers.BooleanField(),
+            "backtest_id": serializers.CharField(),
+            "strategy_id": serializers.CharField(),
+            "event": serializers.CharField(required=False),
+            "nav": serializers.FloatField(required=False),
+            "allocation": serializers.FloatField(required=False),
+            "nav_peak": serializers.FloatField(required=False),
+            "r2": serializers.FloatField(required=False),
+            "cagr": serializers.FloatField(required=False),
+            "calmar_ratio": serializers.FloatField(required=False),
+            "expected_shortfall": serializers.FloatField(required=False),
+            "max_drawdown": serializers.FloatField(required=False),
+            "profit_factor": serializers.FloatField(required=False),
+            "recovery_factor": serializers.FloatField(required=False),
+            "sharpe_ratio": serializers.FloatField(required=False),
+            "sortino_ratio": serializers.FloatField(required=False),
+            "ulcer_index": serializers.FloatField(required=False),
+            "created_at": serializers.IntegerField(required=False),
+        },
+        many=many,
+    )
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pydantic import Field
+
+from apps.core.validators.base import BaseValidator, Timestamp
+
+
+class SnapshotPostValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    backtest_id: str = Field(min_length=1)
+    backtest: bool
+    strategy_id: str = Field(min_length=1)
+    event: Optional[str] = None
+    nav: Optional[float] = Field(default=None, ge=0)
+    allocation: Optional[float] = Field(default=None, ge=0)
+    nav_peak: Optional[float] = Field(default=None, ge=0)
+    r2: Optional[float] = Field(default=None, ge=0, le=1)
+    cagr: Optional[float] = None
+    calmar_ratio: Optional[float] = None
+    expected_shortfall: Optional[float] = None
+    max_drawdown: Optional[float] = Field(default=None, le=0)
+    profit_factor: Optional[float] = Field(default=None, ge=0)
+    recovery_factor: Optional[float] = None
+    sharpe_ratio: Optional[float] = None
+    sortino_ratio: Optional[float] = None
+    ulcer_index: Optional[float] = Field(default=None, ge=0)
+    created_at: Optional[Timestamp] = None
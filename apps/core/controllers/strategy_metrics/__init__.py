@@ -0,0 +1,71 @@
+from typing import Any, ClassVar, Dict, List, Type
+
+from django.http import HttpResponseBase
+from drf_spectacular.utils import extend_schema
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+from apps.core.authentication import APIKeyAuthentication
+from apps.core.controllers.base import BaseController
+from apps.core.enums.field_type import FieldType
+from apps.core.models.strategy_metrics import StrategyMetricsModel
+
+from .schemas.get import get_schema
+
+
+class StrategyMetricsController(BaseController):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    FILTERABLE_FIELDS: ClassVar[Dict[str, FieldType]] = {
+        "_id": FieldType.OBJECT_ID,
+        "backtest_id": FieldType.STRING,
+        "strategy_id": FieldType.STRING,
+        "nav": FieldType.NUMBER,
+        "max_drawdown": FieldType.NUMBER,
+        "sharpe_ratio": FieldType.NUMBER,
+        "sortino_ratio": FieldType.NUMBER,
+        "stale": FieldType.BOOLEAN,
+        "created_at": FieldType.DATETIME,
+        "updated_at": FieldType.DATETIME,
+    }
+    SELECTABLE_FIELDS: ClassVar[List[str]] = [
+        "backtest_id",
+        "strategy_id",
+        "count",
+        "returns_count",
+        "first_at",
+        "last_at",
+        "nav",
+        "nav_peak",
+        "drawdown",
+        "max_drawdown",
+        "volatility",
+        "downside_deviation",
+        "sharpe_ratio",
+        "sortino_ratio",
+        "stale",
+        "created_at",
+        "updated_at",
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    authentication_classes: ClassVar[List[Type[BaseAuthentication]]] = [
+        APIKeyAuthentication
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._model = StrategyMetricsModel()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @extend_schema(**get_schema())
+    async def get(self, request: Request) -> HttpResponseBase:
+        return await super().get(request)
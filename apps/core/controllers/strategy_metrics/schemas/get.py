@@ -0,0 +1,45 @@
+from typing import Any
+
+from drf_spectacular.utils import inline_serializer
+from rest_framework import serializers
+
+from apps.core.schemas.pagination import pagination_schema
+from apps.core.schemas.responses import response_200_schema
+
+
+def get_schema() -> Any:
+    return {
+        "tags": ["Strategy Metrics"],
+        "summary": "Get strategy metrics",
+        "description": (
+            "Provides the running metrics of every strategy, updated on each "
+            "snapshot ingest, and also allows to filter the results by various "
+            "parameters. Documents flagged as stale missed an update and should "
+            "be rebuilt with `manage.py rebuild_strategy_metrics`."
+        ),
+        "parameters": [
+            *pagination_schema(),
+        ],
+        "responses": {
+            **response_200_schema(
+                "StrategyMetricsController",
+                {
+                    "data": inline_serializer(
+                        name="StrategyMetrics",
+                        fields={
+                            "id": serializers.CharField(),
+                            "backtest_id": serializers.CharField(),
+                            "strategy_id": serializers.CharField(),
+                            "nav": serializers.FloatField(),
+                            "max_drawdown": serializers.FloatField(),
+                            "sharpe_ratio": serializers.FloatField(),
+                            "sortino_ratio": serializers.FloatField(),
+                            "stale": serializers.BooleanField(required=False),
+                            "created_at": serializers.DateTimeField(),
+                            "updated_at": serializers.DateTimeField(),
+                        },
+                    ),
+                },
+            ),
+        },
+    }
@@ -6,3 +6,4 @@ class BacktestStatus(Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    DELETING = "deleting"
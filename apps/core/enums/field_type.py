@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class FieldType(Enum):
+    STRING = "string"
+    NUMBER = "number"
+    DATETIME = "datetime"
+    BOOLEAN = "boolean"
+    OBJECT_ID = "object_id"
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class FilterOperator(Enum):
+    EQ = "eq"
+    IN = "in"
+    GT = "gt"
+    GTE = "gte"
+    LT = "lt"
+    LTE = "lte"
+    PREFIX = "prefix"
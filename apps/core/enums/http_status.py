@@ -5,6 +5,8 @@ class HttpStatus(Enum):
     OK = 200
     CREATED = 201
     NO_CONTENT = 204
+    MULTI_STATUS = 207
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
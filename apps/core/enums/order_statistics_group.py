@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class OrderStatisticsGroup(Enum):
+    SYMBOL = "symbol"
+    SIDE = "side"
+    STRATEGY_ID = "strategy_id"
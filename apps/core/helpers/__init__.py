@@ -2,6 +2,7 @@ from .get_cagr_from import get_cagr_from
 from .get_calmar_ratio_from import get_calmar_ratio_from
 from .get_cvar_from import get_cvar_from
 from .get_max_drawdown_from import get_max_drawdown_from
+from .get_metrics_from import get_metrics_from
 from .get_profit_factor_from import get_profit_factor_from
 from .get_r2_from import get_r2_from
 from .get_recovery_factor_from import get_recovery_factor_from
@@ -15,6 +16,7 @@ __all__ = [
     "get_calmar_ratio_from",
     "get_cvar_from",
     "get_max_drawdown_from",
+    "get_metrics_from",
     "get_profit_factor_from",
     "get_r2_from",
     "get_recovery_factor_from",
@@ -0,0 +1,10 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_cagr_from(navs: npt.NDArray[np.float64], years: float) -> float:
+    if navs.size <= 1 or years <= 0 or navs[0] <= 0 or navs[-1] <= 0:
+        return 0.0
+
+    with np.errstate(over="ignore"):
+        return float((navs[-1] / navs[0]) ** (1 / years) - 1)
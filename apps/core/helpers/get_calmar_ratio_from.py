@@ -0,0 +1,5 @@
+def get_calmar_ratio_from(cagr: float, max_drawdown: float) -> float:
+    if max_drawdown == 0:
+        return 0.0
+
+    return cagr / abs(max_drawdown)
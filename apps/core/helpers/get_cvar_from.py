@@ -0,0 +1,15 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_cvar_from(
+    returns: npt.NDArray[np.float64],
+    confidence: float = 0.95,
+) -> float:
+    if returns.size == 0:
+        return 0.0
+
+    value_at_risk = np.quantile(returns, 1 - confidence)
+    tail = returns[returns <= value_at_risk]
+
+    return float(tail.mean())
@@ -0,0 +1,9 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_max_drawdown_from(drawdowns: npt.NDArray[np.float64]) -> float:
+    if drawdowns.size == 0:
+        return 0.0
+
+    return float(drawdowns.min())
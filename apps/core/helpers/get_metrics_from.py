@@ -0,0 +1,80 @@
+import math
+from typing import Dict, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .get_cagr_from import get_cagr_from
+from .get_calmar_ratio_from import get_calmar_ratio_from
+from .get_cvar_from import get_cvar_from
+from .get_max_drawdown_from import get_max_drawdown_from
+from .get_profit_factor_from import get_profit_factor_from
+from .get_r2_from import get_r2_from
+from .get_recovery_factor_from import get_recovery_factor_from
+from .get_sharpe_ratio_from import get_sharpe_ratio_from_orders
+from .get_sortino_ratio_from import get_sortino_ratio_from
+from .get_ulcer_index_from import get_ulcer_index_from
+
+MILLISECONDS_PER_YEAR = 365.25 * 24 * 60 * 60 * 1000
+
+
+def get_metrics_from(
+    navs: npt.ArrayLike,
+    timestamps: npt.ArrayLike,
+    risk_free_rate: float = 0.0,
+    confidence: float = 0.95,
+) -> Dict[str, Optional[float]]:
+    navs = np.asarray(navs, dtype=np.float64)
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+
+    if navs.size == 0:
+        return {}
+
+    pnl = np.diff(navs)
+    returns = np.divide(
+        pnl,
+        navs[:-1],
+        out=np.zeros_like(pnl),
+        where=navs[:-1] != 0,
+    )
+    peaks = np.maximum.accumulate(navs)
+    drawdowns = np.divide(
+        navs,
+        peaks,
+        out=np.ones_like(navs),
+        where=peaks > 0,
+    )
+    drawdowns -= 1
+
+    years = float(timestamps[-1] - timestamps[0]) / MILLISECONDS_PER_YEAR
+    periods_per_year = returns.size / years if years > 0 else 1.0
+
+    max_drawdown = get_max_drawdown_from(drawdowns)
+    cagr = get_cagr_from(navs, years)
+
+    metrics = {
+        "nav": float(navs[-1]),
+        "nav_peak": float(peaks[-1]),
+        "r2": get_r2_from(navs, timestamps),
+        "cagr": cagr,
+        "calmar_ratio": get_calmar_ratio_from(cagr, max_drawdown),
+        "expected_shortfall": get_cvar_from(returns, confidence),
+        "max_drawdown": max_drawdown,
+        "profit_factor": get_profit_factor_from(pnl),
+        "recovery_factor": get_recovery_factor_from(navs, max_drawdown),
+        "sharpe_ratio": get_sharpe_ratio_from_orders(
+            returns,
+            periods_per_year,
+            risk_free_rate,
+        ),
+        "sortino_ratio": get_sortino_ratio_from(
+            returns,
+            periods_per_year,
+            risk_free_rate,
+        ),
+        "ulcer_index": get_ulcer_index_from(drawdowns),
+    }
+
+    return {
+        name: value if math.isfinite(value) else None for name, value in metrics.items()
+    }
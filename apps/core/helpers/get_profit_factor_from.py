@@ -0,0 +1,12 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_profit_factor_from(pnl: npt.NDArray[np.float64]) -> float:
+    gross_profit = float(pnl[pnl > 0].sum())
+    gross_loss = float(-pnl[pnl < 0].sum())
+
+    if gross_loss == 0:
+        return float("inf") if gross_profit > 0 else 0.0
+
+    return gross_profit / gross_loss
@@ -0,0 +1,19 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_r2_from(
+    navs: npt.NDArray[np.float64],
+    timestamps: npt.NDArray[np.int64],
+) -> float:
+    if navs.size <= 1:
+        return 0.0
+
+    x = timestamps - timestamps.mean()
+    y = navs - navs.mean()
+    denominator = float(np.dot(x, x) * np.dot(y, y))
+
+    if denominator == 0:
+        return 0.0
+
+    return float(np.dot(x, y) ** 2 / denominator)
@@ -0,0 +1,12 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_recovery_factor_from(
+    navs: npt.NDArray[np.float64],
+    max_drawdown: float,
+) -> float:
+    if navs.size <= 1 or navs[0] == 0 or max_drawdown == 0:
+        return 0.0
+
+    return float((navs[-1] / navs[0] - 1) / abs(max_drawdown))
@@ -0,0 +1,19 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_sharpe_ratio_from_orders(
+    returns: npt.NDArray[np.float64],
+    periods_per_year: float,
+    risk_free_rate: float = 0.0,
+) -> float:
+    if returns.size <= 1:
+        return 0.0
+
+    std = float(returns.std(ddof=1))
+    if std == 0:
+        return 0.0
+
+    excess = float(returns.mean()) - risk_free_rate / periods_per_year
+
+    return excess / std * float(np.sqrt(periods_per_year))
@@ -0,0 +1,21 @@
+import numpy as np
+import numpy.typing as npt
+
+
+def get_sortino_ratio_from(
+    returns: npt.NDArray[np.float64],
+    periods_per_year: float,
+    risk_free_rate: float = 0.0,
+) -> float:
+    if returns.size == 0:
+        return 0.0
+
+    downside = np.minimum(returns, 0.0)
+    downside_deviation = float(np.sqrt(np.dot(downside, downside) / returns.size))
+
+    if downside_deviation == 0:
+        return 0.0
+
+    excess = float(returns.mean()) - risk_free_rate / periods_per_year
+
+    return excess / downside_deviation * float(np.sqrt(periods_per_year))
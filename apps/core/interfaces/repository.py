@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from bson.codec_options import CodecOptions
 
 
 class RepositoryInterface(ABC):
@@ -18,6 +20,18 @@ class RepositoryInterface(ABC):
     ) -> List[Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    def stream(
+        self,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = 1000,
+        codec_options: Optional[CodecOptions] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        pass
+
     @abstractmethod
     def count(
         self,
@@ -25,6 +39,25 @@ class RepositoryInterface(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    def estimated_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def aggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        pass
+
     @abstractmethod
     def store(
         self,
@@ -36,6 +69,7 @@ class RepositoryInterface(ABC):
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
         pass
 
@@ -47,6 +81,33 @@ class RepositoryInterface(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    def find_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def upsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        pass
+
+    @abstractmethod
+    def upsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        pass
+
     @abstractmethod
     def delete(
         self,
@@ -60,3 +121,118 @@ class RepositoryInterface(ABC):
         query_filters: Dict[str, Any],
     ) -> int:
         pass
+
+    @abstractmethod
+    async def afind(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def astream(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[int] = None,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def aestimated_count(self) -> int:
+        pass
+
+    @abstractmethod
+    async def aget_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def aaggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def afind_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def aupsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def aupsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        pass
+
+    @abstractmethod
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def adelete_many(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        pass
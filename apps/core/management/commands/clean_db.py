@@ -4,6 +4,7 @@ from typing import Any
 from django.core.management.base import BaseCommand
 
 from apps.core.models.backtest import BacktestModel
+from apps.core.tasks.backtest.purge import BacktestPurgeTask
 
 
 class Command(BaseCommand):
@@ -13,11 +14,15 @@ class Command(BaseCommand):
         log = logging.getLogger(__name__)
 
         model = BacktestModel()
-        backtests = model.find(query_filters={})
+        backtests = model.stream(
+            query_filters={},
+            projection_fields={"_id": 1},
+        )
 
         for backtest in backtests:
             try:
-                model.delete(query_filters={"_id": backtest["_id"]})
+                model.mark_deleting(str(backtest["_id"]))
+                BacktestPurgeTask(backtest_id=str(backtest["_id"])).run()
                 log.info(f"Deleted backtest: {backtest['_id']}")
 
             except Exception as e:
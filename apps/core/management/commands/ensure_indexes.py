@@ -0,0 +1,53 @@
+import logging
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.core.repositories.registry import get_repositories
+
+
+class Command(BaseCommand):
+    help = "Create the indexes declared by each repository and report drift"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift, do not create missing indexes",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        log = logging.getLogger(__name__)
+        check_only = bool(options.get("check"))
+        drift_total = 0
+
+        for repository in get_repositories():
+            collection_name = repository.collection_name
+            drift = repository.get_index_drift()
+
+            for name in drift["missing"]:
+                log.warning(f"Missing index on {collection_name}: {name}")
+
+            for name in drift["mismatched"]:
+                log.warning(
+                    f"Index options differ on {collection_name}: {name}, "
+                    "drop it and run `manage.py ensure_indexes`"
+                )
+
+            for name in drift["unexpected"]:
+                log.warning(f"Undeclared index on {collection_name}: {name}")
+
+            drift_total += len(drift["missing"]) + len(drift["mismatched"])
+
+            if check_only or not drift["missing"]:
+                continue
+
+            try:
+                created = repository.ensure_indexes()
+                log.info(f"Ensured indexes on {collection_name}: {created}")
+
+            except Exception as e:
+                log.error(f"Error creating indexes on {collection_name}: {e!r}")
+
+        if check_only and drift_total:
+            raise CommandError(f"{drift_total} declared indexes are missing or differ")
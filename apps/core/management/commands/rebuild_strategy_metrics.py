@@ -0,0 +1,52 @@
+import logging
+from typing import Any, List
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.core.models.snapshot import SnapshotModel
+from apps.core.models.strategy_metrics import StrategyMetricsModel
+
+
+class Command(BaseCommand):
+    help = "Rebuild the running strategy metrics of backtests from their snapshots"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--backtest-id",
+            action="append",
+            default=[],
+            help="Backtest to rebuild (repeatable)",
+        )
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="Rebuild every backtest with metrics flagged as stale",
+        )
+
+    def handle(self, *_args: Any, **options: Any) -> None:
+        log = logging.getLogger(__name__)
+        backtest_ids: List[str] = list(options.get("backtest_id") or [])
+
+        if options.get("stale"):
+            backtest_ids.extend(self._get_stale_backtest_ids())
+
+        if not backtest_ids and not options.get("stale"):
+            raise CommandError("Pass --backtest-id or --stale")
+
+        snapshot_model = SnapshotModel()
+
+        for backtest_id in dict.fromkeys(backtest_ids):
+            try:
+                replayed = snapshot_model.rebuild_metrics(backtest_id)
+                log.info(f"Rebuilt strategy metrics of {backtest_id}: {replayed}")
+
+            except Exception as e:
+                log.error(f"Error rebuilding strategy metrics of {backtest_id}: {e!r}")
+
+    def _get_stale_backtest_ids(self) -> List[str]:
+        metrics = StrategyMetricsModel().stream(
+            query_filters={"stale": True},
+            projection_fields={"backtest_id": 1},
+        )
+
+        return [str(item["backtest_id"]) for item in metrics]
@@ -0,0 +1,246 @@
+import re
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class StreamCompressor:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _encoding: str
+    _compressor: Any
+    _flush_size: int
+    _pending: int
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, encoding: str, level: int, flush_size: int) -> None:
+        self._encoding = encoding
+        self._flush_size = flush_size
+        self._pending = 0
+
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=level)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def compress(self, data: bytes) -> bytes:
+        if self._encoding == "br":
+            compressed = self._compressor.process(data)
+        else:
+            compressed = self._compressor.compress(data)
+
+        self._pending += len(data)
+
+        if self._pending < self._flush_size:
+            return compressed
+
+        self._pending = 0
+
+        return compressed + self._flush()
+
+    def finish(self) -> bytes:
+        if self._encoding == "br":
+            return self._compressor.finish()
+
+        return self._compressor.flush()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _flush(self) -> bytes:
+        if self._encoding == "br":
+            return self._compressor.flush()
+
+        if self._encoding == "zstd":
+            return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    COMPRESSIBLE_TYPES = (
+        "text/",
+        "application/json",
+        "application/x-ndjson",
+        "application/javascript",
+        "application/xml",
+    )
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def process_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+    ) -> HttpResponseBase:
+        if not self._is_compressible(response):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        config = settings.COMPRESSION
+        content = b"" if response.streaming else response.content  # type: ignore
+
+        if not response.streaming and len(content) < config["MIN_SIZE"]:
+            return response
+
+        encoding = self._get_encoding(request.headers.get("Accept-Encoding", ""))
+
+        if encoding is None:
+            return response
+
+        compressor = StreamCompressor(
+            encoding,
+            self._get_level(encoding),
+            config["STREAM_FLUSH_SIZE"],
+        )
+
+        if response.streaming:
+            if response.is_async:  # type: ignore
+                response.streaming_content = self._compress_async(  # type: ignore
+                    response.streaming_content,  # type: ignore
+                    compressor,
+                )
+            else:
+                response.streaming_content = self._compress_sync(  # type: ignore
+                    response.streaming_content,  # type: ignore
+                    compressor,
+                )
+
+            del response.headers["Content-Length"]
+
+        else:
+            compressed = compressor.compress(content) + compressor.finish()
+
+            if len(compressed) >= len(content):
+                return response
+
+            response.content = compressed  # type: ignore
+            response.headers["Content-Length"] = str(len(compressed))
+
+        etag = response.headers.get("ETag")
+
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = f"W/{etag}"
+
+        response.headers["Content-Encoding"] = encoding
+
+        return response
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _is_compressible(self, response: HttpResponseBase) -> bool:
+        content_type = response.headers.get("Content-Type", "")
+        cache_control = response.headers.get("Cache-Control", "")
+
+        return (
+            not response.has_header("Content-Encoding")
+            and "no-transform" not in cache_control
+            and content_type.startswith(self.COMPRESSIBLE_TYPES)
+        )
+
+    def _get_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = self._parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best_encoding = None
+        best_quality = 0.0
+
+        for encoding in self._get_available_encodings():
+            quality = accepted.get(encoding, wildcard)
+
+            if quality > best_quality:
+                best_encoding = encoding
+                best_quality = quality
+
+        return best_encoding
+
+    def _get_available_encodings(self) -> List[str]:
+        modules = {"gzip": zlib, "br": brotli, "zstd": zstandard}
+
+        return [
+            encoding
+            for encoding in settings.COMPRESSION["ENCODINGS"]
+            if modules.get(encoding) is not None
+        ]
+
+    def _get_level(self, encoding: str) -> int:
+        config = settings.COMPRESSION
+
+        if encoding == "br":
+            return config["BROTLI_QUALITY"]
+
+        if encoding == "zstd":
+            return config["ZSTD_LEVEL"]
+
+        return config["GZIP_LEVEL"]
+
+    def _compress_sync(
+        self,
+        content: Iterator[bytes],
+        compressor: StreamCompressor,
+    ) -> Iterator[bytes]:
+        for chunk in content:
+            compressed = compressor.compress(chunk) if chunk else b""
+
+            if compressed:
+                yield compressed
+
+        yield compressor.finish()
+
+    async def _compress_async(
+        self,
+        content: AsyncIterator[bytes],
+        compressor: StreamCompressor,
+    ) -> AsyncIterator[bytes]:
+        async for chunk in content:
+            compressed = compressor.compress(chunk) if chunk else b""
+
+            if compressed:
+                yield compressed
+
+        yield compressor.finish()
+
+    # Helpers
+    def _parse_accept_encoding(self, accept_encoding: str) -> Dict[str, float]:
+        accepted = {}
+
+        for item in accept_encoding.split(","):
+            encoding, _, params = item.strip().partition(";")
+            match = re.search(r"q\s*=\s*([0-9.]+)", params)
+
+            try:
+                quality = float(match.group(1)) if match else 1.0
+            except ValueError:
+                quality = 0.0
+
+            if encoding:
+                accepted[encoding.strip().lower()] = quality
+
+        return accepted
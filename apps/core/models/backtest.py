@@ -1,12 +1,14 @@
 import logging
-from typing import Any, Dict
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Iterator
 
+from bson import ObjectId
+
+from apps.core.enums.backtest_status import BacktestStatus
 from apps.core.enums.report_status import ReportStatus
 from apps.core.models.base import BaseModel
 from apps.core.repositories.backtest import BacktestRepository
-from apps.core.repositories.order import OrderRepository
 from apps.core.repositories.report import ReportRepository
-from apps.core.repositories.snapshot import SnapshotRepository
 
 
 class BacktestModel(BaseModel):
@@ -18,8 +20,6 @@ class BacktestModel(BaseModel):
         self._logger = logging.getLogger("django")
         self._repository = BacktestRepository()
         self._report_repository = ReportRepository()
-        self._snapshot_repository = SnapshotRepository()
-        self._order_repository = OrderRepository()
 
     def store(self, data: Dict[str, Any]) -> str:
         inserted_id = super().store(
@@ -37,30 +37,63 @@ class BacktestModel(BaseModel):
 
         return inserted_id
 
-    def delete(self, query_filters: Dict[str, Any]) -> bool:
-        backtest_id_raw = query_filters.get("_id")
-        backtest_id = str(backtest_id_raw) if backtest_id_raw else None
-        response = super().delete(
-            query_filters=query_filters,
+    def mark_deleting(self, backtest_id: str) -> bool:
+        backtest = self.find_one_and_update(
+            query_filters={"_id": ObjectId(backtest_id)},
+            data={
+                "status": BacktestStatus.DELETING.value,
+                "purge_heartbeat_at": datetime.now(tz=UTC),
+            },
         )
 
-        if response and backtest_id:
-            self._report_repository.delete_many(
-                query_filters={
-                    "backtest_id": backtest_id,
-                }
-            )
+        return backtest is not None
 
-            self._snapshot_repository.delete_many(
-                query_filters={
-                    "backtest_id": backtest_id,
-                }
-            )
+    def touch_purge_heartbeat(self, backtest_id: str) -> None:
+        self.update(
+            query_filters={"_id": ObjectId(backtest_id)},
+            data={"purge_heartbeat_at": datetime.now(tz=UTC)},
+        )
 
-            self._order_repository.delete_many(
-                query_filters={
-                    "backtest_id": backtest_id,
+    def stream_stale_deletions(self, stale_after: int) -> Iterator[Dict[str, Any]]:
+        stale_before = datetime.now(tz=UTC) - timedelta(seconds=stale_after)
+
+        return self.stream(
+            query_filters={
+                "status": BacktestStatus.DELETING.value,
+                "$or": [
+                    {"purge_heartbeat_at": {"$lt": stale_before}},
+                    {
+                        "purge_heartbeat_at": {"$exists": False},
+                        "updated_at": {"$lt": stale_before},
+                    },
+                ],
+            },
+            projection_fields={"_id": 1},
+        )
+
+    async def astore(self, data: Dict[str, Any]) -> str:
+        inserted_id = await super().astore(
+            data=data,
+        )
+
+        if inserted_id:
+            await self._report_repository.astore(
+                data={
+                    "backtest_id": inserted_id,
+                    "status": ReportStatus.PENDING.value,
+                    "folder": None,
                 }
             )
 
-        return True
+        return inserted_id
+
+    async def amark_deleting(self, backtest_id: str) -> bool:
+        backtest = await self.afind_one_and_update(
+            query_filters={"_id": ObjectId(backtest_id)},
+            data={
+                "status": BacktestStatus.DELETING.value,
+                "purge_heartbeat_at": datetime.now(tz=UTC),
+            },
+        )
+
+        return backtest is not None
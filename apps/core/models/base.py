@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from bson.codec_options import CodecOptions
 
 from apps.core.repositories.base import BaseRepository
 
@@ -30,6 +32,24 @@ class BaseModel:
             projection_fields=projection_fields,
         )
 
+    def stream(
+        self,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = BaseRepository.DEFAULT_BATCH_SIZE,
+        codec_options: Optional[CodecOptions] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        return self._repository.stream(
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+            batch_size=batch_size,
+            codec_options=codec_options,
+        )
+
     def count(
         self,
         query_filters: Optional[Dict[str, Any]] = None,
@@ -38,6 +58,27 @@ class BaseModel:
             query_filters=query_filters,
         )
 
+    def estimated_count(self) -> int:
+        return self._repository.estimated_count()
+
+    def get_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return self._repository.get_version(
+            query_filters=query_filters,
+        )
+
+    def aggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = BaseRepository.DEFAULT_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        return self._repository.aggregate(
+            pipeline=pipeline,
+            batch_size=batch_size,
+        )
+
     def store(
         self,
         data: Dict[str, Any],
@@ -49,9 +90,11 @@ class BaseModel:
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
         return self._repository.store_many(
             data=data,
+            ordered=ordered,
         )
 
     def update(
@@ -64,6 +107,42 @@ class BaseModel:
             data=data,
         )
 
+    def find_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        return self._repository.find_one_and_update(
+            query_filters=query_filters,
+            data=data,
+            projection_fields=projection_fields,
+            return_previous=return_previous,
+        )
+
+    def upsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        return self._repository.upsert(
+            query_filters=query_filters,
+            data=data,
+        )
+
+    def upsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        return self._repository.upsert_many(
+            query_filters=query_filters,
+            data=data,
+            ordered=ordered,
+        )
+
     def delete(
         self,
         query_filters: Dict[str, Any],
@@ -71,3 +150,142 @@ class BaseModel:
         return self._repository.delete(
             query_filters=query_filters,
         )
+
+    async def afind(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._repository.afind(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+        )
+
+    def astream(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self._repository.astream(
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_direction=sort_direction,
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+        )
+
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[int] = None,
+    ) -> int:
+        return await self._repository.acount(
+            query_filters=query_filters,
+            cache_ttl=cache_ttl,
+        )
+
+    async def aestimated_count(self) -> int:
+        return await self._repository.aestimated_count()
+
+    async def aget_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        return await self._repository.aget_version(
+            query_filters=query_filters,
+        )
+
+    async def aaggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = BaseRepository.DEFAULT_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        return await self._repository.aaggregate(
+            pipeline=pipeline,
+            batch_size=batch_size,
+        )
+
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        return await self._repository.astore(
+            data=data,
+        )
+
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        return await self._repository.astore_many(
+            data=data,
+            ordered=ordered,
+        )
+
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        return await self._repository.aupdate(
+            query_filters=query_filters,
+            data=data,
+        )
+
+    async def afind_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        return await self._repository.afind_one_and_update(
+            query_filters=query_filters,
+            data=data,
+            projection_fields=projection_fields,
+            return_previous=return_previous,
+        )
+
+    async def aupsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        return await self._repository.aupsert(
+            query_filters=query_filters,
+            data=data,
+        )
+
+    async def aupsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        return await self._repository.aupsert_many(
+            query_filters=query_filters,
+            data=data,
+            ordered=ordered,
+        )
+
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        return await self._repository.adelete(
+            query_filters=query_filters,
+        )
@@ -1,11 +1,28 @@
+from typing import Any, Dict
+
 from apps.core.models.base import BaseModel
 from apps.core.repositories.order import OrderRepository
+from apps.core.validators.order_statistics import OrderStatisticsQuery
 
 
 class OrderModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _repository: OrderRepository
+
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
     # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__()
         self._repository = OrderRepository()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_statistics(self, query: OrderStatisticsQuery) -> Dict[str, Any]:
+        return self._repository.get_statistics(query=query)
+
+    async def aget_statistics(self, query: OrderStatisticsQuery) -> Dict[str, Any]:
+        return await self._repository.aget_statistics(query=query)
@@ -1,13 +1,342 @@
-from typing import Any, Dict
+import logging
+from datetime import UTC, datetime
+from itertools import islice
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from bson import ObjectId
+from django.conf import settings
+from pymongo.errors import BulkWriteError
 
 from apps.core.models.base import BaseModel
+from apps.core.models.strategy_metrics import StrategyMetricsModel
+from apps.core.repositories.backtest import BacktestRepository
 from apps.core.repositories.snapshot import SnapshotRepository
+from apps.core.services.mongodb.codecs import DATETIME_MS_CODEC_OPTIONS
 
 
 class SnapshotModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    SERIES_FIELDS: ClassVar[Tuple[str, ...]] = ("nav", "allocation")
+    SERIES_BATCH_SIZE: int = 50000
+    BUCKET_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "backtest_id",
+        "strategy_id",
+        "coalesce_bucket",
+    )
+
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
     # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__()
+        self._logger = logging.getLogger("django")
         self._repository = SnapshotRepository()
+        self._backtest_repository = BacktestRepository()
+        self._metrics_model = StrategyMetricsModel()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def store(self, data: Dict[str, Any]) -> str:
+        (query_filters,) = self._prepare_buckets([data])
+
+        if query_filters is None:
+            snapshot_id = super().store(data=data)
+        else:
+            snapshot_id = self.upsert(query_filters=query_filters, data=data)
+
+        self._accumulate([data])
+
+        return snapshot_id
+
+    def store_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        query_filters = self._prepare_buckets(data)
+
+        try:
+            inserted_ids = self._store_many(data, query_filters, ordered)
+        except BulkWriteError as e:
+            written = self._get_written_indexes(len(data), e, ordered)
+            self._accumulate([data[index] for index in written])
+            raise
+
+        self._accumulate(data)
+
+        return inserted_ids
+
+    async def astore(self, data: Dict[str, Any]) -> str:
+        (query_filters,) = await self._aprepare_buckets([data])
+
+        if query_filters is None:
+            snapshot_id = await super().astore(data=data)
+        else:
+            snapshot_id = await self.aupsert(query_filters=query_filters, data=data)
+
+        await self._aaccumulate([data])
+
+        return snapshot_id
+
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        query_filters = await self._aprepare_buckets(data)
+
+        try:
+            inserted_ids = await self._astore_many(data, query_filters, ordered)
+        except BulkWriteError as e:
+            written = self._get_written_indexes(len(data), e, ordered)
+            await self._aaccumulate([data[index] for index in written])
+            raise
+
+        await self._aaccumulate(data)
+
+        return inserted_ids
+
+    def rebuild_metrics(self, backtest_id: str) -> int:
+        snapshots = self.stream(
+            sort_by="created_at",
+            sort_direction="asc",
+            query_filters={"backtest_id": backtest_id},
+            projection_fields={
+                "_id": 0,
+                "backtest_id": 1,
+                "strategy_id": 1,
+                "nav": 1,
+                "coalesce_bucket": 1,
+                "created_at": 1,
+            },
+        )
+
+        return self._metrics_model.rebuild(backtest_id, snapshots)
+
+    def load_series(
+        self,
+        backtest_id: str,
+        fields: Sequence[str] = SERIES_FIELDS,
+    ) -> Dict[str, Dict[str, npt.NDArray[Any]]]:
+        query_filters = {"backtest_id": backtest_id}
+        capacity = self.count(query_filters=query_filters)
+        timestamps = np.empty(capacity, dtype=np.int64)
+        codes = np.empty(capacity, dtype=np.int32)
+        columns = {field: np.full(capacity, np.nan) for field in fields}
+        strategies: Dict[str, int] = {}
+        size = 0
+
+        documents = self.stream(
+            sort_by="created_at",
+            sort_direction="asc",
+            query_filters=query_filters,
+            projection_fields={
+                "_id": 0,
+                "strategy_id": 1,
+                "created_at": 1,
+                **dict.fromkeys(fields, 1),
+            },
+            batch_size=self.SERIES_BATCH_SIZE,
+            codec_options=DATETIME_MS_CODEC_OPTIONS,
+        )
+
+        for document in islice(documents, capacity):
+            strategy_id = str(document.get("strategy_id"))
+            timestamps[size] = int(document["created_at"])
+            codes[size] = strategies.setdefault(strategy_id, len(strategies))
+
+            for field in fields:
+                value = document.get(field)
+
+                if value is not None:
+                    columns[field][size] = value
+
+            size += 1
+
+        return self._split_series(
+            list(strategies),
+            codes[:size],
+            {"created_at": timestamps[:size]}
+            | {field: column[:size] for field, column in columns.items()},
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _prepare_buckets(
+        self,
+        data: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        windows = {
+            backtest_id: self._get_coalesce_window(backtest_id)
+            for backtest_id in self._get_coalescible_backtest_ids(data)
+        }
+
+        return self._build_bulk_coalesce_filters(data, windows)
+
+    async def _aprepare_buckets(
+        self,
+        data: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        windows = {
+            backtest_id: await self._aget_coalesce_window(backtest_id)
+            for backtest_id in self._get_coalescible_backtest_ids(data)
+        }
+
+        return self._build_bulk_coalesce_filters(data, windows)
+
+    def _store_many(
+        self,
+        data: List[Dict[str, Any]],
+        query_filters: List[Optional[Dict[str, Any]]],
+        ordered: bool,
+    ) -> List[str]:
+        if not any(query_filters):
+            return super().store_many(data=data, ordered=ordered)
+
+        return self.upsert_many(
+            query_filters=query_filters,
+            data=data,
+            ordered=ordered,
+        )
+
+    async def _astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        query_filters: List[Optional[Dict[str, Any]]],
+        ordered: bool,
+    ) -> List[str]:
+        if not any(query_filters):
+            return await super().astore_many(data=data, ordered=ordered)
+
+        return await self.aupsert_many(
+            query_filters=query_filters,
+            data=data,
+            ordered=ordered,
+        )
+
+    def _accumulate(self, snapshots: List[Dict[str, Any]]) -> None:
+        try:
+            self._metrics_model.accumulate(snapshots)
+            return
+        except Exception as e:
+            self._logger.error(f"Failed to accumulate strategy metrics: {e}")
+
+        try:
+            self._metrics_model.mark_stale(snapshots)
+        except Exception as e:
+            self._logger.error(f"Failed to mark strategy metrics as stale: {e}")
+
+    async def _aaccumulate(self, snapshots: List[Dict[str, Any]]) -> None:
+        try:
+            await self._metrics_model.aaccumulate(snapshots)
+            return
+        except Exception as e:
+            self._logger.error(f"Failed to accumulate strategy metrics: {e}")
+
+        try:
+            await self._metrics_model.amark_stale(snapshots)
+        except Exception as e:
+            self._logger.error(f"Failed to mark strategy metrics as stale: {e}")
+
+    def _is_coalescible(self, data: Dict[str, Any]) -> bool:
+        significant_events = settings.SNAPSHOTS["SIGNIFICANT_EVENTS"]
+
+        return (
+            ObjectId.is_valid(data.get("backtest_id"))
+            and bool(data.get("strategy_id"))
+            and data.get("event") not in significant_events
+        )
+
+    def _get_coalesce_window(self, backtest_id: str) -> int:
+        backtests = self._backtest_repository.find(
+            limit=1,
+            query_filters={"_id": ObjectId(backtest_id)},
+            projection_fields={"snapshot_coalesce_window": 1},
+        )
+
+        return self._parse_coalesce_window(backtests[0] if backtests else None)
+
+    async def _aget_coalesce_window(self, backtest_id: str) -> int:
+        backtests = await self._backtest_repository.afind(
+            limit=1,
+            query_filters={"_id": ObjectId(backtest_id)},
+            projection_fields={"snapshot_coalesce_window": 1},
+        )
+
+        return self._parse_coalesce_window(backtests[0] if backtests else None)
+
+    def _build_coalesce_filters(
+        self,
+        data: Dict[str, Any],
+        window: int,
+    ) -> Dict[str, Any]:
+        created_at = data.get("created_at")
+
+        if not isinstance(created_at, datetime):
+            created_at = datetime.now(tz=UTC)
+            data["created_at"] = created_at
+
+        data["coalesce_bucket"] = int(created_at.timestamp() // window)
+
+        return {field: data[field] for field in self.BUCKET_FIELDS}
+
+    def _build_bulk_coalesce_filters(
+        self,
+        data: List[Dict[str, Any]],
+        windows: Dict[str, int],
+    ) -> List[Optional[Dict[str, Any]]]:
+        return [
+            self._build_coalesce_filters(item, windows[item["backtest_id"]])
+            if self._is_coalescible(item) and windows.get(item["backtest_id"])
+            else None
+            for item in data
+        ]
+
+    # Helpers
+    def _get_written_indexes(
+        self,
+        size: int,
+        error: BulkWriteError,
+        ordered: bool,
+    ) -> List[int]:
+        failed = {item["index"] for item in error.details.get("writeErrors", [])}
+
+        if ordered:
+            return list(range(min(failed, default=size)))
+
+        return [index for index in range(size) if index not in failed]
+
+    def _split_series(
+        self,
+        strategies: Sequence[str],
+        codes: npt.NDArray[np.int32],
+        columns: Dict[str, npt.NDArray[Any]],
+    ) -> Dict[str, Dict[str, npt.NDArray[Any]]]:
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(strategies) + 1))
+        grouped = {name: column[order] for name, column in columns.items()}
+
+        return {
+            strategy_id: {
+                name: column[bounds[code] : bounds[code + 1]]
+                for name, column in grouped.items()
+            }
+            for code, strategy_id in enumerate(strategies)
+        }
+
+    def _parse_coalesce_window(self, backtest: Optional[Dict[str, Any]]) -> int:
+        window = (backtest or {}).get("snapshot_coalesce_window")
+        return int(window) if window else 0
+
+    def _get_coalescible_backtest_ids(self, data: List[Dict[str, Any]]) -> List[str]:
+        return list(
+            dict.fromkeys(
+                item["backtest_id"] for item in data if self._is_coalescible(item)
+            )
+        )
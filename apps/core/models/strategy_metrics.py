@@ -0,0 +1,73 @@
+from itertools import islice
+from typing import Any, Dict, Iterator, List
+
+from apps.core.models.base import BaseModel
+from apps.core.repositories.strategy_metrics import StrategyMetricsRepository
+
+
+class StrategyMetricsModel(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    REBUILD_BATCH_SIZE: int = 1000
+
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _repository: StrategyMetricsRepository
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__()
+        self._repository = StrategyMetricsRepository()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def accumulate(self, snapshots: List[Dict[str, Any]]) -> int:
+        return self._repository.accumulate(
+            snapshots=self._filter_accumulable(snapshots),
+        )
+
+    async def aaccumulate(self, snapshots: List[Dict[str, Any]]) -> int:
+        return await self._repository.aaccumulate(
+            snapshots=self._filter_accumulable(snapshots),
+        )
+
+    def mark_stale(self, snapshots: List[Dict[str, Any]]) -> None:
+        self._repository.mark_stale(
+            snapshots=self._filter_accumulable(snapshots),
+        )
+
+    async def amark_stale(self, snapshots: List[Dict[str, Any]]) -> None:
+        await self._repository.amark_stale(
+            snapshots=self._filter_accumulable(snapshots),
+        )
+
+    def rebuild(self, backtest_id: str, snapshots: Iterator[Dict[str, Any]]) -> int:
+        self.delete_many(query_filters={"backtest_id": backtest_id})
+        accumulated = 0
+
+        while batch := list(islice(snapshots, self.REBUILD_BATCH_SIZE)):
+            self.accumulate(batch)
+            accumulated += len(batch)
+
+        return accumulated
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _filter_accumulable(
+        self,
+        snapshots: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        return [
+            snapshot
+            for snapshot in snapshots
+            if snapshot.get("backtest_id")
+            and snapshot.get("strategy_id")
+            and snapshot.get("nav") is not None
+            and snapshot.get("created_at") is not None
+        ]
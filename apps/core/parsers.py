@@ -0,0 +1,32 @@
+import json
+from typing import Any, List, Mapping, Optional
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    media_type = "application/x-ndjson"
+
+    def parse(
+        self,
+        stream: Any,
+        media_type: Optional[str] = None,
+        parser_context: Optional[Mapping[str, Any]] = None,
+    ) -> List[Any]:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        items = []
+
+        try:
+            for line in stream:
+                content = line.decode(encoding).strip()
+
+                if content:
+                    items.append(json.loads(content))
+
+        except ValueError as e:
+            raise ParseError(f"NDJSON parse error - {e}") from e
+
+        return items
@@ -0,0 +1,46 @@
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+
+class JSONRenderer:
+    content_type = "application/json"
+
+    def render(self, data: Any) -> bytes:
+        return json.dumps(
+            data,
+            default=self._default,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _default(self, value: Any) -> Any:
+        if isinstance(value, ObjectId):
+            return str(value)
+
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class OrjsonRenderer(JSONRenderer):
+    def render(self, data: Any) -> bytes:
+        return orjson.dumps(
+            data,
+            default=self._default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_renderer() -> JSONRenderer:
+    return import_string(settings.RESPONSE_RENDERER)()
@@ -1,16 +1,48 @@
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from bson import ObjectId, json_util
+from bson.codec_options import CodecOptions
+from pymongo import IndexModel, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from apps.core.interfaces.repository import RepositoryInterface
+from apps.core.services.cache import CacheService
 from apps.core.services.mongodb import MongoDBService
 
 
 class BaseRepository(RepositoryInterface):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    DEFAULT_BATCH_SIZE: int = 1000
+    DUPLICATE_KEY_ERROR: int = 11000
+    INDEXES: ClassVar[List[IndexModel]] = []
+    CACHE_ENABLED: ClassVar[bool] = False
+    INDEX_OPTIONS: ClassVar[Tuple[str, ...]] = (
+        "unique",
+        "sparse",
+        "partialFilterExpression",
+        "expireAfterSeconds",
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
     _collection_name: str
     _db_service: MongoDBService
+    _cache_service: CacheService
 
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
@@ -18,6 +50,7 @@ class BaseRepository(RepositoryInterface):
     def __init__(self, collection_name: str) -> None:
         self._collection_name = collection_name
         self._db_service = MongoDBService()
+        self._cache_service = CacheService()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
@@ -31,76 +64,118 @@ class BaseRepository(RepositoryInterface):
         query_filters: Optional[Dict[str, Any]] = None,
         projection_fields: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "query_filters": query_filters,
+            "projection_fields": projection_fields,
+        }
+
+        if not self.CACHE_ENABLED:
+            return self._find(**params)
+
+        return self._cache_service.get_or_set(
+            self._collection_name,
+            "find",
+            params,
+            lambda: self._find(**params),
+        )
+
+    def stream(
+        self,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        codec_options: Optional[CodecOptions] = None,
+    ) -> Iterator[Dict[str, Any]]:
         collection = self._db_service.get_collection(self._collection_name)
         filters = query_filters or {}
-        projection = projection_fields or {}
-        cursor = collection.find(filters, projection)
 
-        if sort_by and sort_direction:
-            direction = -1 if sort_direction == "desc" else 1
-            cursor = cursor.sort(sort_by, direction)
+        if codec_options:
+            collection = collection.with_options(codec_options=codec_options)
 
-        if offset:
-            cursor = cursor.skip(offset)
+        projection = projection_fields or {}
+        cursor = collection.find(filters, projection, batch_size=batch_size)
 
-        if limit != 9**100:
-            cursor = cursor.limit(limit)
+        if sort_by and sort_direction:
+            cursor = cursor.sort(self._build_sort(sort_by, sort_direction))
 
-        return list(cursor)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
 
     def count(
         self,
         query_filters: Optional[Dict[str, Any]] = None,
     ) -> int:
+        if not self.CACHE_ENABLED:
+            return self._count(query_filters)
+
+        return self._cache_service.get_or_set(
+            self._collection_name,
+            "count",
+            {"query_filters": query_filters},
+            lambda: self._count(query_filters),
+        )
+
+    def estimated_count(self) -> int:
         collection = self._db_service.get_collection(self._collection_name)
-        filters = query_filters or {}
-        return collection.count_documents(filters)
+        return collection.estimated_document_count()
+
+    def get_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        generation = (
+            self._cache_service.get_generation(self._collection_name)
+            if self.CACHE_ENABLED
+            else None
+        )
+        results = self.aggregate(self._build_version_pipeline(query_filters))
+        return self._parse_version(generation, results)
+
+    def aggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        collection = self._db_service.get_collection(self._collection_name)
+
+        with collection.aggregate(pipeline, batchSize=batch_size) as cursor:
+            return list(cursor)
 
     def store(
         self,
         data: Dict[str, Any],
     ) -> str:
-        if "created_at" in data and not isinstance(data["created_at"], datetime):
-            created_at = data["created_at"]
-            created_at = float(created_at if created_at is not None else 0)
-            data["created_at"] = datetime.fromtimestamp(created_at, tz=UTC)
-        elif "created_at" not in data:
-            data["created_at"] = datetime.now(tz=UTC)
-
-        if "updated_at" in data and not isinstance(data["updated_at"], datetime):
-            updated_at = data["updated_at"]
-            updated_at = float(updated_at if updated_at is not None else 0)
-            data["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-        elif "updated_at" not in data:
-            data["updated_at"] = datetime.now(tz=UTC)
+        self._prepare_store_data(data, datetime.now(tz=UTC))
 
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.insert_one(data)
+        self._invalidate_cache()
         return str(result.inserted_id)
 
     def store_many(
         self,
         data: List[Dict[str, Any]],
+        ordered: bool = True,
     ) -> List[str]:
         now = datetime.now(tz=UTC)
 
         for item in data:
-            if "created_at" in item and not isinstance(item["created_at"], datetime):
-                created_at = item["created_at"]
-                created_at = float(created_at if created_at is not None else 0)
-                item["created_at"] = datetime.fromtimestamp(created_at, tz=UTC)
-            elif "created_at" not in item:
-                item["created_at"] = now
-
-            if "updated_at" in item and not isinstance(item["updated_at"], datetime):
-                updated_at = item["updated_at"]
-                updated_at = float(updated_at if updated_at is not None else 0)
-                item["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-            elif "updated_at" not in item:
-                item["updated_at"] = now
+            self._prepare_store_data(item, now)
 
         collection = self._db_service.get_collection(self._collection_name)
-        result = collection.insert_many(data)
+        try:
+            result = collection.insert_many(data, ordered=ordered)
+        finally:
+            self._invalidate_cache()
+
         return [str(inserted_id) for inserted_id in result.inserted_ids]
 
     def update(
@@ -108,23 +183,109 @@ class BaseRepository(RepositoryInterface):
         query_filters: Dict[str, Any],
         data: Dict[str, Any],
     ) -> int:
-        if "updated_at" in data and not isinstance(data["updated_at"], datetime):
-            updated_at = data["updated_at"]
-            updated_at = float(updated_at if updated_at is not None else 0)
-            data["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
-        elif "updated_at" not in data:
-            data["updated_at"] = datetime.now(tz=UTC)
+        self._prepare_update_data(data)
 
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.update_one(query_filters, {"$set": data})
+        self._invalidate_cache()
         return result.modified_count
 
+    def find_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        self._prepare_update_data(data)
+
+        collection = self._db_service.get_collection(self._collection_name)
+        result = collection.find_one_and_update(
+            query_filters,
+            {"$set": data},
+            projection=projection_fields or {"_id": 1},
+            return_document=(
+                ReturnDocument.BEFORE if return_previous else ReturnDocument.AFTER
+            ),
+        )
+
+        if result is not None:
+            self._invalidate_cache()
+
+        return result
+
+    def upsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        self._prepare_store_data(data, datetime.now(tz=UTC))
+        data.pop("_id", None)
+
+        collection = self._db_service.get_collection(self._collection_name)
+        params = self._build_upsert_params(query_filters, data)
+
+        try:
+            try:
+                result = collection.find_one_and_update(**params)
+            except DuplicateKeyError:
+                result = collection.find_one_and_update(**params)
+        finally:
+            self._invalidate_cache()
+
+        data["_id"] = result["_id"]
+        return str(result["_id"])
+
+    def upsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        operations = self._prepare_upsert_operations(query_filters, data)
+
+        collection = self._db_service.get_collection(self._collection_name)
+        try:
+            try:
+                result = collection.bulk_write(operations, ordered=ordered)
+                upserted_ids = dict(result.upserted_ids)
+            except BulkWriteError as e:
+                indexes = self._get_retry_indexes(operations, e, ordered)
+                upserted_ids = self._get_upserted_ids(e)
+
+                try:
+                    result = collection.bulk_write(
+                        [operations[index] for index in indexes],
+                        ordered=ordered,
+                    )
+                except BulkWriteError as retry_error:
+                    raise self._remap_bulk_error(retry_error, indexes) from e
+
+                for index, upserted_id in result.upserted_ids.items():
+                    upserted_ids[indexes[index]] = upserted_id
+        finally:
+            self._invalidate_cache()
+
+        unresolved = self._get_unresolved_filters(query_filters, upserted_ids)
+        documents = (
+            list(
+                collection.find(
+                    {"$or": unresolved}, self._build_upsert_projection(unresolved)
+                )
+            )
+            if unresolved
+            else []
+        )
+
+        return self._assign_upserted_ids(query_filters, data, upserted_ids, documents)
+
     def delete(
         self,
         query_filters: Dict[str, Any],
     ) -> int:
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.delete_one(query_filters)
+        self._invalidate_cache()
         return result.deleted_count
 
     def delete_many(
@@ -133,4 +294,582 @@ class BaseRepository(RepositoryInterface):
     ) -> int:
         collection = self._db_service.get_collection(self._collection_name)
         result = collection.delete_many(query_filters)
+        self._invalidate_cache()
         return result.deleted_count
+
+    async def afind(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        params = {
+            "limit": limit,
+            "offset": offset,
+            "sort_by": sort_by,
+            "sort_direction": sort_direction,
+            "query_filters": query_filters,
+            "projection_fields": projection_fields,
+        }
+
+        if not self.CACHE_ENABLED:
+            return await self._afind(**params)
+
+        return await self._cache_service.aget_or_set(
+            self._collection_name,
+            "find",
+            params,
+            lambda: self._afind(**params),
+        )
+
+    async def astream(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        sort_by: Optional[str] = None,
+        sort_direction: str = "desc",
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        filters = query_filters or {}
+        projection = projection_fields or {}
+        cursor = collection.find(filters, projection, batch_size=limit)
+
+        if sort_by and sort_direction:
+            cursor = cursor.sort(self._build_sort(sort_by, sort_direction))
+
+        if offset:
+            cursor = cursor.skip(offset)
+
+        cursor = cursor.limit(limit)
+
+        try:
+            async for document in cursor:
+                yield document
+        finally:
+            await cursor.close()
+
+    async def acount(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[int] = None,
+    ) -> int:
+        if not self.CACHE_ENABLED and not cache_ttl:
+            return await self._acount(query_filters)
+
+        return await self._cache_service.aget_or_set(
+            self._collection_name,
+            "count",
+            {"query_filters": query_filters},
+            lambda: self._acount(query_filters),
+            timeout=cache_ttl,
+        )
+
+    async def aestimated_count(self) -> int:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        return await collection.estimated_document_count()
+
+    async def aget_version(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        generation = (
+            await self._cache_service.aget_generation(self._collection_name)
+            if self.CACHE_ENABLED
+            else None
+        )
+        results = await self.aaggregate(self._build_version_pipeline(query_filters))
+        return self._parse_version(generation, results)
+
+    async def aaggregate(
+        self,
+        pipeline: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        cursor = await collection.aggregate(pipeline, batchSize=batch_size)
+
+        try:
+            return await cursor.to_list(length=None)
+        finally:
+            await cursor.close()
+
+    async def astore(
+        self,
+        data: Dict[str, Any],
+    ) -> str:
+        self._prepare_store_data(data, datetime.now(tz=UTC))
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.insert_one(data)
+        await self._ainvalidate_cache()
+        return str(result.inserted_id)
+
+    async def astore_many(
+        self,
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        now = datetime.now(tz=UTC)
+
+        for item in data:
+            self._prepare_store_data(item, now)
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        try:
+            result = await collection.insert_many(data, ordered=ordered)
+        finally:
+            await self._ainvalidate_cache()
+
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+
+    async def aupdate(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> int:
+        self._prepare_update_data(data)
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.update_one(query_filters, {"$set": data})
+        await self._ainvalidate_cache()
+        return result.modified_count
+
+    async def afind_one_and_update(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+        projection_fields: Optional[Dict[str, Any]] = None,
+        return_previous: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        self._prepare_update_data(data)
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.find_one_and_update(
+            query_filters,
+            {"$set": data},
+            projection=projection_fields or {"_id": 1},
+            return_document=(
+                ReturnDocument.BEFORE if return_previous else ReturnDocument.AFTER
+            ),
+        )
+
+        if result is not None:
+            await self._ainvalidate_cache()
+
+        return result
+
+    async def aupsert(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> str:
+        self._prepare_store_data(data, datetime.now(tz=UTC))
+        data.pop("_id", None)
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        params = self._build_upsert_params(query_filters, data)
+
+        try:
+            try:
+                result = await collection.find_one_and_update(**params)
+            except DuplicateKeyError:
+                result = await collection.find_one_and_update(**params)
+        finally:
+            await self._ainvalidate_cache()
+
+        data["_id"] = result["_id"]
+        return str(result["_id"])
+
+    async def aupsert_many(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        ordered: bool = True,
+    ) -> List[str]:
+        operations = self._prepare_upsert_operations(query_filters, data)
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        try:
+            try:
+                result = await collection.bulk_write(operations, ordered=ordered)
+                upserted_ids = dict(result.upserted_ids)
+            except BulkWriteError as e:
+                indexes = self._get_retry_indexes(operations, e, ordered)
+                upserted_ids = self._get_upserted_ids(e)
+
+                try:
+                    result = await collection.bulk_write(
+                        [operations[index] for index in indexes],
+                        ordered=ordered,
+                    )
+                except BulkWriteError as retry_error:
+                    raise self._remap_bulk_error(retry_error, indexes) from e
+
+                for index, upserted_id in result.upserted_ids.items():
+                    upserted_ids[indexes[index]] = upserted_id
+        finally:
+            await self._ainvalidate_cache()
+
+        unresolved = self._get_unresolved_filters(query_filters, upserted_ids)
+        documents = (
+            await collection.find(
+                {"$or": unresolved},
+                self._build_upsert_projection(unresolved),
+            ).to_list(length=None)
+            if unresolved
+            else []
+        )
+
+        return self._assign_upserted_ids(query_filters, data, upserted_ids, documents)
+
+    async def adelete(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.delete_one(query_filters)
+        await self._ainvalidate_cache()
+        return result.deleted_count
+
+    async def adelete_many(
+        self,
+        query_filters: Dict[str, Any],
+    ) -> int:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.delete_many(query_filters)
+        await self._ainvalidate_cache()
+        return result.deleted_count
+
+    def ensure_indexes(self) -> List[str]:
+        if not self.INDEXES:
+            return []
+
+        collection = self._db_service.get_collection(self._collection_name)
+        return collection.create_indexes(self.INDEXES)
+
+    def get_index_drift(self) -> Dict[str, List[str]]:
+        collection = self._db_service.get_collection(self._collection_name)
+        existing = {
+            self._build_index_signature(info["key"], info): name
+            for name, info in collection.index_information().items()
+            if name != "_id_"
+        }
+        declared = {
+            self._build_index_signature(
+                index.document["key"].items(),
+                index.document,
+            ): str(index.document["name"])
+            for index in self.INDEXES
+        }
+        existing_keys = {key for key, _ in existing}
+        declared_keys = {key for key, _ in declared}
+
+        return {
+            "missing": [
+                name for (key, _), name in declared.items() if key not in existing_keys
+            ],
+            "mismatched": [
+                name
+                for signature, name in declared.items()
+                if signature not in existing and signature[0] in existing_keys
+            ],
+            "unexpected": [
+                name for (key, _), name in existing.items() if key not in declared_keys
+            ],
+        }
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _find(
+        self,
+        limit: int,
+        offset: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        query_filters: Optional[Dict[str, Any]],
+        projection_fields: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        collection = self._db_service.get_collection(self._collection_name)
+        filters = query_filters or {}
+        projection = projection_fields or {}
+        cursor = collection.find(filters, projection)
+
+        if sort_by and sort_direction:
+            cursor = cursor.sort(self._build_sort(sort_by, sort_direction))
+
+        if offset:
+            cursor = cursor.skip(offset)
+
+        if limit != 9**100:
+            cursor = cursor.limit(limit)
+
+        return list(cursor)
+
+    def _count(self, query_filters: Optional[Dict[str, Any]]) -> int:
+        collection = self._db_service.get_collection(self._collection_name)
+        filters = query_filters or {}
+        return collection.count_documents(filters)
+
+    async def _afind(
+        self,
+        limit: int,
+        offset: int,
+        sort_by: Optional[str],
+        sort_direction: str,
+        query_filters: Optional[Dict[str, Any]],
+        projection_fields: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        filters = query_filters or {}
+        projection = projection_fields or {}
+        cursor = collection.find(filters, projection)
+
+        if sort_by and sort_direction:
+            cursor = cursor.sort(self._build_sort(sort_by, sort_direction))
+
+        if offset:
+            cursor = cursor.skip(offset)
+
+        if limit != 9**100:
+            cursor = cursor.limit(limit)
+
+        return await cursor.to_list(length=None)
+
+    async def _acount(self, query_filters: Optional[Dict[str, Any]]) -> int:
+        collection = self._db_service.get_async_collection(self._collection_name)
+        filters = query_filters or {}
+        return await collection.count_documents(filters)
+
+    def _prepare_upsert_operations(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+    ) -> List[Union[InsertOne, UpdateOne]]:
+        now = datetime.now(tz=UTC)
+        operations: List[Union[InsertOne, UpdateOne]] = []
+
+        for filters, item in zip(query_filters, data, strict=True):
+            self._prepare_store_data(item, now)
+
+            if filters is None:
+                item.setdefault("_id", ObjectId())
+                operations.append(InsertOne(item))
+            else:
+                item.pop("_id", None)
+                operations.append(
+                    UpdateOne(
+                        filters,
+                        self._build_upsert_pipeline(item),
+                        upsert=True,
+                    )
+                )
+
+        return operations
+
+    def _build_upsert_params(
+        self,
+        query_filters: Dict[str, Any],
+        data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        return {
+            "filter": query_filters,
+            "update": self._build_upsert_pipeline(data),
+            "projection": {"_id": 1},
+            "upsert": True,
+            "return_document": ReturnDocument.AFTER,
+        }
+
+    def _build_upsert_pipeline(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        created_at = data["created_at"]
+        is_newer = {
+            "$gte": [created_at, {"$ifNull": ["$created_at", created_at]}],
+        }
+
+        return [
+            {
+                "$replaceWith": {
+                    "$cond": [
+                        is_newer,
+                        {"$mergeObjects": [{"_id": "$_id"}, {"$literal": data}]},
+                        "$$ROOT",
+                    ]
+                }
+            }
+        ]
+
+    def _get_retry_indexes(
+        self,
+        operations: List[Union[InsertOne, UpdateOne]],
+        error: BulkWriteError,
+        ordered: bool,
+    ) -> List[int]:
+        write_errors = error.details.get("writeErrors", [])
+        failed = [item["index"] for item in write_errors]
+        is_retryable = bool(failed) and all(
+            item.get("code") == self.DUPLICATE_KEY_ERROR
+            and isinstance(operations[item["index"]], UpdateOne)
+            for item in write_errors
+        )
+
+        if not is_retryable:
+            raise error
+
+        if ordered:
+            return list(range(min(failed), len(operations)))
+
+        return sorted(failed)
+
+    def _get_unresolved_filters(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        upserted_ids: Dict[int, Any],
+    ) -> List[Dict[str, Any]]:
+        return [
+            filters
+            for index, filters in enumerate(query_filters)
+            if filters is not None and index not in upserted_ids
+        ]
+
+    def _assign_upserted_ids(
+        self,
+        query_filters: List[Optional[Dict[str, Any]]],
+        data: List[Dict[str, Any]],
+        upserted_ids: Dict[int, Any],
+        documents: List[Dict[str, Any]],
+    ) -> List[str]:
+        for index, (filters, item) in enumerate(zip(query_filters, data, strict=True)):
+            if filters is None:
+                continue
+
+            if index in upserted_ids:
+                item["_id"] = upserted_ids[index]
+                continue
+
+            for document in documents:
+                if all(document.get(key) == value for key, value in filters.items()):
+                    item["_id"] = document["_id"]
+                    break
+
+        return [str(item["_id"]) for item in data]
+
+    def _build_version_pipeline(
+        self,
+        query_filters: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"$match": query_filters or {}},
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "last_modified": {"$max": "$updated_at"},
+                }
+            },
+        ]
+
+    def _parse_version(
+        self,
+        generation: Optional[int],
+        results: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        version = results[0] if results else {}
+
+        return {
+            "generation": generation,
+            "count": version.get("count", 0),
+            "last_modified": version.get("last_modified"),
+        }
+
+    def _build_sort(self, sort_by: str, sort_direction: str) -> List[Tuple[str, int]]:
+        direction = -1 if sort_direction == "desc" else 1
+        sort = [(sort_by, direction)]
+
+        if sort_by != "_id":
+            sort.append(("_id", direction))
+
+        return sort
+
+    def _invalidate_cache(self) -> None:
+        if self.CACHE_ENABLED:
+            self._cache_service.invalidate(self._collection_name)
+
+    async def _ainvalidate_cache(self) -> None:
+        if self.CACHE_ENABLED:
+            await self._cache_service.ainvalidate(self._collection_name)
+
+    def _prepare_store_data(self, data: Dict[str, Any], now: datetime) -> None:
+        for key in ("created_at", "updated_at"):
+            if key in data and not isinstance(data[key], datetime):
+                timestamp = data[key]
+                timestamp = float(timestamp if timestamp is not None else 0)
+                data[key] = datetime.fromtimestamp(timestamp, tz=UTC)
+            elif key not in data:
+                data[key] = now
+
+    def _prepare_update_data(self, data: Dict[str, Any]) -> None:
+        if "updated_at" in data and not isinstance(data["updated_at"], datetime):
+            updated_at = data["updated_at"]
+            updated_at = float(updated_at if updated_at is not None else 0)
+            data["updated_at"] = datetime.fromtimestamp(updated_at, tz=UTC)
+        elif "updated_at" not in data:
+            data["updated_at"] = datetime.now(tz=UTC)
+
+    # Helpers
+    def _get_upserted_ids(self, error: BulkWriteError) -> Dict[int, Any]:
+        return {
+            item["index"]: item["_id"] for item in error.details.get("upserted", [])
+        }
+
+    def _remap_bulk_error(
+        self,
+        error: BulkWriteError,
+        indexes: List[int],
+    ) -> BulkWriteError:
+        details = dict(error.details)
+        details["writeErrors"] = [
+            {**item, "index": indexes[item["index"]]}
+            for item in details.get("writeErrors", [])
+        ]
+        return BulkWriteError(details)
+
+    def _build_upsert_projection(
+        self,
+        query_filters: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        return {key: 1 for filters in query_filters for key in filters}
+
+    def _build_index_signature(
+        self,
+        key: Any,
+        spec: Mapping[str, Any],
+    ) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[Tuple[str, str], ...]]:
+        return self._build_index_key(key), self._build_index_options(spec)
+
+    def _build_index_key(self, key: Any) -> Tuple[Tuple[str, Any], ...]:
+        return tuple(
+            (field, int(direction) if isinstance(direction, float) else direction)
+            for field, direction in key
+        )
+
+    def _build_index_options(
+        self,
+        spec: Mapping[str, Any],
+    ) -> Tuple[Tuple[str, str], ...]:
+        return tuple(
+            (option, json_util.dumps(spec[option], sort_keys=True))
+            for option in self.INDEX_OPTIONS
+            if spec.get(option) is not None and spec.get(option) is not False
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # GETTERS
+    # ───────────────────────────────────────────────────────────
+    @property
+    def collection_name(self) -> str:
+        return self._collection_name
@@ -1,6 +1,137 @@
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
 from apps.core.repositories.base import BaseRepository
+from apps.core.validators.order_statistics import OrderStatisticsQuery
 
 
 class OrderRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [
+                ("backtest_id", ASCENDING),
+                ("backtest", ASCENDING),
+                ("created_at", ASCENDING),
+                ("_id", ASCENDING),
+            ]
+        ),
+        IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+    ]
+    SUMMARY_FACET: str = "summary"
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="orders")
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_statistics(self, query: OrderStatisticsQuery) -> Dict[str, Any]:
+        results = self.aggregate(self._build_statistics_pipeline(query))
+        return self._parse_statistics(query, results)
+
+    async def aget_statistics(self, query: OrderStatisticsQuery) -> Dict[str, Any]:
+        results = await self.aaggregate(self._build_statistics_pipeline(query))
+        return self._parse_statistics(query, results)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _build_statistics_pipeline(
+        self,
+        query: OrderStatisticsQuery,
+    ) -> List[Dict[str, Any]]:
+        facets = {self.SUMMARY_FACET: self._build_statistics_facet(None)}
+
+        for group in query.group_by:
+            facets[str(group)] = self._build_statistics_facet(str(group))
+
+        return [
+            {
+                "$match": {
+                    "backtest_id": query.backtest_id,
+                    "backtest": query.backtest,
+                }
+            },
+            {"$facet": facets},
+        ]
+
+    def _build_statistics_facet(self, group: Optional[str]) -> List[Dict[str, Any]]:
+        is_closed = {"$isNumber": "$profit"}
+        is_win = {"$and": [is_closed, {"$gt": ["$profit", 0]}]}
+        is_loss = {"$and": [is_closed, {"$lt": ["$profit", 0]}]}
+        stages: List[Dict[str, Any]] = [
+            {
+                "$group": {
+                    "_id": f"${group}" if group else None,
+                    "orders": {"$sum": 1},
+                    "trades": {"$sum": {"$cond": [is_closed, 1, 0]}},
+                    "wins": {"$sum": {"$cond": [is_win, 1, 0]}},
+                    "losses": {"$sum": {"$cond": [is_loss, 1, 0]}},
+                    "gross_profit": {"$sum": {"$cond": [is_win, "$profit", 0]}},
+                    "gross_loss": {
+                        "$sum": {"$cond": [is_loss, {"$abs": "$profit"}, 0]}
+                    },
+                    "average_profit_percentage": {"$avg": "$profit_percentage"},
+                    "volume": {"$sum": "$volume"},
+                    "executed_volume": {"$sum": "$executed_volume"},
+                }
+            },
+            {
+                "$project": {
+                    "_id": 0,
+                    **({group: "$_id"} if group else {}),
+                    "orders": 1,
+                    "trades": 1,
+                    "wins": 1,
+                    "losses": 1,
+                    "win_rate": self._build_ratio("$wins", "$trades"),
+                    "gross_profit": 1,
+                    "gross_loss": 1,
+                    "net_profit": {"$subtract": ["$gross_profit", "$gross_loss"]},
+                    "profit_factor": self._build_ratio(
+                        "$gross_profit",
+                        "$gross_loss",
+                    ),
+                    "average_profit_percentage": 1,
+                    "volume": 1,
+                    "executed_volume": 1,
+                }
+            },
+        ]
+
+        if group:
+            stages.append({"$sort": {"volume": DESCENDING, group: ASCENDING}})
+
+        return stages
+
+    def _parse_statistics(
+        self,
+        query: OrderStatisticsQuery,
+        results: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        facets = results[0] if results else {}
+        summary = facets.get(self.SUMMARY_FACET) or [None]
+
+        return {
+            self.SUMMARY_FACET: summary[0],
+            "groups": {
+                str(group): facets.get(str(group), []) for group in query.group_by
+            },
+        }
+
+    # Helpers
+    def _build_ratio(self, numerator: str, denominator: str) -> Dict[str, Any]:
+        return {
+            "$cond": [
+                {"$gt": [denominator, 0]},
+                {"$divide": [numerator, denominator]},
+                None,
+            ]
+        }
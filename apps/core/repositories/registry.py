@@ -0,0 +1,18 @@
+from typing import List
+
+from apps.core.repositories.backtest import BacktestRepository
+from apps.core.repositories.base import BaseRepository
+from apps.core.repositories.order import OrderRepository
+from apps.core.repositories.report import ReportRepository
+from apps.core.repositories.snapshot import SnapshotRepository
+from apps.core.repositories.strategy_metrics import StrategyMetricsRepository
+
+
+def get_repositories() -> List[BaseRepository]:
+    return [
+        BacktestRepository(),
+        OrderRepository(),
+        ReportRepository(),
+        SnapshotRepository(),
+        StrategyMetricsRepository(),
+    ]
@@ -1,6 +1,23 @@
+from typing import ClassVar, List
+
+from pymongo import ASCENDING, IndexModel
+
 from apps.core.repositories.base import BaseRepository
 
 
 class ReportRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    CACHE_ENABLED: ClassVar[bool] = True
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel([("backtest_id", ASCENDING)]),
+        IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)]),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="reports")
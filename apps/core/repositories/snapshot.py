@@ -1,6 +1,36 @@
+from typing import ClassVar, List
+
+from pymongo import ASCENDING, IndexModel
+
 from apps.core.repositories.base import BaseRepository
 
 
 class SnapshotRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [
+                ("backtest_id", ASCENDING),
+                ("created_at", ASCENDING),
+                ("_id", ASCENDING),
+            ]
+        ),
+        IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel(
+            [
+                ("backtest_id", ASCENDING),
+                ("strategy_id", ASCENDING),
+                ("coalesce_bucket", ASCENDING),
+            ],
+            unique=True,
+            partialFilterExpression={"coalesce_bucket": {"$exists": True}},
+        ),
+    ]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
     def __init__(self) -> None:
         super().__init__(collection_name="snapshots")
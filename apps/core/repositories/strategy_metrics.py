@@ -0,0 +1,397 @@
+from datetime import UTC, datetime
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from apps.core.repositories.base import BaseRepository
+
+MILLISECONDS_PER_YEAR = 365.25 * 24 * 60 * 60 * 1000
+
+
+class StrategyMetricsRepository(BaseRepository):
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel(
+            [("backtest_id", ASCENDING), ("strategy_id", ASCENDING)],
+            unique=True,
+        ),
+        IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("updated_at", ASCENDING), ("_id", ASCENDING)]),
+    ]
+    STATE_FIELDS: ClassVar[Dict[str, Any]] = {
+        "count": 0,
+        "returns_count": 0,
+        "returns_mean": 0,
+        "returns_m2": 0,
+        "downside_m2": 0,
+        "first_at": None,
+        "last_at": None,
+        "nav": None,
+        "nav_peak": None,
+        "max_drawdown": 0,
+    }
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        super().__init__(collection_name="strategy_metrics")
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def accumulate(self, snapshots: List[Dict[str, Any]]) -> int:
+        if not snapshots:
+            return 0
+
+        collection = self._db_service.get_collection(self._collection_name)
+        result = collection.bulk_write(self._build_operations(snapshots))
+        return result.upserted_count + result.modified_count
+
+    async def aaccumulate(self, snapshots: List[Dict[str, Any]]) -> int:
+        if not snapshots:
+            return 0
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        result = await collection.bulk_write(self._build_operations(snapshots))
+        return result.upserted_count + result.modified_count
+
+    def mark_stale(self, snapshots: List[Dict[str, Any]]) -> None:
+        if not snapshots:
+            return
+
+        collection = self._db_service.get_collection(self._collection_name)
+        collection.bulk_write(self._build_stale_operations(snapshots), ordered=False)
+
+    async def amark_stale(self, snapshots: List[Dict[str, Any]]) -> None:
+        if not snapshots:
+            return
+
+        collection = self._db_service.get_async_collection(self._collection_name)
+        await collection.bulk_write(
+            self._build_stale_operations(snapshots),
+            ordered=False,
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _build_stale_operations(
+        self,
+        snapshots: List[Dict[str, Any]],
+    ) -> List[UpdateOne]:
+        now = datetime.now(tz=UTC)
+        keys = dict.fromkeys(
+            (snapshot["backtest_id"], snapshot["strategy_id"]) for snapshot in snapshots
+        )
+
+        return [
+            UpdateOne(
+                {"backtest_id": backtest_id, "strategy_id": strategy_id},
+                {
+                    "$set": {"stale": True, "updated_at": now},
+                    "$setOnInsert": {"created_at": now},
+                },
+                upsert=True,
+            )
+            for backtest_id, strategy_id in keys
+        ]
+
+    def _build_operations(self, snapshots: List[Dict[str, Any]]) -> List[UpdateOne]:
+        now = datetime.now(tz=UTC)
+
+        return [
+            UpdateOne(
+                {
+                    "backtest_id": snapshot["backtest_id"],
+                    "strategy_id": snapshot["strategy_id"],
+                },
+                self._build_pipeline(
+                    float(snapshot["nav"]),
+                    snapshot["created_at"],
+                    snapshot.get("coalesce_bucket"),
+                    now,
+                ),
+                upsert=True,
+            )
+            for snapshot in snapshots
+        ]
+
+    def _build_pipeline(
+        self,
+        nav: float,
+        at: datetime,
+        bucket: Optional[int],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        has_return = {"$ne": ["$_return", None]}
+        is_folded = {"$in": ["$_mode", ["advance", "restore"]]}
+
+        return [
+            {
+                "$set": {
+                    "_mode": self._build_mode(at, bucket),
+                    "_original": "$$ROOT",
+                }
+            },
+            {
+                "$replaceWith": {
+                    "$cond": [
+                        {"$eq": ["$_mode", "restore"]},
+                        {"$mergeObjects": ["$$ROOT", "$previous"]},
+                        "$$ROOT",
+                    ]
+                }
+            },
+            {
+                "$set": {
+                    "previous": {
+                        "$cond": [
+                            {"$eq": ["$_mode", "advance"]},
+                            {
+                                field: {"$ifNull": [f"${field}", default]}
+                                for field, default in self.STATE_FIELDS.items()
+                            },
+                            "$previous",
+                        ]
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "_is_newer": {"$gte": [at, {"$ifNull": ["$last_at", at]}]},
+                    "_return": {
+                        "$cond": [
+                            {
+                                "$and": [
+                                    {"$gt": [{"$ifNull": ["$nav", 0]}, 0]},
+                                    {"$gt": [at, {"$ifNull": ["$last_at", at]}]},
+                                ]
+                            },
+                            {"$subtract": [{"$divide": [nav, "$nav"]}, 1]},
+                            None,
+                        ]
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "count": {"$add": [{"$ifNull": ["$count", 0]}, 1]},
+                    "returns_count": {
+                        "$add": [
+                            {"$ifNull": ["$returns_count", 0]},
+                            {"$cond": [has_return, 1, 0]},
+                        ]
+                    },
+                    "_delta": {
+                        "$cond": [
+                            has_return,
+                            {
+                                "$subtract": [
+                                    "$_return",
+                                    {"$ifNull": ["$returns_mean", 0]},
+                                ]
+                            },
+                            0,
+                        ]
+                    },
+                    "first_at": {"$min": [{"$ifNull": ["$first_at", at]}, at]},
+                    "last_at": {"$max": [{"$ifNull": ["$last_at", at]}, at]},
+                    "nav": {"$cond": ["$_is_newer", nav, "$nav"]},
+                    "nav_peak": {"$max": [{"$ifNull": ["$nav_peak", nav]}, nav]},
+                    "created_at": {"$ifNull": ["$created_at", now]},
+                    "updated_at": now,
+                }
+            },
+            {
+                "$set": {
+                    "returns_mean": {
+                        "$add": [
+                            {"$ifNull": ["$returns_mean", 0]},
+                            {
+                                "$cond": [
+                                    has_return,
+                                    {"$divide": ["$_delta", "$returns_count"]},
+                                    0,
+                                ]
+                            },
+                        ]
+                    },
+                    "drawdown": {
+                        "$cond": [
+                            {"$gt": ["$nav_peak", 0]},
+                            {"$subtract": [{"$divide": ["$nav", "$nav_peak"]}, 1]},
+                            0,
+                        ]
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "returns_m2": {
+                        "$add": [
+                            {"$ifNull": ["$returns_m2", 0]},
+                            {
+                                "$cond": [
+                                    has_return,
+                                    {
+                                        "$multiply": [
+                                            "$_delta",
+                                            {
+                                                "$subtract": [
+                                                    "$_return",
+                                                    "$returns_mean",
+                                                ]
+                                            },
+                                        ]
+                                    },
+                                    0,
+                                ]
+                            },
+                        ]
+                    },
+                    "downside_m2": {
+                        "$add": [
+                            {"$ifNull": ["$downside_m2", 0]},
+                            {
+                                "$cond": [
+                                    {"$and": [has_return, {"$lt": ["$_return", 0]}]},
+                                    {"$multiply": ["$_return", "$_return"]},
+                                    0,
+                                ]
+                            },
+                        ]
+                    },
+                    "max_drawdown": {
+                        "$min": [{"$ifNull": ["$max_drawdown", 0]}, "$drawdown"]
+                    },
+                    "_periods_per_year": {
+                        "$cond": [
+                            {"$gt": ["$last_at", "$first_at"]},
+                            {
+                                "$divide": [
+                                    {
+                                        "$multiply": [
+                                            "$returns_count",
+                                            MILLISECONDS_PER_YEAR,
+                                        ]
+                                    },
+                                    {"$subtract": ["$last_at", "$first_at"]},
+                                ]
+                            },
+                            1,
+                        ]
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "volatility": {
+                        "$cond": [
+                            {"$gt": ["$returns_count", 1]},
+                            {
+                                "$sqrt": {
+                                    "$divide": [
+                                        "$returns_m2",
+                                        {"$subtract": ["$returns_count", 1]},
+                                    ]
+                                }
+                            },
+                            0,
+                        ]
+                    },
+                    "downside_deviation": {
+                        "$cond": [
+                            {"$gt": ["$returns_count", 0]},
+                            {"$sqrt": {"$divide": ["$downside_m2", "$returns_count"]}},
+                            0,
+                        ]
+                    },
+                }
+            },
+            {
+                "$set": {
+                    "sharpe_ratio": self._build_ratio("$volatility"),
+                    "sortino_ratio": self._build_ratio("$downside_deviation"),
+                }
+            },
+            {
+                "$set": {
+                    "last_bucket": bucket,
+                    "max_bucket": (
+                        "$max_bucket"
+                        if bucket is None
+                        else {"$max": [{"$ifNull": ["$max_bucket", bucket]}, bucket]}
+                    ),
+                }
+            },
+            {
+                "$replaceWith": {
+                    "$switch": {
+                        "branches": [
+                            {"case": is_folded, "then": "$$ROOT"},
+                            {
+                                "case": {"$eq": ["$_mode", "stale"]},
+                                "then": {
+                                    "$mergeObjects": [
+                                        "$_original",
+                                        {"stale": True, "updated_at": now},
+                                    ]
+                                },
+                            },
+                        ],
+                        "default": "$_original",
+                    }
+                }
+            },
+            {
+                "$unset": [
+                    "_mode",
+                    "_original",
+                    "_is_newer",
+                    "_return",
+                    "_delta",
+                    "_periods_per_year",
+                ]
+            },
+        ]
+
+    def _build_mode(self, at: datetime, bucket: Optional[int]) -> Dict[str, Any]:
+        is_late = {"$lt": [at, {"$ifNull": ["$last_at", at]}]}
+
+        if bucket is None:
+            return {"$cond": [is_late, "stale", "advance"]}
+
+        return {
+            "$switch": {
+                "branches": [
+                    {
+                        "case": {"$eq": ["$last_bucket", bucket]},
+                        "then": {"$cond": [is_late, "skip", "restore"]},
+                    },
+                    {
+                        "case": {"$lte": [bucket, {"$ifNull": ["$max_bucket", None]}]},
+                        "then": "stale",
+                    },
+                    {"case": is_late, "then": "stale"},
+                ],
+                "default": "advance",
+            }
+        }
+
+    # Helpers
+    def _build_ratio(self, deviation: str) -> Dict[str, Any]:
+        return {
+            "$cond": [
+                {"$gt": [deviation, 0]},
+                {
+                    "$multiply": [
+                        {"$divide": ["$returns_mean", deviation]},
+                        {"$sqrt": "$_periods_per_year"},
+                    ]
+                },
+                0,
+            ]
+        }
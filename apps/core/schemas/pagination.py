@@ -38,7 +38,43 @@ def pagination_schema() -> List[OpenApiParameter]:
             name="filter_by",
             type=str,
             location=OpenApiParameter.QUERY,
-            description="Filter by field (format: column:value)",
+            description=(
+                "Filter by field (format: field:operator:value, operator one of "
+                "eq, in, gt, gte, lt, lte, prefix; field:value means eq). "
+                "Repeat to combine filters with AND; in takes comma separated values"
+            ),
+            required=False,
+            many=True,
+        ),
+        OpenApiParameter(
+            name="cursor",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Opaque token from pagination.next_cursor, "
+                "resumes after the last item instead of using page"
+            ),
+            required=False,
+        ),
+        OpenApiParameter(
+            name="include_total",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Whether to count matching items. Unfiltered totals are estimated "
+                "and filtered totals are cached briefly"
+            ),
+            default="true",
+            enum=["true", "false"],
+        ),
+        OpenApiParameter(
+            name="fields",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Comma separated fields to return. _id and the sort field are "
+                "always included"
+            ),
             required=False,
         ),
     ]
@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from bson import json_util
+from django.conf import settings
+from django.core.cache import cache
+
+
+class CacheService:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _instance: Optional["CacheService"] = None
+    _lock: threading.Lock
+    _stats: Dict[str, int]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __new__(cls) -> "CacheService":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._lock = threading.Lock()
+            cls._instance._stats = {
+                "hits": 0,
+                "misses": 0,
+                "invalidations": 0,
+                "errors": 0,
+            }
+        return cls._instance
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_or_set(
+        self,
+        namespace: str,
+        operation: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Any],
+        timeout: Optional[int] = None,
+    ) -> Any:
+        logger = logging.getLogger("django")
+
+        try:
+            generation = cache.get(self._build_generation_key(namespace), 0)
+            key = self._build_key(namespace, generation, operation, params)
+            cached = cache.get(key)
+        except Exception as e:
+            logger.error(f"Failed to read cache for {namespace}: {e}")
+            self._increment("errors")
+            return fetch()
+
+        if cached is not None:
+            self._increment("hits")
+            return cached["value"]
+
+        self._increment("misses")
+        value = fetch()
+
+        try:
+            cache.set(key, {"value": value}, self._get_timeout(timeout))
+        except Exception as e:
+            logger.error(f"Failed to write cache for {namespace}: {e}")
+            self._increment("errors")
+
+        return value
+
+    async def aget_or_set(
+        self,
+        namespace: str,
+        operation: str,
+        params: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+        timeout: Optional[int] = None,
+    ) -> Any:
+        logger = logging.getLogger("django")
+
+        try:
+            generation = await cache.aget(self._build_generation_key(namespace), 0)
+            key = self._build_key(namespace, generation, operation, params)
+            cached = await cache.aget(key)
+        except Exception as e:
+            logger.error(f"Failed to read cache for {namespace}: {e}")
+            self._increment("errors")
+            return await fetch()
+
+        if cached is not None:
+            self._increment("hits")
+            return cached["value"]
+
+        self._increment("misses")
+        value = await fetch()
+
+        try:
+            await cache.aset(key, {"value": value}, self._get_timeout(timeout))
+        except Exception as e:
+            logger.error(f"Failed to write cache for {namespace}: {e}")
+            self._increment("errors")
+
+        return value
+
+    def invalidate(self, namespace: str) -> None:
+        logger = logging.getLogger("django")
+        generation_key = self._build_generation_key(namespace)
+
+        try:
+            if not cache.add(generation_key, 1, timeout=None):
+                cache.incr(generation_key)
+        except Exception as e:
+            logger.error(f"Failed to invalidate cache for {namespace}: {e}")
+            self._increment("errors")
+            return
+
+        self._increment("invalidations")
+
+    async def ainvalidate(self, namespace: str) -> None:
+        logger = logging.getLogger("django")
+        generation_key = self._build_generation_key(namespace)
+
+        try:
+            if not await cache.aadd(generation_key, 1, timeout=None):
+                await cache.aincr(generation_key)
+        except Exception as e:
+            logger.error(f"Failed to invalidate cache for {namespace}: {e}")
+            self._increment("errors")
+            return
+
+        self._increment("invalidations")
+
+    def get_generation(self, namespace: str) -> Optional[int]:
+        logger = logging.getLogger("django")
+
+        try:
+            return cache.get(self._build_generation_key(namespace), 0)
+        except Exception as e:
+            logger.error(f"Failed to read cache generation for {namespace}: {e}")
+            self._increment("errors")
+            return None
+
+    async def aget_generation(self, namespace: str) -> Optional[int]:
+        logger = logging.getLogger("django")
+
+        try:
+            return await cache.aget(self._build_generation_key(namespace), 0)
+        except Exception as e:
+            logger.error(f"Failed to read cache generation for {namespace}: {e}")
+            self._increment("errors")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / lookups, 4) if lookups else None
+
+        return stats
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _increment(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    # Helpers
+    def _get_timeout(self, timeout: Optional[int]) -> int:
+        return settings.READ_CACHE_TTL if timeout is None else timeout
+
+    def _build_generation_key(self, namespace: str) -> str:
+        return f"reads:{namespace}:generation"
+
+    def _build_key(
+        self,
+        namespace: str,
+        generation: int,
+        operation: str,
+        params: Dict[str, Any],
+    ) -> str:
+        payload = json_util.dumps(params, sort_keys=True)
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"reads:{namespace}:{generation}:{operation}:{digest}"
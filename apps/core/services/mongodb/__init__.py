@@ -1,9 +1,14 @@
-from typing import Any, Optional
+import asyncio
+import os
+from typing import Any, Dict, Optional, Tuple
 
 from django.conf import settings
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
 
+from apps.core.services.mongodb.listeners import PoolStatsListener
+
 
 class MongoDBService:
     # ───────────────────────────────────────────────────────────
@@ -12,6 +17,12 @@ class MongoDBService:
     _instance: Optional["MongoDBService"] = None
     _connection: Optional[MongoClient] = None
     _database: Optional[Database] = None
+    _async_connections: Dict[
+        asyncio.AbstractEventLoop,
+        Tuple[AsyncMongoClient, AsyncDatabase, PoolStatsListener],
+    ]
+    _pool_listener: Optional[PoolStatsListener] = None
+    _pid: Optional[int] = None
 
     # ───────────────────────────────────────────────────────────
     # CONSTRUCTOR
@@ -22,14 +33,14 @@ class MongoDBService:
         return cls._instance
 
     def __init__(self) -> None:
-        if self._connection is None:
+        if self._connection is None or self._pid != os.getpid():
             self._connect()
 
     # ───────────────────────────────────────────────────────────
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     def get_collection(self, collection_name: str) -> Any:
-        if self._database is None:
+        if self._database is None or self._pid != os.getpid():
             self._connect()
 
         if self._database is None:
@@ -37,6 +48,27 @@ class MongoDBService:
 
         return self._database[collection_name]
 
+    def get_async_collection(self, collection_name: str) -> Any:
+        loop = asyncio.get_running_loop()
+
+        if loop not in self._async_connections or self._pid != os.getpid():
+            self._connect_async(loop)
+
+        _, database, _ = self._async_connections[loop]
+        return database[collection_name]
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        mongodb_config = settings.DATABASES["mongodb"]
+        async_listener = self._get_async_listener()
+
+        return {
+            "pid": self._pid,
+            "max_pool_size": mongodb_config.get("MAX_POOL_SIZE"),
+            "min_pool_size": mongodb_config.get("MIN_POOL_SIZE"),
+            "sync": self._pool_listener.get_stats() if self._pool_listener else {},
+            "async": async_listener.get_stats() if async_listener else {},
+        }
+
     # ───────────────────────────────────────────────────────────
     # PRIVATE METHODS
     # ───────────────────────────────────────────────────────────
@@ -44,12 +76,85 @@ class MongoDBService:
         mongodb_config = settings.DATABASES["mongodb"]
 
         db_name = mongodb_config["DB_NAME"]
+
+        self._pid = os.getpid()
+        self._pool_listener = PoolStatsListener()
+        self._async_connections = {}
+        self._connection = MongoClient(
+            self._build_uri(mongodb_config),
+            event_listeners=[self._pool_listener],
+            **self._build_client_options(mongodb_config),
+        )
+        self._database = self._connection[db_name]
+
+    def _connect_async(self, loop: asyncio.AbstractEventLoop) -> None:
+        mongodb_config = settings.DATABASES["mongodb"]
+
+        db_name = mongodb_config["DB_NAME"]
+
+        if self._pid != os.getpid():
+            self._connect()
+
+        self._release_async_connections()
+
+        pool_listener = PoolStatsListener()
+        connection = AsyncMongoClient(
+            self._build_uri(mongodb_config),
+            event_listeners=[pool_listener],
+            **self._build_client_options(mongodb_config),
+        )
+        self._async_connections[loop] = (
+            connection,
+            connection[db_name],
+            pool_listener,
+        )
+
+    def _release_async_connections(self) -> None:
+        for loop in list(self._async_connections):
+            if loop.is_closed():
+                self._async_connections.pop(loop)
+
+    def _get_async_listener(self) -> Optional[PoolStatsListener]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        _, _, pool_listener = self._async_connections.get(loop, (None, None, None))
+        return pool_listener
+
+    # Helpers
+    def _build_uri(self, mongodb_config: Dict[str, Any]) -> str:
+        if mongodb_config.get("URI"):
+            return str(mongodb_config["URI"])
+
         db_user = mongodb_config["DB_USER"]
         db_password = mongodb_config["DB_PASSWORD"]
         db_host = mongodb_config["DB_HOST"]
         db_port = mongodb_config["DB_PORT"]
 
-        uri = f"mongodb://{db_user}:{db_password}@{db_host}:{db_port}/"
+        return f"mongodb://{db_user}:{db_password}@{db_host}:{db_port}/"
 
-        self._connection = MongoClient(uri)
-        self._database = self._connection[db_name]
+    def _build_client_options(self, mongodb_config: Dict[str, Any]) -> Dict[str, Any]:
+        options = {
+            "maxPoolSize": mongodb_config.get("MAX_POOL_SIZE"),
+            "minPoolSize": mongodb_config.get("MIN_POOL_SIZE"),
+            "maxIdleTimeMS": mongodb_config.get("MAX_IDLE_TIME_MS"),
+            "waitQueueTimeoutMS": mongodb_config.get("WAIT_QUEUE_TIMEOUT_MS"),
+            "connectTimeoutMS": mongodb_config.get("CONNECT_TIMEOUT_MS"),
+            "serverSelectionTimeoutMS": mongodb_config.get(
+                "SERVER_SELECTION_TIMEOUT_MS"
+            ),
+            "socketTimeoutMS": mongodb_config.get("SOCKET_TIMEOUT_MS"),
+            "compressors": mongodb_config.get("COMPRESSORS"),
+            "readConcernLevel": mongodb_config.get("READ_CONCERN"),
+            "w": self._parse_write_concern(mongodb_config.get("WRITE_CONCERN")),
+        }
+
+        return {key: value for key, value in options.items() if value is not None}
+
+    def _parse_write_concern(self, write_concern: Optional[str]) -> Any:
+        if not write_concern:
+            return None
+
+        return int(write_concern) if write_concern.isdigit() else write_concern
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Any
+
+from bson import ObjectId
+from bson.codec_options import (
+    CodecOptions,
+    DatetimeConversion,
+    TypeDecoder,
+    TypeRegistry,
+)
+
+
+class ObjectIdStringDecoder(TypeDecoder):
+    bson_type = ObjectId
+
+    def transform_bson(self, value: Any) -> str:
+        return str(value)
+
+
+class DatetimeStringDecoder(TypeDecoder):
+    bson_type = datetime
+
+    def transform_bson(self, value: Any) -> str:
+        return value.isoformat()
+
+
+STRING_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    type_registry=TypeRegistry(
+        [
+            ObjectIdStringDecoder(),
+            DatetimeStringDecoder(),
+        ]
+    )
+)
+
+DATETIME_MS_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    datetime_conversion=DatetimeConversion.DATETIME_MS,
+)
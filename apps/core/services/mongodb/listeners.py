@@ -0,0 +1,90 @@
+import threading
+from typing import Dict
+
+from pymongo import monitoring
+
+
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _lock: threading.Lock
+    _stats: Dict[str, int]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = {
+            "pools_created": 0,
+            "pools_cleared": 0,
+            "pools_closed": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "connections_open": 0,
+            "connections_checked_out": 0,
+            "check_outs": 0,
+            "check_out_failures": 0,
+        }
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def pool_created(self, _event: monitoring.PoolCreatedEvent) -> None:
+        self._increment("pools_created")
+
+    def pool_ready(self, _event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, _event: monitoring.PoolClearedEvent) -> None:
+        self._increment("pools_cleared")
+
+    def pool_closed(self, _event: monitoring.PoolClosedEvent) -> None:
+        self._increment("pools_closed")
+
+    def connection_created(self, _event: monitoring.ConnectionCreatedEvent) -> None:
+        self._increment("connections_created")
+        self._increment("connections_open")
+
+    def connection_ready(self, _event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, _event: monitoring.ConnectionClosedEvent) -> None:
+        self._increment("connections_closed")
+        self._increment("connections_open", -1)
+
+    def connection_check_out_started(
+        self,
+        _event: monitoring.ConnectionCheckOutStartedEvent,
+    ) -> None:
+        pass
+
+    def connection_check_out_failed(
+        self,
+        _event: monitoring.ConnectionCheckOutFailedEvent,
+    ) -> None:
+        self._increment("check_out_failures")
+
+    def connection_checked_out(
+        self,
+        _event: monitoring.ConnectionCheckedOutEvent,
+    ) -> None:
+        self._increment("check_outs")
+        self._increment("connections_checked_out")
+
+    def connection_checked_in(
+        self, _event: monitoring.ConnectionCheckedInEvent
+    ) -> None:
+        self._increment("connections_checked_out", -1)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _increment(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
@@ -1,3 +1,4 @@
 from .make_backtest_report import make_backtest_report
+from .purge_backtest import purge_backtest, resume_backtest_purges
 
-__all__ = ["make_backtest_report"]
+__all__ = ["make_backtest_report", "purge_backtest", "resume_backtest_purges"]
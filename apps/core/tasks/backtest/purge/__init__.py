@@ -0,0 +1,146 @@
+import logging
+import shutil
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from django.conf import settings
+
+from apps.core.enums.backtest_status import BacktestStatus
+from apps.core.models.backtest import BacktestModel
+from apps.core.models.base import BaseModel
+from apps.core.models.order import OrderModel
+from apps.core.models.report import ReportModel
+from apps.core.models.snapshot import SnapshotModel
+from apps.core.models.strategy_metrics import StrategyMetricsModel
+
+logger = logging.getLogger("django")
+
+
+class BacktestPurgeTask:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _name: str = "purge_backtest"
+    _backtest_id: str
+    _backtest: Optional[Dict[str, Any]]
+    _progress: Dict[str, int]
+    _batch_size: int
+    _throttle_seconds: float
+    _on_progress: Optional[Callable[[Dict[str, int]], None]]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(
+        self,
+        backtest_id: str,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+    ) -> None:
+        self._backtest_id = backtest_id
+        self._backtest = None
+        self._on_progress = on_progress
+        self._batch_size = settings.BACKTEST_PURGE["BATCH_SIZE"]
+        self._throttle_seconds = settings.BACKTEST_PURGE["THROTTLE_SECONDS"]
+        self._backtest_model = BacktestModel()
+        self._report_model = ReportModel()
+        self._reports_folder = Path(settings.BASE_DIR) / "storage" / "reports"
+        self._children: List[Tuple[str, BaseModel]] = [
+            ("reports", self._report_model),
+            ("snapshots", SnapshotModel()),
+            ("strategy_metrics", StrategyMetricsModel()),
+            ("orders", OrderModel()),
+        ]
+        self._progress = {name: 0 for name, _ in self._children}
+        self._setup()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def run(self) -> Dict[str, int]:
+        if not self._backtest:
+            logger.error("Task is not ready")
+            return self._progress
+
+        if self._backtest.get("status") != BacktestStatus.DELETING.value:
+            logger.error(f"Backtest {self._backtest_id} is not marked for deletion")
+            return self._progress
+
+        self._remove_report_folders()
+
+        for name, model in self._children:
+            self._purge(name, model)
+
+        self._backtest_model.delete(
+            query_filters={"_id": ObjectId(self._backtest_id)},
+        )
+
+        logger.info(f"Purged backtest {self._backtest_id}: {self._progress}")
+
+        return self._progress
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _setup(self) -> None:
+        results = self._backtest_model.find(
+            query_filters={"_id": ObjectId(self._backtest_id)},
+            projection_fields={"status": 1, "purge_progress": 1},
+        )
+        self._backtest = results[0] if results else None
+
+        if not self._backtest:
+            logger.error("Failed to find backtest")
+            return
+
+        for name, count in (self._backtest.get("purge_progress") or {}).items():
+            if name in self._progress:
+                self._progress[name] = int(count)
+
+    def _remove_report_folders(self) -> None:
+        reports = self._report_model.stream(
+            query_filters={"backtest_id": self._backtest_id},
+            projection_fields={"_id": 1},
+        )
+
+        for report in reports:
+            folder = self._reports_folder / str(report["_id"])
+
+            if folder.exists():
+                shutil.rmtree(folder)
+
+    def _purge(self, name: str, model: BaseModel) -> None:
+        while True:
+            batch = model.find(
+                limit=self._batch_size,
+                query_filters={"backtest_id": self._backtest_id},
+                projection_fields={"_id": 1},
+            )
+
+            if not batch:
+                return
+
+            self._progress[name] += model.delete_many(
+                query_filters={"_id": {"$in": [item["_id"] for item in batch]}},
+            )
+            self._report_progress()
+
+            if len(batch) < self._batch_size:
+                return
+
+            if self._throttle_seconds > 0:
+                time.sleep(self._throttle_seconds)
+
+    def _report_progress(self) -> None:
+        self._backtest_model.update(
+            query_filters={"_id": ObjectId(self._backtest_id)},
+            data={
+                "purge_progress": dict(self._progress),
+                "purge_heartbeat_at": datetime.now(tz=UTC),
+            },
+        )
+
+        if self._on_progress:
+            self._on_progress(dict(self._progress))
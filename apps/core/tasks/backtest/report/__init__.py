@@ -1,20 +1,59 @@
+import csv
+import json
 import logging
+import os
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Dict, Iterator, Optional, TextIO, Tuple
 
+import numpy as np
+import numpy.typing as npt
 from bson import ObjectId
 from django.conf import settings
 
 from apps.core.enums.report_status import ReportStatus
+from apps.core.helpers import get_metrics_from
 from apps.core.models.backtest import BacktestModel
+from apps.core.models.base import BaseModel
 from apps.core.models.order import OrderModel
 from apps.core.models.report import ReportModel
 from apps.core.models.snapshot import SnapshotModel
+from apps.core.services.mongodb.codecs import STRING_CODEC_OPTIONS
+from apps.core.validators.order_statistics import OrderStatisticsQuery
 
 logger = logging.getLogger("django")
 
 
 class BacktestReportTask:
+    # ───────────────────────────────────────────────────────────
+    # CONSTANTS
+    # ───────────────────────────────────────────────────────────
+    METRICS_FILE: str = "metrics.json"
+    EQUITY_CURVE_FILE: str = "equity_curve.csv"
+    TRADES_FILE: str = "trades.csv"
+    EQUITY_CURVE_POINTS: int = 2000
+    TRADE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "_id",
+        "strategy_id",
+        "symbol",
+        "gateway",
+        "side",
+        "order_type",
+        "status",
+        "volume",
+        "executed_volume",
+        "price",
+        "close_price",
+        "take_profit_price",
+        "stop_loss_price",
+        "profit",
+        "profit_percentage",
+        "created_at",
+        "updated_at",
+    )
+
     # ───────────────────────────────────────────────────────────
     # PROPERTIES
     # ───────────────────────────────────────────────────────────
@@ -22,8 +61,10 @@ class BacktestReportTask:
     _backtest_id: Optional[str]
     _backtest: Optional[Dict[str, Any]]
     _report: Optional[Dict[str, Any]]
-    _orders: List[Dict[str, Any]]
-    _snapshots: List[Dict[str, Any]]
+    _snapshots: Optional[Dict[str, Dict[str, npt.NDArray[Any]]]]
+    _metrics: Optional[Dict[str, Dict[str, Optional[float]]]]
+    _statistics: Optional[Dict[str, Any]]
+    _timings: Dict[str, float]
 
     _folder: Optional[Path]
 
@@ -32,6 +73,13 @@ class BacktestReportTask:
     # ───────────────────────────────────────────────────────────
     def __init__(self, backtest_id: Optional[str] = None) -> None:
         self._backtest_id = backtest_id
+        self._backtest = None
+        self._report = None
+        self._snapshots = None
+        self._metrics = None
+        self._statistics = None
+        self._timings = {}
+        self._folder = None
         self._report_model = ReportModel()
         self._order_model = OrderModel()
         self._snapshot_model = SnapshotModel()
@@ -41,25 +89,37 @@ class BacktestReportTask:
     # PUBLIC METHODS
     # ───────────────────────────────────────────────────────────
     def run(self) -> None:
-        if (
-            not self._report
-            or not self._orders
-            or not self._snapshots
-            or not self._folder
-        ):
+        if not self._backtest or not self._report or not self._folder:
             logger.error("Task is not ready")
             return
 
-        orders = self._orders
-        snapshots = self._snapshots
-        report = self._report
-        folder = self._folder
+        report_id = str(self._report["_id"])
 
-        report_id = report["_id"]
+        if not self._claim_report(report_id):
+            logger.error(f"Report {report_id} is already building")
+            return
+
+        try:
+            self._run_stage("load", self._load)
+            self._run_stage("metrics", self._compute_metrics)
+            self._run_stage("statistics", self._compute_statistics)
+            artifacts = self._run_stage("artifacts", self._write_artifacts)
+        except Exception as e:
+            logger.error(f"Failed to build report {report_id}: {e!r}")
+            self._update_report_to_failed(report_id, error=str(e))
+            return
 
         self._update_report(
             report_id=report_id,
-            data={"folder": str(folder)},
+            data={
+                "status": ReportStatus.READY.value,
+                "folder": str(self._folder),
+                "artifacts": artifacts,
+                "metrics": self._metrics,
+                "statistics": self._statistics,
+                "timings": self._timings,
+                "error": None,
+            },
         )
 
     # ───────────────────────────────────────────────────────────
@@ -74,31 +134,160 @@ class BacktestReportTask:
             logger.error("Failed to find backtest")
             return
 
-        self._report = self._get_report_by_backtest_id(
-            self._backtest["_id"],
-        )
+        backtest_id = str(self._backtest["_id"])
+        self._report = self._get_report_by_backtest_id(backtest_id)
 
         if not self._report:
             logger.error("Failed to find report")
             return
 
-        self._orders = self._get_orders_by_backtest_id(self._backtest["_id"])
+        report_id = str(self._report["_id"])
+        order_filters = {
+            "backtest": True,
+            "backtest_id": backtest_id,
+        }
+        snapshot_filters = {"backtest_id": backtest_id}
 
-        if len(self._orders) == 0:
+        if not self._has_documents(self._order_model, order_filters):
             logger.error("Failed to find orders")
+            self._update_report_to_failed(report_id, error="No orders found")
             return
 
-        self._snapshots = self._get_snapshots_by_backtest_id(self._backtest["_id"])
-
-        if len(self._snapshots) == 0:
+        if not self._has_documents(self._snapshot_model, snapshot_filters):
             logger.error("Failed to find snapshots")
+            self._update_report_to_failed(report_id, error="No snapshots found")
             return
 
-        report_id = self._report["_id"]
-
-        self._folder = Path(settings.BASE_DIR) / "storage" / "reports" / str(report_id)
+        self._folder = Path(settings.BASE_DIR) / "storage" / "reports" / report_id
         self._folder.mkdir(parents=True, exist_ok=True)
 
+    def _claim_report(self, report_id: str) -> bool:
+        claimed_at = datetime.now(tz=UTC)
+        expired_at = claimed_at - timedelta(
+            seconds=settings.REPORTS["CLAIM_TIMEOUT_SECONDS"],
+        )
+        report = self._report_model.find_one_and_update(
+            query_filters={
+                "_id": ObjectId(report_id),
+                "$or": [
+                    {"status": {"$ne": ReportStatus.BUILDING.value}},
+                    {"claimed_at": {"$lt": expired_at}},
+                    {"claimed_at": None},
+                ],
+            },
+            data={
+                "status": ReportStatus.BUILDING.value,
+                "claimed_at": claimed_at,
+                "timings": {},
+                "error": None,
+            },
+        )
+
+        return report is not None
+
+    def _run_stage(self, name: str, stage: Callable[[], Any]) -> Any:
+        started_at = time.perf_counter()
+
+        try:
+            return stage()
+        finally:
+            elapsed = (time.perf_counter() - started_at) * 1000
+            self._timings[name] = round(elapsed, 3)
+
+    def _load(self) -> None:
+        snapshots = self._get_snapshots_by_backtest_id(
+            str(self._backtest["_id"]),  # type: ignore
+        )
+        self._snapshots = {}
+
+        for strategy_id, series in snapshots.items():
+            is_valid = ~np.isnan(series["nav"])
+
+            if is_valid.any():
+                self._snapshots[strategy_id] = {
+                    name: column[is_valid] for name, column in series.items()
+                }
+
+    def _compute_metrics(self) -> None:
+        self._metrics = {
+            strategy_id: get_metrics_from(series["nav"], series["created_at"])
+            for strategy_id, series in (self._snapshots or {}).items()
+        }
+
+    def _compute_statistics(self) -> None:
+        self._statistics = self._order_model.get_statistics(
+            OrderStatisticsQuery(
+                backtest_id=str(self._backtest["_id"]),  # type: ignore
+            )
+        )
+
+    def _write_artifacts(self) -> Dict[str, str]:
+        return {
+            "metrics": self._write_artifact(self.METRICS_FILE, self._write_metrics),
+            "equity_curve": self._write_artifact(
+                self.EQUITY_CURVE_FILE,
+                self._write_equity_curve,
+            ),
+            "trades": self._write_artifact(self.TRADES_FILE, self._write_trades),
+        }
+
+    def _write_artifact(self, name: str, write: Callable[[TextIO], None]) -> str:
+        folder = self._folder or Path()
+        file_descriptor, temp_path = tempfile.mkstemp(dir=folder, prefix=f".{name}.")
+
+        try:
+            with os.fdopen(file_descriptor, "w", newline="") as file:
+                write(file)
+
+            Path(temp_path).replace(folder / name)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        return name
+
+    def _write_metrics(self, file: TextIO) -> None:
+        json.dump(
+            {
+                "backtest_id": str(self._backtest["_id"]),  # type: ignore
+                "strategies": self._metrics or {},
+                "orders": self._statistics or {},
+            },
+            file,
+            separators=(",", ":"),
+        )
+
+    def _write_equity_curve(self, file: TextIO) -> None:
+        writer = csv.writer(file)
+        writer.writerow(("strategy_id", "created_at", "nav"))
+
+        for strategy_id, series in (self._snapshots or {}).items():
+            indexes = self._build_sample_indexes(series["nav"].size)
+            timestamps = series["created_at"][indexes]
+            navs = series["nav"][indexes]
+
+            writer.writerows(
+                zip(
+                    [strategy_id] * indexes.size,
+                    timestamps.tolist(),
+                    navs.tolist(),
+                    strict=True,
+                )
+            )
+
+    def _write_trades(self, file: TextIO) -> None:
+        writer = csv.DictWriter(
+            file,
+            fieldnames=self.TRADE_FIELDS,
+            extrasaction="ignore",
+        )
+        writer.writeheader()
+        writer.writerows(
+            self._get_orders_by_backtest_id(
+                str(self._backtest["_id"]),  # type: ignore
+            )
+        )
+
     def _get_backtest_by_id(self, backtest_id: str) -> Optional[Dict[str, Any]]:
         results = BacktestModel().find(
             query_filters={"_id": ObjectId(backtest_id)},
@@ -113,35 +302,57 @@ class BacktestReportTask:
 
         return report[0] if report else None
 
-    def _get_orders_by_backtest_id(self, backtest_id: str) -> List[Dict[str, Any]]:
-        return self._order_model.find(
-            limit=9**100,
+    def _get_orders_by_backtest_id(
+        self,
+        backtest_id: str,
+    ) -> Iterator[Dict[str, Any]]:
+        return self._order_model.stream(
             query_filters={
                 "backtest": True,
                 "backtest_id": backtest_id,
             },
+            projection_fields=dict.fromkeys(self.TRADE_FIELDS, 1),
             sort_by="created_at",
             sort_direction="asc",
+            codec_options=STRING_CODEC_OPTIONS,
         )
 
-    def _get_snapshots_by_backtest_id(self, backtest_id: str) -> List[Dict[str, Any]]:
-        return self._snapshot_model.find(
-            limit=9**100,
-            query_filters={"backtest_id": backtest_id},
-            sort_by="created_at",
-            sort_direction="asc",
+    def _get_snapshots_by_backtest_id(
+        self,
+        backtest_id: str,
+    ) -> Dict[str, Dict[str, npt.NDArray[Any]]]:
+        return self._snapshot_model.load_series(backtest_id)
+
+    def _has_documents(self, model: BaseModel, query_filters: Dict[str, Any]) -> bool:
+        results = model.find(
+            limit=1,
+            query_filters=query_filters,
+            projection_fields={"_id": 1},
         )
 
+        return len(results) > 0
+
     def _update_report(self, report_id: str, data: Dict[str, Any]) -> None:
         self._report_model.update(
             query_filters={"_id": ObjectId(report_id)},
             data=data,
         )
 
-    def _update_report_to_failed(self, report_id: str) -> None:
+    def _update_report_to_failed(self, report_id: str, error: str) -> None:
         self._update_report(
             report_id=report_id,
             data={
                 "status": ReportStatus.FAILED.value,
+                "timings": self._timings,
+                "error": error,
             },
         )
+
+    # Helpers
+    def _build_sample_indexes(self, size: int) -> npt.NDArray[np.int64]:
+        if size <= self.EQUITY_CURVE_POINTS:
+            return np.arange(size)
+
+        return np.unique(
+            np.linspace(0, size - 1, self.EQUITY_CURVE_POINTS).astype(np.int64)
+        )
@@ -0,0 +1,51 @@
+from datetime import UTC, datetime
+from typing import Any, Dict
+
+from celery import Task, shared_task
+from django.conf import settings
+
+from apps.core.models.backtest import BacktestModel
+from apps.core.tasks.backtest.purge import BacktestPurgeTask
+
+
+@shared_task(
+    name="apps.core.tasks.purge_backtest",
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def purge_backtest(self: Task, backtest_id: str) -> Dict[str, Any]:
+    task = BacktestPurgeTask(
+        backtest_id=backtest_id,
+        on_progress=lambda progress: self.update_state(
+            state="PROGRESS",
+            meta=progress,
+        ),
+    )
+    purged = task.run()
+
+    return {
+        "status": "success",
+        "purged": purged,
+        "time": datetime.now(tz=UTC),
+    }
+
+
+@shared_task(name="apps.core.tasks.resume_backtest_purges")
+def resume_backtest_purges() -> Dict[str, Any]:
+    model = BacktestModel()
+    backtests = model.stream_stale_deletions(
+        stale_after=settings.BACKTEST_PURGE["STALE_AFTER_SECONDS"],
+    )
+    resumed = 0
+
+    for backtest in backtests:
+        purge_backtest.apply_async(args=[str(backtest["_id"])])  # type: ignore
+        model.touch_purge_heartbeat(str(backtest["_id"]))
+        resumed += 1
+
+    return {
+        "status": "success",
+        "resumed": resumed,
+        "time": datetime.now(tz=UTC),
+    }
@@ -2,9 +2,14 @@ from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from apps.core.controllers.backtest import BacktestController
+from apps.core.controllers.health import HealthController
 from apps.core.controllers.orders import OrderController
+from apps.core.controllers.orders.bulk import OrderBulkController
+from apps.core.controllers.orders.statistics import OrderStatisticsController
 from apps.core.controllers.report import ReportController
 from apps.core.controllers.snapshot import SnapshotController
+from apps.core.controllers.snapshot.bulk import SnapshotBulkController
+from apps.core.controllers.strategy_metrics import StrategyMetricsController
 
 router = DefaultRouter()
 
@@ -24,11 +29,26 @@ urlpatterns = [
         BacktestController.as_view(http_method_names=["put", "patch", "delete"]),
         name="backtest.update",
     ),
+    path(
+        "health/",
+        HealthController.as_view(http_method_names=["get"]),
+        name="health.get",
+    ),
     path(
         "orders/",
         OrderController.as_view(http_method_names=["get"]),
         name="order.get",
     ),
+    path(
+        "orders/bulk/",
+        OrderBulkController.as_view(http_method_names=["post"]),
+        name="order.bulk",
+    ),
+    path(
+        "orders/statistics/",
+        OrderStatisticsController.as_view(http_method_names=["get"]),
+        name="order.statistics",
+    ),
     path(
         "order/",
         OrderController.as_view(http_method_names=["post"]),
@@ -49,6 +69,11 @@ urlpatterns = [
         SnapshotController.as_view(http_method_names=["get"]),
         name="snapshot.get",
     ),
+    path(
+        "snapshots/bulk/",
+        SnapshotBulkController.as_view(http_method_names=["post"]),
+        name="snapshot.bulk",
+    ),
     path(
         "snapshot/",
         SnapshotController.as_view(http_method_names=["post"]),
@@ -59,5 +84,10 @@ urlpatterns = [
         SnapshotController.as_view(http_method_names=["put", "patch", "delete"]),
         name="snapshot.update",
     ),
+    path(
+        "strategy-metrics/",
+        StrategyMetricsController.as_view(http_method_names=["get"]),
+        name="strategy_metrics.get",
+    ),
     *router.urls,
 ]
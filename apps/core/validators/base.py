@@ -0,0 +1,48 @@
+from datetime import UTC, datetime
+from typing import Annotated, Any, Dict, List, Optional, Self, Tuple
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, ValidationError
+
+
+def _parse_timestamp(value: Any) -> Any:
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        try:
+            return datetime.fromtimestamp(float(value), tz=UTC)
+        except (OverflowError, OSError, ValueError):
+            raise ValueError("must be a unix timestamp") from None
+
+    return value
+
+
+Timestamp = Annotated[datetime, BeforeValidator(_parse_timestamp)]
+
+
+class BaseValidator(BaseModel):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    model_config = ConfigDict(extra="forbid", use_enum_values=True)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    @classmethod
+    def parse(
+        cls,
+        data: Any,
+    ) -> Tuple[Optional[Self], Optional[Dict[str, List[str]]]]:
+        try:
+            return cls.model_validate(data), None
+        except ValidationError as e:
+            return None, cls._build_errors(e)
+
+    # Helpers
+    @staticmethod
+    def _build_errors(error: ValidationError) -> Dict[str, List[str]]:
+        errors: Dict[str, List[str]] = {}
+
+        for detail in error.errors(include_url=False):
+            field = ".".join(str(part) for part in detail["loc"]) or "item"
+            errors.setdefault(field, []).append(detail["msg"])
+
+        return errors
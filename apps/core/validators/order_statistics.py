@@ -0,0 +1,18 @@
+from typing import List
+
+from pydantic import Field
+
+from apps.core.enums.order_statistics_group import OrderStatisticsGroup
+from apps.core.validators.base import BaseValidator
+
+
+class OrderStatisticsQuery(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    backtest_id: str = Field(min_length=1)
+    backtest: bool = True
+    group_by: List[OrderStatisticsGroup] = Field(
+        default_factory=lambda: [group.value for group in OrderStatisticsGroup],
+        max_length=len(OrderStatisticsGroup),
+    )
@@ -0,0 +1,32 @@
+from typing import Annotated, List, Literal, Optional
+
+from pydantic import Field, StringConstraints
+
+from apps.core.validators.base import BaseValidator
+
+MAX_FILTERS = 10
+
+FilterExpression = Annotated[
+    str,
+    StringConstraints(pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*:.+$"),
+]
+
+
+class PaginationValidator(BaseValidator):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    page_param: int = Field(default=1, ge=1)
+    page_size_param: int = Field(default=10, ge=1, le=100)
+    sort_by_param: str = Field(default="created_at", min_length=1)
+    sort_direction_param: Literal["asc", "desc"] = "desc"
+    filter_by_param: List[FilterExpression] = Field(
+        default_factory=list,
+        max_length=MAX_FILTERS,
+    )
+    cursor_param: Optional[str] = Field(default=None, pattern=r"^[A-Za-z0-9_-]+$")
+    include_total_param: Literal["true", "false"] = "true"
+    fields_param: Optional[str] = Field(
+        default=None,
+        pattern=r"^[a-zA-Z_][a-zA-Z0-9_]*(,[a-zA-Z_][a-zA-Z0-9_]*)*$",
+    )
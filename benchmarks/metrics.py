@@ -0,0 +1,72 @@
+import math
+import timeit
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from apps.core.helpers import get_metrics_from
+
+POINTS = 10_000_000
+LOOP_POINTS = 1_000_000
+REPEAT = 3
+INTERVAL_MS = 60_000
+
+
+def build_series(points: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(42)
+    navs = 1000 * np.exp(np.cumsum(rng.normal(0.0000002, 0.0005, points)))
+    timestamps = 1_700_000_000_000 + np.arange(points, dtype=np.int64) * INTERVAL_MS
+
+    return navs, timestamps
+
+
+def get_metrics_with_loops(navs: List[float]) -> Dict[str, float]:
+    returns = [navs[i] / navs[i - 1] - 1 for i in range(1, len(navs))]
+    mean = sum(returns) / len(returns)
+    variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
+    peak = navs[0]
+    max_drawdown = 0.0
+    squared_drawdowns = 0.0
+
+    for nav in navs:
+        peak = max(peak, nav)
+        drawdown = nav / peak - 1
+        max_drawdown = min(max_drawdown, drawdown)
+        squared_drawdowns += drawdown * drawdown
+
+    return {
+        "sharpe_ratio": mean / math.sqrt(variance),
+        "max_drawdown": max_drawdown,
+        "ulcer_index": math.sqrt(squared_drawdowns / len(navs)),
+    }
+
+
+def main() -> None:
+    navs, timestamps = build_series(POINTS)
+
+    print(f"Computing metrics over {POINTS:,} NAV points, best of {REPEAT}")
+
+    timings = timeit.repeat(
+        lambda: get_metrics_from(navs, timestamps),
+        repeat=REPEAT,
+        number=1,
+    )
+    vectorized = min(timings)
+    throughput = POINTS / vectorized
+
+    print(f"{'numpy':<8} {vectorized * 1000:>10.1f} ms  {throughput:>14,.0f} pts/s")
+
+    sample = navs[:LOOP_POINTS].tolist()
+    timings = timeit.repeat(
+        lambda: get_metrics_with_loops(sample),
+        repeat=REPEAT,
+        number=1,
+    )
+    looped = min(timings) * POINTS / LOOP_POINTS
+
+    print(f"{'loops':<8} {looped * 1000:>10.1f} ms  (3 metrics, extrapolated)")
+    print(f"speedup: {looped / vectorized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import json
+import random
+import timeit
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from bson import ObjectId
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.core.renderers import JSONRenderer, OrjsonRenderer
+
+ROWS = 100
+REPEAT = 5
+NUMBER = 200
+METRICS = (
+    "nav",
+    "allocation",
+    "nav_peak",
+    "r2",
+    "cagr",
+    "calmar_ratio",
+    "expected_shortfall",
+    "max_drawdown",
+    "profit_factor",
+    "recovery_factor",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "ulcer_index",
+)
+
+
+def build_page(rows: int) -> Dict[str, Any]:
+    now = datetime.now(tz=UTC)
+    backtest_id = str(ObjectId())
+    results = [
+        {
+            "_id": ObjectId(),
+            "backtest": True,
+            "backtest_id": backtest_id,
+            "strategy_id": "ema5_breakout",
+            "event": "on_trade",
+            **{metric: random.random() for metric in METRICS},
+            "created_at": now + timedelta(seconds=index),
+            "updated_at": now + timedelta(seconds=index),
+        }
+        for index in range(rows)
+    ]
+
+    return {
+        "success": True,
+        "message": "Data retrieved successfully",
+        "data": {
+            "results": results,
+            "pagination": {
+                "page": 1,
+                "page_size": rows,
+                "total": rows,
+                "total_pages": 1,
+                "next_cursor": None,
+            },
+        },
+    }
+
+
+def serialize(document: Dict[str, Any]) -> Dict[str, Any]:
+    serialized = {}
+
+    for key, value in document.items():
+        if isinstance(value, ObjectId):
+            serialized[key] = str(value)
+
+        elif isinstance(value, datetime):
+            serialized[key] = value.isoformat()
+
+        elif isinstance(value, dict):
+            serialized[key] = serialize(value)
+
+        elif isinstance(value, list):
+            serialized[key] = [
+                serialize(item) if isinstance(item, dict) else item for item in value
+            ]
+
+        else:
+            serialized[key] = value
+
+    return serialized
+
+
+def render_legacy(page: Dict[str, Any]) -> bytes:
+    results: List[Dict[str, Any]] = page["data"]["results"]
+    data = {**page["data"], "results": [serialize(doc) for doc in results]}
+    return json.dumps({**page, "data": data}, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def measure(name: str, render: Callable[[Dict[str, Any]], bytes]) -> float:
+    page = build_page(ROWS)
+    timings = timeit.repeat(lambda: render(page), repeat=REPEAT, number=NUMBER)
+    best = min(timings) / NUMBER * 1_000_000
+
+    print(f"{name:<12} {best:>10.1f} us/page  {len(render(page)):>8} bytes")
+
+    return best
+
+
+def main() -> None:
+    print(f"Rendering a {ROWS}-row snapshot page, best of {REPEAT} x {NUMBER}")
+
+    legacy = measure("legacy", render_legacy)
+    stdlib = measure("json", JSONRenderer().render)
+    fast = measure("orjson", OrjsonRenderer().render)
+
+    print(f"json   speedup: {legacy / stdlib:.1f}x")
+    print(f"orjson speedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,4 +35,8 @@ app.conf.beat_schedule = {
     #     "task": "apps.core.tasks.make_backtest_report",
     #     "schedule": crontab(minute="*/1"),
     # },
+    "resume_backtest_purges": {
+        "task": "apps.core.tasks.resume_backtest_purges",
+        "schedule": crontab(minute="*/5"),
+    },
 }
@@ -33,6 +33,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "apps.core.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -73,6 +74,21 @@ DATABASES = {
         "DB_PASSWORD": os.getenv("MONGODB_PASSWORD"),
         "DB_HOST": os.getenv("MONGODB_HOST"),
         "DB_PORT": os.getenv("MONGODB_PORT", "27017"),
+        "URI": os.getenv("MONGODB_URI"),
+        "MAX_POOL_SIZE": int(os.getenv("MONGODB_MAX_POOL_SIZE", "100")),
+        "MIN_POOL_SIZE": int(os.getenv("MONGODB_MIN_POOL_SIZE", "0")),
+        "MAX_IDLE_TIME_MS": int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "300000")),
+        "WAIT_QUEUE_TIMEOUT_MS": int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "0"))
+        or None,
+        "CONNECT_TIMEOUT_MS": int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "10000")),
+        "SERVER_SELECTION_TIMEOUT_MS": int(
+            os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "10000")
+        ),
+        "SOCKET_TIMEOUT_MS": int(os.getenv("MONGODB_SOCKET_TIMEOUT_MS", "0")) or None,
+        "COMPRESSORS": os.getenv("MONGODB_COMPRESSORS", "zstd,snappy,zlib"),
+        "READ_CONCERN": os.getenv("MONGODB_READ_CONCERN", "local"),
+        "WRITE_CONCERN": os.getenv("MONGODB_WRITE_CONCERN", "1"),
+        "CHECK_INDEXES": os.getenv("MONGODB_CHECK_INDEXES", "True") == "True",
     },
 }
 
@@ -147,6 +163,43 @@ SPECTACULAR_SETTINGS = {
     },
 }
 
+RESPONSE_RENDERER = os.getenv("RESPONSE_RENDERER", "apps.core.renderers.OrjsonRenderer")
+
+LIST_TOTAL_CACHE_TTL = int(os.getenv("LIST_TOTAL_CACHE_TTL", "30"))
+
+SNAPSHOTS = {
+    "SIGNIFICANT_EVENTS": [
+        event.strip()
+        for event in os.getenv(
+            "SNAPSHOT_SIGNIFICANT_EVENTS", "on_start,on_stop,on_liquidation"
+        ).split(",")
+        if event.strip()
+    ],
+}
+
+BACKTEST_PURGE = {
+    "BATCH_SIZE": int(os.getenv("BACKTEST_PURGE_BATCH_SIZE", "5000")),
+    "THROTTLE_SECONDS": float(os.getenv("BACKTEST_PURGE_THROTTLE_SECONDS", "0.05")),
+    "STALE_AFTER_SECONDS": int(os.getenv("BACKTEST_PURGE_STALE_AFTER_SECONDS", "900")),
+}
+
+REPORTS = {
+    "CLAIM_TIMEOUT_SECONDS": int(os.getenv("REPORT_CLAIM_TIMEOUT_SECONDS", "1800")),
+}
+
+COMPRESSION = {
+    "MIN_SIZE": int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+    "ENCODINGS": [
+        encoding.strip()
+        for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+        if encoding.strip()
+    ],
+    "GZIP_LEVEL": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+    "BROTLI_QUALITY": int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4")),
+    "ZSTD_LEVEL": int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+    "STREAM_FLUSH_SIZE": int(os.getenv("COMPRESSION_STREAM_FLUSH_SIZE", "32768")),
+}
+
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
@@ -159,6 +212,16 @@ CHANNEL_LAYERS = {
     },
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("CACHE_URL", "redis://localhost:6379/2"),
+        "KEY_PREFIX": "horizon",
+    },
+}
+
+READ_CACHE_TTL = int(os.getenv("READ_CACHE_TTL", "60"))
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/1")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
 CELERY_ACCEPT_CONTENT = ["json"]
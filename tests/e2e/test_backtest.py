@@ -57,6 +57,19 @@ class TestBacktest(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
+        etag = response.headers.get("ETag")
+        self.assertIsNotNone(etag)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query=None,
+            body=None,
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.NOT_MODIFIED.value)
+
     def test_03_update_backtest(self) -> None:
         self.log.info(f"Available backtest IDs: {backtests}")
 
@@ -76,7 +89,46 @@ class TestBacktest(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_04_delete_backtests(self) -> None:
+    def test_04_revalidate_after_delete(self) -> None:
+        self.test_01_create_backtest()
+
+        query = {"filter_by": f"_id:in:{','.join(backtests)}"}
+        response = self.execute("GET", f"{self._base_url}/api/backtests/", query=query)
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        etag = response.headers.get("ETag")
+        self.assertTrue(etag.startswith("W/"))
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query=query,
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.NOT_MODIFIED.value)
+        self.assertEqual(response.headers.get("ETag"), etag)
+
+        backtest_id = backtests.pop(0)
+        response = self.execute(
+            "DELETE",
+            f"{self._base_url}/api/backtest/{backtest_id}/",
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/backtests/",
+            query=query,
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertNotEqual(response.headers.get("ETag"), etag)
+
+    def test_05_delete_backtests(self) -> None:
         self.log.info(f"Deleting backtest IDs: {backtests}")
 
         for backtest_id in backtests:
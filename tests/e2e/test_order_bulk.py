@@ -0,0 +1,139 @@
+import json
+import unittest
+from typing import Any, Dict, List
+
+import requests
+from bson import ObjectId
+
+from apps.core.enums.http_status import HttpStatus
+from tests.e2e.wrappers.test import TestWrapper
+
+backtest_id = str(ObjectId())
+orders: List[str] = []
+
+
+class TestOrderBulk(TestWrapper):
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        super().setUp()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_create_orders_bulk(self) -> None:
+        body = [self._build_order(index) for index in range(3)]
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/orders/bulk/",
+            body=body,
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.CREATED.value)
+
+        data = response.json()["data"]
+        self.assertEqual(data["inserted"], len(body))
+        self.assertEqual(data["failed"], 0)
+        self.assertEqual(
+            [result["index"] for result in data["results"]],
+            list(range(len(body))),
+        )
+
+        for result in data["results"]:
+            self.assertTrue(result["success"])
+            orders.append(result["_id"])
+
+    def test_02_create_orders_ndjson(self) -> None:
+        body = "\n".join(json.dumps(self._build_order(index)) for index in range(2))
+        response = requests.post(
+            f"{self._base_url}/api/orders/bulk/",
+            data=body.encode("utf-8"),
+            headers={**self._headers, "Content-Type": "application/x-ndjson"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.CREATED.value)
+
+        for result in response.json()["data"]["results"]:
+            orders.append(result["_id"])
+
+    def test_03_report_invalid_items(self) -> None:
+        invalid = self._build_order(1)
+        invalid.pop("executed_volume")
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/orders/bulk/",
+            body=[self._build_order(0), invalid, "not-an-order"],
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.MULTI_STATUS.value)
+
+        data = response.json()["data"]
+        self.assertEqual(data["inserted"], 1)
+        self.assertEqual(data["failed"], 2)
+        self.assertTrue(data["results"][0]["success"])
+        self.assertIn("executed_volume", data["results"][1]["errors"])
+        self.assertIn("item", data["results"][2]["errors"])
+
+        orders.append(data["results"][0]["_id"])
+
+    def test_04_reject_invalid_bodies(self) -> None:
+        for body in ([], {"orders": []}, [{"side": "hold"}]):
+            response = self.execute(
+                "POST",
+                f"{self._base_url}/api/orders/bulk/",
+                body=body,
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+            self.assertFalse(response.json()["success"])
+
+    def test_05_list_bulk_orders(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"filter_by": f"backtest_id:{backtest_id}", "page_size": 100},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertEqual(
+            sorted(row["_id"] for row in response.json()["data"]["results"]),
+            sorted(orders),
+        )
+
+    def test_06_delete_orders(self) -> None:
+        for order_id in orders:
+            response = self.execute(
+                "DELETE",
+                f"{self._base_url}/api/order/{order_id}/",
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        orders.clear()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _build_order(self, index: int) -> Dict[str, Any]:
+        return {
+            "backtest": True,
+            "backtest_id": backtest_id,
+            "strategy_id": "ema5_breakout",
+            "symbol": "BTCUSDT",
+            "gateway": "binance",
+            "side": "buy",
+            "order_type": "market",
+            "status": "closed",
+            "volume": 0.1,
+            "executed_volume": 0.1,
+            "price": 110000.0 + index,
+            "filled": True,
+            "profit": 10.0,
+            "created_at": 1714734000 + index,
+            "updated_at": 1714734000 + index,
+        }
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+import unittest
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+
+from apps.core.enums.http_status import HttpStatus
+from tests.e2e.wrappers.test import TestWrapper
+
+backtest_id = str(ObjectId())
+orders: List[str] = []
+fixtures: List[Dict[str, Any]] = [
+    {"symbol": "BTCUSDT", "side": "buy", "strategy_id": "a", "profit": 12.5},
+    {"symbol": "BTCUSDT", "side": "sell", "strategy_id": "a", "profit": -4.0},
+    {"symbol": "ETHUSDT", "side": "buy", "strategy_id": "b", "profit": 7.25},
+    {"symbol": "ETHUSDT", "side": "buy", "strategy_id": "b", "profit": None},
+    {"symbol": "SOLUSDT", "side": "sell", "strategy_id": "a", "profit": -1.5},
+    {"symbol": "SOLUSDT", "side": "sell", "strategy_id": "b", "profit": 0.0},
+]
+
+
+class TestOrderStatistics(TestWrapper):
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        super().setUp()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_create_orders(self) -> None:
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/orders/bulk/",
+            body=[self._build_order(index) for index in range(len(fixtures))],
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.CREATED.value)
+
+        for result in response.json()["data"]["results"]:
+            orders.append(result["_id"])
+
+    def test_02_match_reference_statistics(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/statistics/",
+            query={"backtest_id": backtest_id},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        data = response.json()["data"]
+        documents = [self._build_order(index) for index in range(len(fixtures))]
+
+        self._assert_statistics(data["summary"], self._summarize(documents))
+
+        for group in ("symbol", "side", "strategy_id"):
+            expected = self._group(documents, group)
+
+            self.assertEqual(
+                [row[group] for row in data["groups"][group]],
+                [row[group] for row in expected],
+            )
+
+            for row, expected_row in zip(data["groups"][group], expected, strict=True):
+                self._assert_statistics(row, expected_row)
+
+    def test_03_select_groups(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/statistics/",
+            query={"backtest_id": backtest_id, "group_by": "side"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertEqual(list(response.json()["data"]["groups"]), ["side"])
+
+    def test_04_return_empty_statistics(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/statistics/",
+            query={"backtest_id": str(ObjectId())},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        self.assertIsNone(response.json()["data"]["summary"])
+
+    def test_05_reject_invalid_parameters(self) -> None:
+        for query in ({}, {"backtest_id": backtest_id, "group_by": "price"}):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/statistics/",
+                query=query,
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+            self.assertFalse(response.json()["success"])
+
+    def test_06_delete_orders(self) -> None:
+        for order_id in orders:
+            response = self.execute(
+                "DELETE",
+                f"{self._base_url}/api/order/{order_id}/",
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        orders.clear()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _assert_statistics(
+        self,
+        actual: Dict[str, Any],
+        expected: Dict[str, Any],
+    ) -> None:
+        self.assertEqual(set(actual), set(expected))
+
+        for name, value in expected.items():
+            if isinstance(value, float):
+                self.assertAlmostEqual(actual[name], value, places=9, msg=name)
+            else:
+                self.assertEqual(actual[name], value, msg=name)
+
+    def _summarize(self, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        profits = [item["profit"] for item in documents if item["profit"] is not None]
+        percentages = [
+            item["profit_percentage"]
+            for item in documents
+            if item["profit_percentage"] is not None
+        ]
+        gross_profit = sum(profit for profit in profits if profit > 0)
+        gross_loss = sum(-profit for profit in profits if profit < 0)
+        wins = sum(1 for profit in profits if profit > 0)
+
+        return {
+            "orders": len(documents),
+            "trades": len(profits),
+            "wins": wins,
+            "losses": sum(1 for profit in profits if profit < 0),
+            "win_rate": self._divide(wins, len(profits)),
+            "gross_profit": float(gross_profit),
+            "gross_loss": float(gross_loss),
+            "net_profit": float(gross_profit - gross_loss),
+            "profit_factor": self._divide(gross_profit, gross_loss),
+            "average_profit_percentage": self._divide(
+                sum(percentages),
+                len(percentages),
+            ),
+            "volume": float(sum(item["volume"] for item in documents)),
+            "executed_volume": float(
+                sum(item["executed_volume"] for item in documents)
+            ),
+        }
+
+    def _group(
+        self,
+        documents: List[Dict[str, Any]],
+        group: str,
+    ) -> List[Dict[str, Any]]:
+        rows = [
+            {
+                group: key,
+                **self._summarize([item for item in documents if item[group] == key]),
+            }
+            for key in {item[group] for item in documents}
+        ]
+
+        return sorted(rows, key=lambda row: (-row["volume"], row[group]))
+
+    # Helpers
+    def _build_order(self, index: int) -> Dict[str, Any]:
+        fixture = fixtures[index]
+        profit = fixture["profit"]
+
+        return {
+            "backtest": True,
+            "backtest_id": backtest_id,
+            "strategy_id": fixture["strategy_id"],
+            "symbol": fixture["symbol"],
+            "gateway": "binance",
+            "side": fixture["side"],
+            "order_type": "market",
+            "status": "closed" if profit is not None else "open",
+            "volume": 0.5 * (index + 1),
+            "executed_volume": 0.25 * (index + 1),
+            "price": 100.0,
+            "filled": profit is not None,
+            "profit": profit,
+            "profit_percentage": profit / 100 if profit is not None else None,
+            "created_at": 1714734000 + index,
+            "updated_at": 1714734000 + index,
+        }
+
+    def _divide(self, numerator: float, denominator: float) -> Optional[float]:
+        return numerator / denominator if denominator else None
+
+
+if __name__ == "__main__":
+    unittest.main()
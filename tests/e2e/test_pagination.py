@@ -0,0 +1,208 @@
+import unittest
+from typing import Any, Dict, List
+
+from bson import ObjectId
+
+from apps.core.enums.http_status import HttpStatus
+from tests.e2e.wrappers.test import TestWrapper
+
+backtest_id = str(ObjectId())
+orders: List[str] = []
+
+
+class TestPagination(TestWrapper):
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        super().setUp()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_create_orders(self) -> None:
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/orders/bulk/",
+            body=[
+                {
+                    "backtest": True,
+                    "backtest_id": backtest_id,
+                    "strategy_id": "ema5_breakout",
+                    "symbol": "BTCUSDT" if index % 2 else "ETHUSDT",
+                    "gateway": "binance",
+                    "side": "buy",
+                    "order_type": "market",
+                    "status": "closed",
+                    "volume": float(index + 1),
+                    "executed_volume": float(index + 1),
+                    "price": 100.0,
+                    "filled": True,
+                    "profit": 10.0,
+                    "created_at": 1714734000 + index * 60,
+                    "updated_at": 1714734000 + index * 60,
+                }
+                for index in range(5)
+            ],
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.CREATED.value)
+
+        for result in response.json()["data"]["results"]:
+            orders.append(result["_id"])
+
+    def test_02_filter_orders(self) -> None:
+        min_volume = 3
+        data = self._get_orders(
+            {"filter_by": [f"backtest_id:{backtest_id}", f"volume:gte:{min_volume}"]}
+        )
+
+        self.assertEqual(data["pagination"]["total"], len(orders) - min_volume + 1)
+        self.assertTrue(all(row["volume"] >= min_volume for row in data["results"]))
+
+        data = self._get_orders(
+            {"filter_by": [f"backtest_id:{backtest_id}", "symbol:in:BTCUSDT"]}
+        )
+
+        self.assertEqual(data["pagination"]["total"], 2)
+
+    def test_03_paginate_with_cursor(self) -> None:
+        query: Dict[str, Any] = {
+            "filter_by": f"backtest_id:{backtest_id}",
+            "sort_order": "asc",
+            "page_size": 2,
+        }
+        seen: List[str] = []
+
+        while True:
+            data = self._get_orders(query)
+            seen.extend(row["_id"] for row in data["results"])
+            cursor = data["pagination"]["next_cursor"]
+
+            if not cursor:
+                break
+
+            query["cursor"] = cursor
+
+        self.assertEqual(seen, orders)
+
+    def test_04_reject_foreign_cursor(self) -> None:
+        data = self._get_orders(
+            {
+                "filter_by": f"backtest_id:{backtest_id}",
+                "sort_order": "asc",
+                "page_size": 2,
+            }
+        )
+        cursor = data["pagination"]["next_cursor"]
+
+        for query in (
+            {"sort_order": "desc"},
+            {"sort_order": "asc", "sort": "volume"},
+            {"sort_order": "asc", "filter_by": "symbol:BTCUSDT"},
+            {"sort_order": "asc", "filter_by": f"backtest_id:{backtest_id}x"},
+        ):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/",
+                query={"page_size": 2, "cursor": cursor, **query},
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+            self.assertIn("cursor_param", response.json()["data"]["errors"])
+
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={"cursor": "not-a-cursor"},
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+
+    def test_05_reject_invalid_filters(self) -> None:
+        for filter_by in (
+            "unknown:1",
+            "symbol:gt:BTCUSDT",
+            "volume:gte:abc",
+            "_id:not-an-object-id",
+            "created_at:lt:yesterday",
+            "volume:prefix:1",
+            "no-separator",
+        ):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/",
+                query={"filter_by": filter_by},
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+            self.assertFalse(response.json()["success"])
+
+    def test_06_select_fields(self) -> None:
+        data = self._get_orders(
+            {
+                "filter_by": f"backtest_id:{backtest_id}",
+                "fields": "symbol,volume",
+            }
+        )
+
+        self.assertEqual(len(data["results"]), len(orders))
+
+        for row in data["results"]:
+            self.assertEqual(set(row), {"_id", "created_at", "symbol", "volume"})
+
+    def test_07_reject_unknown_fields(self) -> None:
+        for fields in ("symbol,password", "unknown", "symbol,,volume"):
+            response = self.execute(
+                "GET",
+                f"{self._base_url}/api/orders/",
+                query={"filter_by": f"backtest_id:{backtest_id}", "fields": fields},
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.BAD_REQUEST.value)
+            self.assertIn("fields_param", response.json()["data"]["errors"])
+
+    def test_08_fail_before_streaming(self) -> None:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query={
+                "filter_by": f"backtest_id:{backtest_id}",
+                "page": 10**17,
+                "page_size": 100,
+            },
+        )
+
+        self.assertEqual(
+            response.status_code,
+            HttpStatus.INTERNAL_SERVER_ERROR.value,
+        )
+        self.assertFalse(response.json()["success"])
+
+    def test_09_delete_orders(self) -> None:
+        for order_id in orders:
+            response = self.execute(
+                "DELETE",
+                f"{self._base_url}/api/order/{order_id}/",
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        orders.clear()
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_orders(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        response = self.execute(
+            "GET",
+            f"{self._base_url}/api/orders/",
+            query=query,
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+        return response.json()["data"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,7 +81,127 @@ class TestSnapshot(TestWrapper):
         snapshots.append(snapshot_id)
         self.log.info(f"Snapshot ID added: {snapshot_id}")
 
-    def test_03_get_all_snapshots(self) -> None:
+    def test_03_create_snapshots_bulk(self) -> None:
+        created_at = int(datetime.now(UTC).timestamp())
+
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/snapshots/bulk/",
+            body=[
+                {
+                    "backtest": True,
+                    "backtest_id": backtests[0],
+                    "strategy_id": "ema5_breakout",
+                    "event": "on_trade",
+                    "nav": 10600.00,
+                    "created_at": created_at,
+                },
+                {
+                    "backtest": True,
+                    "backtest_id": backtests[0],
+                    "strategy_id": "ema5_breakout",
+                    "event": "on_trade",
+                    "nav": 10700.00,
+                    "created_at": created_at + 60,
+                },
+                {
+                    "backtest": True,
+                    "backtest_id": backtests[0],
+                    "nav": -1,
+                },
+            ],
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.MULTI_STATUS.value)
+
+        data = response.json()
+        self.assertIsInstance(data, dict)
+        self.assertTrue(data["success"])
+        self.assertEqual(data["data"]["inserted"], 2)
+        self.assertEqual(data["data"]["failed"], 1)
+
+        results = data["data"]["results"]
+        self.assertFalse(results[2]["success"])
+        self.assertIn("strategy_id", results[2]["errors"])
+
+        for result in results:
+            if result["success"]:
+                snapshots.append(result["_id"])
+
+        self.log.info(f"Bulk snapshot IDs added: {snapshots[1:]}")
+
+    def test_04_create_coalesced_snapshots(self) -> None:
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/backtest/",
+            body={
+                "asset": "btcusdt",
+                "strategies": "ema5_breakout",
+                "from_date": 1714732800,
+                "to_date": 1714732800,
+                "snapshot_coalesce_window": 3600,
+            },
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.OK.value)
+
+        backtest_id = response.json()["data"]["_id"]
+        backtests.append(backtest_id)
+
+        created_at = 1714734000
+        snapshot_ids = []
+
+        for offset, nav in ((0, 10000.00), (60, 10010.00)):
+            response = self.execute(
+                "POST",
+                f"{self._base_url}/api/snapshot/",
+                body={
+                    "backtest": True,
+                    "backtest_id": backtest_id,
+                    "strategy_id": "ema5_breakout",
+                    "event": "on_trade",
+                    "nav": nav,
+                    "created_at": created_at + offset,
+                },
+            )
+
+            self.assertEqual(response.status_code, HttpStatus.OK.value)
+            snapshot_ids.append(response.json()["data"]["_id"])
+
+        self.assertEqual(snapshot_ids[0], snapshot_ids[1])
+        snapshots.append(snapshot_ids[0])
+
+        self.log.info(f"Coalesced snapshot ID added: {snapshot_ids[0]}")
+
+    def test_05_create_coalesced_snapshots_bulk(self) -> None:
+        created_at = 1714734000
+
+        response = self.execute(
+            "POST",
+            f"{self._base_url}/api/snapshots/bulk/",
+            body=[
+                {
+                    "backtest": True,
+                    "backtest_id": backtests[1],
+                    "strategy_id": "ema5_breakout",
+                    "event": "on_trade",
+                    "nav": nav,
+                    "created_at": created_at + offset,
+                }
+                for offset, nav in ((120, 10020.00), (180, 10030.00))
+            ],
+        )
+
+        self.assertEqual(response.status_code, HttpStatus.CREATED.value)
+
+        data = response.json()
+        self.assertTrue(data["success"])
+        self.assertEqual(data["data"]["inserted"], 2)
+
+        for result in data["data"]["results"]:
+            self.assertEqual(result["_id"], snapshots[-1])
+
+    def test_06_get_all_snapshots(self) -> None:
         response = self.execute(
             "GET",
             f"{self._base_url}/api/snapshots/",
@@ -97,7 +217,7 @@ class TestSnapshot(TestWrapper):
         self.assertIn("success", data)
         self.assertTrue(data["success"])
 
-    def test_04_delete_snapshots(self) -> None:
+    def test_07_delete_snapshots(self) -> None:
         self.log.info(f"Deleting snapshot IDs: {snapshots}")
 
         for snapshot_id in snapshots:
@@ -120,7 +240,7 @@ class TestSnapshot(TestWrapper):
         snapshots.clear()
         self.log.info("All snapshots deleted and list cleared")
 
-    def test_05_delete_backtests(self) -> None:
+    def test_08_delete_backtests(self) -> None:
         self.log.info(f"Deleting backtest IDs: {backtests}")
 
         for backtest_id in backtests:
@@ -1,6 +1,6 @@
 import logging
 import unittest
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
 from django.conf import settings
@@ -31,7 +31,7 @@ class TestWrapper(unittest.TestCase):
         method: str,
         url: str,
         query: Optional[Dict[str, Any]] = {},
-        body: Optional[Dict[str, Any]] = {},
+        body: Optional[Union[Dict[str, Any], List[Any]]] = {},
         headers: Optional[Dict[str, str]] = {},
     ) -> Any:
         if query is None:
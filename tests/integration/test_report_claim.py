@@ -0,0 +1,91 @@
+import unittest
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict
+
+from bson import ObjectId
+from django.conf import settings
+
+from apps.core.enums.report_status import ReportStatus
+from apps.core.models.report import ReportModel
+from apps.core.tasks.backtest.report import BacktestReportTask
+
+
+class TestReportClaim(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _report_model: ReportModel
+    _report_id: str
+    _task: BacktestReportTask
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._report_model = ReportModel()
+        self._task = BacktestReportTask()
+        self._report_id = self._report_model.store(
+            data={
+                "backtest_id": str(ObjectId()),
+                "status": ReportStatus.PENDING.value,
+                "folder": None,
+            }
+        )
+        self.addCleanup(
+            self._report_model.delete,
+            query_filters={"_id": ObjectId(self._report_id)},
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_claim_idle_report(self) -> None:
+        self.assertTrue(self._task._claim_report(self._report_id))
+        self.assertFalse(self._task._claim_report(self._report_id))
+
+        report = self._get_report()
+
+        self.assertEqual(report["status"], ReportStatus.BUILDING.value)
+        self.assertIsNotNone(report["claimed_at"])
+
+    def test_02_reject_live_lease(self) -> None:
+        self._set_lease(datetime.now(tz=UTC))
+
+        self.assertFalse(self._task._claim_report(self._report_id))
+
+    def test_03_reclaim_expired_lease(self) -> None:
+        timeout = settings.REPORTS["CLAIM_TIMEOUT_SECONDS"]
+        self._set_lease(datetime.now(tz=UTC) - timedelta(seconds=timeout + 60))
+
+        self.assertTrue(self._task._claim_report(self._report_id))
+        self.assertFalse(self._task._claim_report(self._report_id))
+
+    def test_04_reclaim_lease_without_claimed_at(self) -> None:
+        self._report_model.update(
+            query_filters={"_id": ObjectId(self._report_id)},
+            data={"status": ReportStatus.BUILDING.value},
+        )
+
+        self.assertTrue(self._task._claim_report(self._report_id))
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _set_lease(self, claimed_at: datetime) -> None:
+        self._report_model.update(
+            query_filters={"_id": ObjectId(self._report_id)},
+            data={
+                "status": ReportStatus.BUILDING.value,
+                "claimed_at": claimed_at,
+            },
+        )
+
+    def _get_report(self) -> Dict[str, Any]:
+        results = self._report_model.find(
+            query_filters={"_id": ObjectId(self._report_id)},
+        )
+        return results[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
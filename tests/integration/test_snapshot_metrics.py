@@ -0,0 +1,131 @@
+import unittest
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Tuple
+
+from bson import ObjectId
+
+from apps.core.models.backtest import BacktestModel
+from apps.core.models.report import ReportModel
+from apps.core.models.snapshot import SnapshotModel
+from apps.core.models.strategy_metrics import StrategyMetricsModel
+
+STARTED_AT = 1714734000
+STRATEGY_ID = "ema5_breakout"
+VOLATILE_FIELDS = ("_id", "created_at", "updated_at")
+
+
+class TestSnapshotMetrics(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _backtest_id: str
+    _metrics_model: StrategyMetricsModel
+    _snapshot_model: SnapshotModel
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        backtest_model = BacktestModel()
+        report_model = ReportModel()
+        self._metrics_model = StrategyMetricsModel()
+        self._snapshot_model = SnapshotModel()
+        self._backtest_id = backtest_model.store(
+            data={"name": "coalesced", "snapshot_coalesce_window": 60},
+        )
+
+        self.addCleanup(
+            backtest_model.delete,
+            query_filters={"_id": ObjectId(self._backtest_id)},
+        )
+
+        for model in (report_model, self._snapshot_model, self._metrics_model):
+            self.addCleanup(
+                model.delete_many,
+                query_filters={"backtest_id": self._backtest_id},
+            )
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_keep_latest_snapshot_per_bucket(self) -> None:
+        self._store_series()
+
+        snapshots = self._snapshot_model.find(
+            limit=100,
+            sort_by="created_at",
+            sort_direction="asc",
+            query_filters={"backtest_id": self._backtest_id},
+        )
+
+        self.assertEqual(
+            [snapshot["nav"] for snapshot in snapshots],
+            [1010.0, 1030.0, 980.0, 1040.0],
+        )
+
+    def test_02_match_rebuilt_metrics(self) -> None:
+        self._store_series()
+        accumulated = self._get_metrics()
+
+        self._snapshot_model.rebuild_metrics(self._backtest_id)
+
+        self.assertEqual(accumulated["count"], 4)
+        self.assertEqual(accumulated["nav"], 1040.0)
+        self.assertEqual(self._get_metrics(), accumulated)
+
+    def test_03_mark_replaced_past_bucket_stale(self) -> None:
+        self._store_series()
+        self._snapshot_model.store(self._build_snapshot(110, 1050.0))
+
+        self.assertTrue(self._get_metrics()["stale"])
+
+        self._snapshot_model.rebuild_metrics(self._backtest_id)
+        rebuilt = self._get_metrics()
+
+        self.assertNotIn("stale", rebuilt)
+        self.assertEqual(rebuilt["count"], 4)
+        self.assertEqual(rebuilt["nav_peak"], 1050.0)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _store_series(self) -> None:
+        for offset, nav in ((0, 1000.0), (30, 1010.0), (20, 990.0), (60, 1005.0)):
+            self._snapshot_model.store(self._build_snapshot(offset, nav))
+
+        self._snapshot_model.store_many(
+            [
+                self._build_snapshot(offset, nav)
+                for offset, nav in self._get_bulk_series()
+            ]
+        )
+
+    def _get_metrics(self) -> Dict[str, Any]:
+        (metrics,) = self._metrics_model.find(
+            limit=1,
+            query_filters={
+                "backtest_id": self._backtest_id,
+                "strategy_id": STRATEGY_ID,
+            },
+        )
+
+        return {
+            key: value for key, value in metrics.items() if key not in VOLATILE_FIELDS
+        }
+
+    # Helpers
+    def _get_bulk_series(self) -> List[Tuple[int, float]]:
+        return [(100, 1030.0), (130, 1020.0), (150, 980.0), (185, 1040.0)]
+
+    def _build_snapshot(self, offset: int, nav: float) -> Dict[str, Any]:
+        return {
+            "backtest_id": self._backtest_id,
+            "strategy_id": STRATEGY_ID,
+            "event": "on_tick",
+            "nav": nav,
+            "created_at": datetime.fromtimestamp(STARTED_AT + offset, tz=UTC),
+        }
+
+
+if __name__ == "__main__":
+    unittest.main()
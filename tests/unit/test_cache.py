@@ -0,0 +1,150 @@
+import asyncio
+import unittest
+from typing import Optional, Tuple
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+
+from apps.core.services.cache import CacheService
+
+NAMESPACE = "orders"
+
+
+class TestCacheService(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _cache: LocMemCache
+    _service: CacheService
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._cache = LocMemCache("test-cache", {})
+        self._service = CacheService()
+
+        for patcher in (
+            mock.patch("apps.core.services.cache.cache", self._cache),
+            mock.patch.object(
+                self._service,
+                "_stats",
+                {"hits": 0, "misses": 0, "invalidations": 0, "errors": 0},
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.addCleanup(self._cache.clear)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_fetch_on_miss_and_reuse_on_hit(self) -> None:
+        fetch = mock.Mock(return_value=[{"_id": "a"}])
+
+        for _ in range(2):
+            value = self._service.get_or_set(NAMESPACE, "find", {"a": 1}, fetch)
+            self.assertEqual(value, [{"_id": "a"}])
+
+        fetch.assert_called_once_with()
+        self.assertEqual(self._get_stats(), (1, 1, 0.5))
+
+    def test_02_key_by_operation_and_params(self) -> None:
+        fetch = mock.Mock(return_value=None)
+
+        self._service.get_or_set(NAMESPACE, "find", {"a": 1, "b": 2}, fetch)
+        self._service.get_or_set(NAMESPACE, "find", {"b": 2, "a": 1}, fetch)
+        self._service.get_or_set(NAMESPACE, "find", {"a": 2}, fetch)
+        self._service.get_or_set(NAMESPACE, "count", {"a": 1}, fetch)
+
+        self.assertEqual(fetch.call_count, 3)
+
+    def test_03_invalidate_bumps_generation(self) -> None:
+        fetch = mock.Mock(return_value=1)
+
+        self.assertEqual(self._service.get_generation(NAMESPACE), 0)
+        self._service.get_or_set(NAMESPACE, "count", {}, fetch)
+
+        self._service.invalidate(NAMESPACE)
+        self.assertEqual(self._service.get_generation(NAMESPACE), 1)
+        self._service.invalidate(NAMESPACE)
+        self.assertEqual(self._service.get_generation(NAMESPACE), 2)
+
+        self._service.get_or_set(NAMESPACE, "count", {}, fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(self._service.get_stats()["invalidations"], 2)
+        self.assertEqual(self._service.get_generation("backtests"), 0)
+
+    def test_04_fall_back_to_fetch_on_errors(self) -> None:
+        broken = mock.Mock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.add.side_effect = ConnectionError("down")
+        fetch = mock.Mock(return_value=[])
+
+        with mock.patch("apps.core.services.cache.cache", broken):
+            value = self._service.get_or_set(NAMESPACE, "find", {}, fetch)
+            self._service.invalidate(NAMESPACE)
+            generation = self._service.get_generation(NAMESPACE)
+
+        self.assertEqual(value, [])
+        self.assertIsNone(generation)
+        fetch.assert_called_once_with()
+
+        stats = self._service.get_stats()
+        self.assertEqual(stats["errors"], 3)
+        self.assertEqual(stats["invalidations"], 0)
+        self.assertIsNone(stats["hit_ratio"])
+
+    def test_05_return_value_when_write_fails(self) -> None:
+        with mock.patch.object(self._cache, "set", side_effect=ConnectionError):
+            value = self._service.get_or_set(NAMESPACE, "find", {}, lambda: 7)
+
+        self.assertEqual(value, 7)
+        self.assertEqual(self._service.get_stats()["errors"], 1)
+
+    def test_06_expire_entries_after_timeout(self) -> None:
+        with mock.patch.object(self._cache, "set") as cache_set:
+            self._service.get_or_set(NAMESPACE, "count", {}, lambda: 1, timeout=30)
+            self._service.get_or_set(NAMESPACE, "find", {}, lambda: [])
+
+        self.assertEqual(cache_set.call_args_list[0].args[2], 30)
+        self.assertEqual(
+            cache_set.call_args_list[1].args[2],
+            settings.READ_CACHE_TTL,
+        )
+
+    def test_07_share_entries_with_async_api(self) -> None:
+        async def fetch() -> int:
+            return 5
+
+        async def run() -> None:
+            self.assertEqual(
+                await self._service.aget_or_set(NAMESPACE, "count", {}, fetch),
+                5,
+            )
+            self.assertEqual(
+                self._service.get_or_set(NAMESPACE, "count", {}, lambda: 0),
+                5,
+            )
+
+            await self._service.ainvalidate(NAMESPACE)
+
+            self.assertEqual(await self._service.aget_generation(NAMESPACE), 1)
+
+        asyncio.run(run())
+
+        self.assertEqual(self._get_stats(), (1, 1, 0.5))
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_stats(self) -> Tuple[int, int, Optional[float]]:
+        stats = self._service.get_stats()
+        return stats["hits"], stats["misses"], stats["hit_ratio"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import unittest
+from datetime import UTC, datetime
+from typing import Any, AsyncIterator, Dict, List
+from unittest import mock
+
+from bson import ObjectId
+
+from apps.core.controllers.base import BaseController
+
+DOCUMENTS: List[Dict[str, Any]] = [
+    {
+        "_id": ObjectId(),
+        "symbol": "BTCUSDT",
+        "price": 110000.5 + index,
+        "profit": None,
+        "created_at": datetime(2024, 5, 3, 11, index, 0, 250000, tzinfo=UTC).replace(
+            tzinfo=None,
+        ),
+    }
+    for index in range(3)
+]
+FIND_PARAMS: Dict[str, Any] = {
+    "limit": 2,
+    "offset": 0,
+    "sort_by": "created_at",
+    "sort_direction": "asc",
+    "query_filters": {},
+    "projection_fields": None,
+}
+CURSOR_SCOPE = ["created_at", "asc", "0" * 16]
+
+
+class TestStreamedList(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _controller: BaseController
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._controller = BaseController()
+        self._controller._model = mock.Mock()
+        self._controller._model.afind = mock.AsyncMock(return_value=DOCUMENTS)
+        self._controller._model.astream = self._stream
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_match_buffered_body(self) -> None:
+        buffered = asyncio.run(
+            self._controller._render_list(FIND_PARAMS, {"page": 1}, CURSOR_SCOPE)
+        )
+
+        self.assertEqual(self._render_streamed(), buffered.content)
+
+    def test_02_encode_cursor_from_native_values(self) -> None:
+        body = json.loads(self._render_streamed())
+        cursor = body["data"]["pagination"]["next_cursor"]
+
+        self.assertEqual(len(body["data"]["results"]), FIND_PARAMS["limit"])
+        self.assertEqual(body["data"]["results"][0]["_id"], str(DOCUMENTS[0]["_id"]))
+        self.assertEqual(
+            self._controller._decode_cursor(cursor, CURSOR_SCOPE),
+            [DOCUMENTS[1]["created_at"], DOCUMENTS[1]["_id"]],
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _render_streamed(self) -> bytes:
+        async def run() -> bytes:
+            response = await self._controller._render_streamed_list(
+                FIND_PARAMS,
+                {"page": 1},
+                CURSOR_SCOPE,
+            )
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        return asyncio.run(run())
+
+    # Helpers
+    async def _stream(self, **params: Any) -> AsyncIterator[Dict[str, Any]]:
+        for document in DOCUMENTS[: params["limit"]]:
+            yield document
+
+
+class TestSeekFilters(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _controller: BaseController
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._controller = BaseController()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_seek_past_values_with_trailing_nulls(self) -> None:
+        last_id = DOCUMENTS[0]["_id"]
+
+        self.assertEqual(
+            self._build_seek_filters({**DOCUMENTS[0], "profit": 1.5}, "asc"),
+            {
+                "$or": [
+                    {"profit": {"$gt": 1.5}},
+                    {"profit": 1.5, "_id": {"$gt": last_id}},
+                ]
+            },
+        )
+        self.assertEqual(
+            self._build_seek_filters({**DOCUMENTS[0], "profit": 1.5}, "desc"),
+            {
+                "$or": [
+                    {"profit": {"$lt": 1.5}},
+                    {"profit": 1.5, "_id": {"$lt": last_id}},
+                    {"profit": None},
+                ]
+            },
+        )
+
+    def test_02_seek_past_null_boundary(self) -> None:
+        document = {"_id": DOCUMENTS[1]["_id"]}
+
+        self.assertEqual(
+            self._build_seek_filters(document, "asc"),
+            {
+                "$or": [
+                    {"profit": None, "_id": {"$gt": document["_id"]}},
+                    {"profit": {"$ne": None}},
+                ]
+            },
+        )
+        self.assertEqual(
+            self._build_seek_filters(document, "desc"),
+            {"profit": None, "_id": {"$lt": document["_id"]}},
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _build_seek_filters(
+        self,
+        document: Dict[str, Any],
+        sort_direction: str,
+    ) -> Dict[str, Any]:
+        cursor_scope = ["profit", sort_direction, "0" * 16]
+        cursor = self._controller._encode_cursor(document, "profit", cursor_scope)
+
+        return self._controller._build_seek_filters(
+            cursor,
+            cursor_scope,
+            "profit",
+            sort_direction,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
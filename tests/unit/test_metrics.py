@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from apps.core.helpers import get_metrics_from
+from apps.core.helpers.get_cvar_from import get_cvar_from
+from apps.core.helpers.get_profit_factor_from import get_profit_factor_from
+from apps.core.helpers.get_sharpe_ratio_from import get_sharpe_ratio_from_orders
+
+MILLISECONDS_PER_YEAR = 365.25 * 24 * 60 * 60 * 1000
+NAVS = [100.0, 110.0, 99.0, 121.0]
+TIMESTAMPS = [int(index * MILLISECONDS_PER_YEAR) for index in range(len(NAVS))]
+EXPECTED_METRICS = {
+    "nav": 121.0,
+    "nav_peak": 121.0,
+    "r2": 0.42649842271293376,
+    "cagr": 0.0656022367666107,
+    "calmar_ratio": 0.656022367666107,
+    "expected_shortfall": -0.1,
+    "max_drawdown": -0.1,
+    "profit_factor": 32 / 11,
+    "recovery_factor": 2.1,
+    "sharpe_ratio": 0.4553694402487872,
+    "sortino_ratio": 1.28300059819917,
+    "ulcer_index": 0.05,
+}
+
+
+class TestMetrics(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_compute_known_series(self) -> None:
+        metrics = get_metrics_from(NAVS, TIMESTAMPS)
+
+        self.assertEqual(set(metrics), set(EXPECTED_METRICS))
+
+        for name, expected in EXPECTED_METRICS.items():
+            self.assertAlmostEqual(metrics[name], expected, places=9, msg=name)
+
+    def test_02_handle_empty_series(self) -> None:
+        self.assertEqual(get_metrics_from([], []), {})
+
+    def test_03_handle_single_point(self) -> None:
+        metrics = get_metrics_from([100.0], [0])
+
+        self.assertEqual(metrics["nav"], 100.0)
+        self.assertEqual(metrics["max_drawdown"], 0.0)
+        self.assertEqual(metrics["sharpe_ratio"], 0.0)
+        self.assertEqual(metrics["cagr"], 0.0)
+
+    def test_04_drop_non_finite_values(self) -> None:
+        metrics = get_metrics_from([100.0, 110.0, 120.0], TIMESTAMPS[:3])
+
+        self.assertIsNone(metrics["profit_factor"])
+        self.assertEqual(metrics["max_drawdown"], 0.0)
+        self.assertEqual(metrics["calmar_ratio"], 0.0)
+
+    def test_05_compute_ratios(self) -> None:
+        returns = np.array([0.01, -0.02, 0.03, 0.0, -0.01])
+
+        self.assertAlmostEqual(
+            get_profit_factor_from(np.array([5.0, -2.0, 3.0, -2.0])),
+            2.0,
+        )
+        self.assertAlmostEqual(get_cvar_from(returns, 0.8), -0.02)
+        self.assertAlmostEqual(
+            get_sharpe_ratio_from_orders(returns, 252, 0.0),
+            0.002 / float(np.std(returns, ddof=1)) * float(np.sqrt(252)),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
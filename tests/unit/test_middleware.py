@@ -0,0 +1,118 @@
+import unittest
+import zlib
+from typing import Iterator, List
+
+import brotli
+import zstandard
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from apps.core.middleware import CompressionMiddleware, StreamCompressor
+
+FLUSH_SIZE = 32768
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _factory: RequestFactory
+    _middleware: CompressionMiddleware
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._factory = RequestFactory()
+        self._middleware = CompressionMiddleware(lambda _request: HttpResponse())
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_round_trip_every_encoding(self) -> None:
+        chunks = self._build_chunks()
+
+        for encoding in ("gzip", "br", "zstd"):
+            compressor = StreamCompressor(encoding, 3, FLUSH_SIZE)
+            blob = b"".join(compressor.compress(chunk) for chunk in chunks)
+            blob += compressor.finish()
+
+            self.assertEqual(self._decompress(encoding, blob), b"".join(chunks))
+
+    def test_02_flush_only_at_threshold(self) -> None:
+        chunks = self._build_chunks()
+        compressor = StreamCompressor("gzip", 6, FLUSH_SIZE)
+        emitted = [compressor.compress(chunk) for chunk in chunks]
+        size = sum(len(chunk) for chunk in chunks)
+
+        self.assertLessEqual(
+            len([chunk for chunk in emitted if chunk]),
+            size // FLUSH_SIZE + 1,
+        )
+
+    def test_03_negotiate_encoding(self) -> None:
+        self.assertEqual(self._middleware._get_encoding("gzip, br;q=0.5"), "gzip")
+        self.assertEqual(self._middleware._get_encoding("gzip;q=0.1, zstd"), "zstd")
+        self.assertEqual(self._middleware._get_encoding("*"), "zstd")
+        self.assertIsNone(self._middleware._get_encoding("identity"))
+        self.assertIsNone(self._middleware._get_encoding("gzip;q=0"))
+
+    def test_04_compress_buffered_response(self) -> None:
+        content = b'{"results":[' + b'{"value":1},' * 500 + b"{}]}"
+        response = self._process(
+            "br",
+            HttpResponse(content, content_type="application/json"),
+        )
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(brotli.decompress(response.content), content)
+
+    def test_05_skip_small_responses(self) -> None:
+        response = self._process(
+            "gzip",
+            HttpResponse(b'{"ok":true}', content_type="application/json"),
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_06_compress_streaming_response(self) -> None:
+        chunks = self._build_chunks()
+        response = self._process(
+            "gzip",
+            StreamingHttpResponse(iter(chunks), content_type="application/json"),
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            zlib.decompress(b"".join(response.streaming_content), 31),
+            b"".join(chunks),
+        )
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _process(self, encoding: str, response: HttpResponse) -> HttpResponse:
+        request = self._factory.get("/", HTTP_ACCEPT_ENCODING=encoding)
+        return self._middleware.process_response(request, response)
+
+    # Helpers
+    def _build_chunks(self) -> List[bytes]:
+        return list(self._iter_chunks())
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for index in range(10000):
+            yield b'{"index":%d,"value":"snapshot"},' % index
+
+    def _decompress(self, encoding: str, blob: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.decompress(blob)
+
+        if encoding == "zstd":
+            return zstandard.ZstdDecompressor().decompressobj().decompress(blob)
+
+        return zlib.decompress(blob, 31)
+
+
+if __name__ == "__main__":
+    unittest.main()
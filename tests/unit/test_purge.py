@@ -0,0 +1,183 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest import mock
+
+from bson import ObjectId
+from django.test import override_settings
+
+from apps.core.enums.backtest_status import BacktestStatus
+from apps.core.tasks.backtest.purge import BacktestPurgeTask
+
+BATCH_SIZE = 2
+
+
+class MemoryModel:
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    documents: List[Dict[str, Any]]
+    updates: List[Dict[str, Any]]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def __init__(self, documents: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.documents = documents or []
+        self.updates = []
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def find(
+        self,
+        limit: int = 9**100,
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,  # noqa: ARG002
+    ) -> List[Dict[str, Any]]:
+        return [
+            document
+            for document in self.documents
+            if self._is_matched(document, query_filters or {})
+        ][:limit]
+
+    def stream(
+        self,
+        query_filters: Optional[Dict[str, Any]] = None,
+        projection_fields: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        yield from self.find(
+            query_filters=query_filters,
+            projection_fields=projection_fields,
+        )
+
+    def update(self, query_filters: Dict[str, Any], data: Dict[str, Any]) -> None:
+        for document in self.find(query_filters=query_filters):
+            document.update(data)
+
+        self.updates.append(data)
+
+    def delete(self, query_filters: Dict[str, Any]) -> int:
+        return self.delete_many(query_filters=query_filters)
+
+    def delete_many(self, query_filters: Dict[str, Any]) -> int:
+        matched = self.find(query_filters=query_filters)
+        self.documents = [item for item in self.documents if item not in matched]
+        return len(matched)
+
+    # Helpers
+    def _is_matched(self, document: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+        for field, expected in filters.items():
+            if isinstance(expected, dict):
+                if document.get(field) not in expected["$in"]:
+                    return False
+            elif document.get(field) != expected:
+                return False
+
+        return True
+
+
+class TestBacktestPurge(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _backtest_id: str
+    _folder: Path
+    _models: Dict[str, MemoryModel]
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self._folder = Path(temp_dir.name)
+        self._backtest_id = str(ObjectId())
+        self._models = {
+            "BacktestModel": MemoryModel(
+                [
+                    {
+                        "_id": ObjectId(self._backtest_id),
+                        "status": BacktestStatus.DELETING.value,
+                    }
+                ]
+            ),
+            "ReportModel": self._build_children(1),
+            "SnapshotModel": self._build_children(5),
+            "StrategyMetricsModel": self._build_children(2),
+            "OrderModel": self._build_children(3),
+        }
+
+        for name, model in self._models.items():
+            patcher = mock.patch(
+                f"apps.core.tasks.backtest.purge.{name}",
+                return_value=model,
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_purge_children_and_report_folders(self) -> None:
+        report_id = str(self._models["ReportModel"].documents[0]["_id"])
+        report_folder = self._folder / "storage" / "reports" / report_id
+        report_folder.mkdir(parents=True)
+        (report_folder / "metrics.json").write_text("{}")
+
+        progress = self._run()
+
+        self.assertEqual(
+            progress,
+            {"reports": 1, "snapshots": 5, "strategy_metrics": 2, "orders": 3},
+        )
+        self.assertFalse(report_folder.exists())
+
+        for model in self._models.values():
+            self.assertEqual(model.documents, [])
+
+    def test_02_write_heartbeat_with_progress(self) -> None:
+        self._run()
+
+        updates = self._models["BacktestModel"].updates
+
+        self.assertTrue(updates)
+        self.assertTrue(all("purge_heartbeat_at" in update for update in updates))
+
+    def test_03_skip_backtests_not_marked(self) -> None:
+        backtest = self._models["BacktestModel"].documents[0]
+        backtest["status"] = BacktestStatus.COMPLETED.value
+
+        self._run()
+
+        self.assertEqual(len(self._models["OrderModel"].documents), 3)
+        self.assertEqual(self._models["BacktestModel"].documents, [backtest])
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _run(self) -> Dict[str, int]:
+        with override_settings(
+            BASE_DIR=self._folder,
+            BACKTEST_PURGE={
+                "BATCH_SIZE": BATCH_SIZE,
+                "THROTTLE_SECONDS": 0,
+                "STALE_AFTER_SECONDS": 900,
+            },
+        ):
+            return BacktestPurgeTask(backtest_id=self._backtest_id).run()
+
+    # Helpers
+    def _build_children(self, count: int) -> MemoryModel:
+        return MemoryModel(
+            [
+                {"_id": ObjectId(), "backtest_id": self._backtest_id}
+                for _ in range(count)
+            ]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import unittest
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+from bson import ObjectId
+from django.test import override_settings
+
+from apps.core.renderers import JSONRenderer, OrjsonRenderer, get_renderer
+
+OBJECT_ID = ObjectId("663a5b2f9c1d4e0a12345678")
+CREATED_AT = datetime(2024, 5, 3, 11, 0, 0, 123456, tzinfo=UTC).replace(tzinfo=None)
+PAYLOAD: Dict[str, Any] = {
+    "success": True,
+    "message": "Data retrieved successfully",
+    "data": {
+        "results": [
+            {
+                "_id": OBJECT_ID,
+                "price": 110000.5,
+                "volume": 1,
+                "profit": None,
+                "created_at": CREATED_AT,
+                "updated_at": datetime(2024, 5, 3, 11, 0, 0, tzinfo=UTC),
+                "tags": ["a", "b"],
+            }
+        ],
+        "groups": {1: "numeric-key"},
+    },
+}
+
+
+class TestRenderers(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        get_renderer.cache_clear()
+        self.addCleanup(get_renderer.cache_clear)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_render_identical_bytes(self) -> None:
+        expected = JSONRenderer().render(PAYLOAD)
+
+        self.assertEqual(OrjsonRenderer().render(PAYLOAD), expected)
+
+        row = json.loads(expected)["data"]["results"][0]
+        self.assertEqual(row["_id"], str(OBJECT_ID))
+        self.assertEqual(row["created_at"], "2024-05-03T11:00:00.123456")
+        self.assertEqual(row["updated_at"], "2024-05-03T11:00:00+00:00")
+        self.assertEqual(json.loads(expected)["data"]["groups"], {"1": "numeric-key"})
+
+    def test_02_render_unicode(self) -> None:
+        data = {"symbol": "€URO", "note": "señal"}
+
+        for renderer in (JSONRenderer(), OrjsonRenderer()):
+            self.assertEqual(json.loads(renderer.render(data)), data)
+
+    def test_03_reject_unknown_types(self) -> None:
+        for renderer in (JSONRenderer(), OrjsonRenderer()):
+            with self.assertRaises(TypeError):
+                renderer.render({"value": Decimal("1.5")})
+
+    def test_04_load_configured_renderer(self) -> None:
+        with override_settings(RESPONSE_RENDERER="apps.core.renderers.JSONRenderer"):
+            renderer = get_renderer()
+
+        self.assertIsInstance(renderer, JSONRenderer)
+        self.assertNotIsInstance(renderer, OrjsonRenderer)
+        self.assertIs(get_renderer(), renderer)
+        self.assertEqual(renderer.content_type, "application/json")
+
+        get_renderer.cache_clear()
+
+        with override_settings(
+            RESPONSE_RENDERER="apps.core.renderers.OrjsonRenderer",
+        ):
+            self.assertIsInstance(get_renderer(), OrjsonRenderer)
+
+
+if __name__ == "__main__":
+    unittest.main()
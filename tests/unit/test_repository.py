@@ -0,0 +1,212 @@
+import asyncio
+import unittest
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from apps.core.repositories.base import BaseRepository
+
+CREATED_AT = datetime(2024, 5, 3, 11, 0, tzinfo=UTC)
+
+
+class TestRepositoryUpsert(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _collection: mock.Mock
+    _repository: BaseRepository
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        with (
+            mock.patch("apps.core.repositories.base.MongoDBService"),
+            mock.patch("apps.core.repositories.base.CacheService"),
+        ):
+            self._repository = BaseRepository(collection_name="snapshots")
+
+        self._collection = self._repository._db_service.get_collection.return_value
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_keep_newest_document_without_client_id(self) -> None:
+        data = {"_id": ObjectId(), "nav": 1.0, "created_at": CREATED_AT}
+
+        (stage,) = self._repository._build_upsert_pipeline(
+            {key: value for key, value in data.items() if key != "_id"}
+        )
+        is_newer, replacement, current = stage["$replaceWith"]["$cond"]
+
+        self.assertEqual(
+            is_newer,
+            {"$gte": [CREATED_AT, {"$ifNull": ["$created_at", CREATED_AT]}]},
+        )
+        self.assertEqual(
+            replacement,
+            {
+                "$mergeObjects": [
+                    {"_id": "$_id"},
+                    {"$literal": {"nav": 1.0, "created_at": CREATED_AT}},
+                ]
+            },
+        )
+        self.assertEqual(current, "$$ROOT")
+
+    def test_02_retry_single_upsert_on_duplicate_key(self) -> None:
+        snapshot_id = ObjectId()
+        data: Dict[str, Any] = {"_id": ObjectId(), "created_at": CREATED_AT}
+        self._collection.find_one_and_update.side_effect = [
+            DuplicateKeyError("E11000"),
+            {"_id": snapshot_id},
+        ]
+
+        result = self._repository.upsert(query_filters={"bucket": 1}, data=data)
+
+        self.assertEqual(result, str(snapshot_id))
+        self.assertEqual(data["_id"], snapshot_id)
+        self.assertEqual(self._collection.find_one_and_update.call_count, 2)
+
+        params = self._collection.find_one_and_update.call_args.kwargs
+        self.assertTrue(params["upsert"])
+        self.assertNotIn("_id", params["update"][0]["$replaceWith"]["$cond"][1])
+
+    def test_03_resolve_bulk_upsert_ids(self) -> None:
+        inserted_id, upserted_id, matched_id = ObjectId(), ObjectId(), ObjectId()
+        query_filters: List[Optional[Dict[str, Any]]] = [None, {"b": 1}, {"b": 2}]
+        data = [
+            {"_id": inserted_id, "created_at": CREATED_AT},
+            {"_id": ObjectId(), "b": 1, "created_at": CREATED_AT},
+            {"b": 2, "created_at": CREATED_AT},
+        ]
+        self._collection.bulk_write.return_value.upserted_ids = {1: upserted_id}
+        self._collection.find.return_value = [{"_id": matched_id, "b": 2}]
+
+        result = self._repository.upsert_many(query_filters=query_filters, data=data)
+
+        operations = self._collection.bulk_write.call_args.args[0]
+        self.assertIsInstance(operations[0], InsertOne)
+        self.assertIsInstance(operations[1], UpdateOne)
+        self.assertEqual(
+            result,
+            [str(inserted_id), str(upserted_id), str(matched_id)],
+        )
+        self.assertEqual(
+            self._collection.find.call_args.args,
+            ({"$or": [{"b": 2}]}, {"b": 1}),
+        )
+
+    def test_04_retry_duplicate_bulk_upserts(self) -> None:
+        query_filters: List[Optional[Dict[str, Any]]] = [{"b": 1}, None, {"b": 2}]
+        data = [
+            {"b": 1, "created_at": CREATED_AT},
+            {"created_at": CREATED_AT},
+            {"b": 2, "created_at": CREATED_AT},
+        ]
+        first_id, second_id = ObjectId(), ObjectId()
+        retried = mock.Mock(upserted_ids={0: first_id})
+        self._collection.bulk_write.side_effect = [
+            BulkWriteError(
+                {
+                    "writeErrors": [{"index": 0, "code": 11000}],
+                    "upserted": [{"index": 2, "_id": second_id}],
+                }
+            ),
+            retried,
+        ]
+
+        result = self._repository.upsert_many(
+            query_filters=query_filters,
+            data=data,
+            ordered=False,
+        )
+
+        self.assertEqual(len(self._collection.bulk_write.call_args.args[0]), 1)
+        self.assertEqual(result[0], str(first_id))
+        self.assertEqual(result[2], str(second_id))
+        self._collection.find.assert_not_called()
+
+    def test_05_remap_failed_bulk_retries(self) -> None:
+        query_filters: List[Optional[Dict[str, Any]]] = [{"b": 1}, {"b": 2}]
+        data = [
+            {"b": 1, "created_at": CREATED_AT},
+            {"b": 2, "created_at": CREATED_AT},
+        ]
+        self._collection.bulk_write.side_effect = [
+            BulkWriteError({"writeErrors": [{"index": 1, "code": 11000}]}),
+            BulkWriteError({"writeErrors": [{"index": 0, "code": 121}]}),
+        ]
+
+        with self.assertRaises(BulkWriteError) as context:
+            self._repository.upsert_many(query_filters=query_filters, data=data)
+
+        self.assertEqual(context.exception.details["writeErrors"][0]["index"], 1)
+
+    def test_06_raise_other_bulk_errors(self) -> None:
+        error = BulkWriteError({"writeErrors": [{"index": 0, "code": 121}]})
+        self._collection.bulk_write.side_effect = error
+
+        with self.assertRaises(BulkWriteError) as context:
+            self._repository.upsert_many(
+                query_filters=[{"b": 1}],
+                data=[{"b": 1, "created_at": CREATED_AT}],
+            )
+
+        self.assertIs(context.exception, error)
+        self.assertEqual(self._collection.bulk_write.call_count, 1)
+
+
+class TestRepositoryCount(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _repository: BaseRepository
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        with (
+            mock.patch("apps.core.repositories.base.MongoDBService"),
+            mock.patch("apps.core.repositories.base.CacheService"),
+        ):
+            self._repository = BaseRepository(collection_name="orders")
+
+        self._repository._cache_service.aget_or_set = mock.AsyncMock(return_value=7)
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_cache_filtered_count_for_ttl(self) -> None:
+        total = asyncio.run(
+            self._repository.acount(query_filters={"side": "buy"}, cache_ttl=30)
+        )
+
+        self.assertEqual(total, 7)
+
+        call = self._repository._cache_service.aget_or_set.call_args
+        self.assertEqual(
+            call.args[:3],
+            ("orders", "count", {"query_filters": {"side": "buy"}}),
+        )
+        self.assertEqual(call.kwargs["timeout"], 30)
+
+    def test_02_count_uncached_without_ttl(self) -> None:
+        with mock.patch.object(
+            self._repository,
+            "_acount",
+            mock.AsyncMock(return_value=3),
+        ):
+            total = asyncio.run(self._repository.acount(query_filters={"a": 1}))
+
+        self.assertEqual(total, 3)
+        self._repository._cache_service.aget_or_set.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+from datetime import UTC, datetime
+from typing import Any, Dict, List
+from unittest import mock
+
+import numpy as np
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from apps.core.models.snapshot import SnapshotModel
+
+WINDOW_SECONDS = 60
+
+
+def build_model() -> SnapshotModel:
+    with (
+        mock.patch("apps.core.models.snapshot.SnapshotRepository"),
+        mock.patch("apps.core.models.snapshot.BacktestRepository"),
+        mock.patch("apps.core.models.snapshot.StrategyMetricsModel"),
+    ):
+        return SnapshotModel()
+
+
+class TestSnapshotCoalescing(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _backtest_id: str
+    _model: SnapshotModel
+    _repository: mock.Mock
+    _metrics_model: mock.Mock
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._backtest_id = str(ObjectId())
+        self._model = build_model()
+        self._repository = self._model._repository
+        self._metrics_model = self._model._metrics_model
+        self._model._backtest_repository.find.return_value = [
+            {"snapshot_coalesce_window": WINDOW_SECONDS}
+        ]
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_build_bucket_filters(self) -> None:
+        data = self._build_snapshots([0, 10, 70])
+        data.append({"backtest_id": self._backtest_id, "event": "on_start"})
+
+        query_filters = self._model._prepare_buckets(data)
+
+        self.assertEqual(
+            [item["coalesce_bucket"] if item else None for item in query_filters],
+            [28578900, 28578900, 28578901, None],
+        )
+        self.assertTrue(all("_id" not in item for item in data))
+        self._repository.find.assert_not_called()
+
+    def test_02_upsert_and_accumulate_single_snapshot(self) -> None:
+        (data,) = self._build_snapshots([10])
+        self._repository.upsert.return_value = str(ObjectId())
+
+        snapshot_id = self._model.store(data)
+
+        self.assertEqual(snapshot_id, self._repository.upsert.return_value)
+        self.assertEqual(
+            self._repository.upsert.call_args.kwargs["query_filters"],
+            {
+                "backtest_id": self._backtest_id,
+                "strategy_id": "ema5_breakout",
+                "coalesce_bucket": 28578900,
+            },
+        )
+        self.assertEqual(self._get_accumulated(), [data])
+
+    def test_03_accumulate_every_written_snapshot(self) -> None:
+        data = self._build_snapshots([0, 10, 70])
+
+        self._model.store_many(data)
+
+        self.assertEqual(self._get_accumulated(), data)
+        self.assertEqual(
+            [item["coalesce_bucket"] for item in self._get_accumulated()],
+            [28578900, 28578900, 28578901],
+        )
+
+    def test_04_accumulate_written_snapshots_on_error(self) -> None:
+        data = self._build_snapshots([0, 70, 130])
+        self._repository.upsert_many.side_effect = BulkWriteError(
+            {"writeErrors": [{"index": 1}]},
+        )
+
+        with self.assertRaises(BulkWriteError):
+            self._model.store_many(data)
+
+        self.assertEqual(self._get_accumulated(), [data[0]])
+
+    def test_05_mark_stale_when_accumulation_fails(self) -> None:
+        data = self._build_snapshots([0])
+        self._metrics_model.accumulate.side_effect = RuntimeError("down")
+
+        self._model.store_many(data)
+
+        self._metrics_model.mark_stale.assert_called_once_with(data)
+
+    def test_06_replay_buckets_on_rebuild(self) -> None:
+        self._model.rebuild_metrics(self._backtest_id)
+
+        projection = self._repository.stream.call_args.kwargs["projection_fields"]
+        self.assertEqual(projection["coalesce_bucket"], 1)
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _get_accumulated(self) -> List[Dict[str, Any]]:
+        return self._metrics_model.accumulate.call_args.args[0]
+
+    # Helpers
+    def _build_snapshots(self, offsets: List[int]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "backtest_id": self._backtest_id,
+                "strategy_id": "ema5_breakout",
+                "event": "on_tick",
+                "nav": 1000.0 + offset,
+                "created_at": datetime.fromtimestamp(
+                    1714734000 + offset,
+                    tz=UTC,
+                ),
+            }
+            for offset in offsets
+        ]
+
+
+class TestSnapshotSeries(unittest.TestCase):
+    # ───────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ───────────────────────────────────────────────────────────
+    _model: SnapshotModel
+
+    # ───────────────────────────────────────────────────────────
+    # CONSTRUCTOR
+    # ───────────────────────────────────────────────────────────
+    def setUp(self) -> None:
+        self._model = build_model()
+
+    # ───────────────────────────────────────────────────────────
+    # PUBLIC METHODS
+    # ───────────────────────────────────────────────────────────
+    def test_01_load_columns_per_strategy(self) -> None:
+        documents = [
+            {"strategy_id": "a", "created_at": 1000, "nav": 1.0, "allocation": 0.5},
+            {"strategy_id": "b", "created_at": 1500, "nav": 2.0},
+            {"strategy_id": "a", "created_at": 2000, "nav": None},
+            {"strategy_id": "b", "created_at": 2500, "nav": 3.0, "allocation": 1.0},
+            {"strategy_id": "a", "created_at": 3000, "nav": 4.0},
+        ]
+
+        series = self._load(documents, len(documents))
+
+        self.assertEqual(list(series), ["a", "b"])
+        np.testing.assert_array_equal(series["a"]["created_at"], [1000, 2000, 3000])
+        np.testing.assert_array_equal(series["a"]["nav"], [1.0, np.nan, 4.0])
+        np.testing.assert_array_equal(series["a"]["allocation"], [0.5, np.nan, np.nan])
+        np.testing.assert_array_equal(series["b"]["created_at"], [1500, 2500])
+        np.testing.assert_array_equal(series["b"]["nav"], [2.0, 3.0])
+        self.assertEqual(series["a"]["created_at"].dtype, np.int64)
+
+    def test_02_bound_columns_by_count(self) -> None:
+        documents = [
+            {"strategy_id": "a", "created_at": index, "nav": float(index)}
+            for index in range(5)
+        ]
+
+        series = self._load(documents, 3)
+        np.testing.assert_array_equal(series["a"]["nav"], [0.0, 1.0, 2.0])
+
+        series = self._load(documents[:2], 4)
+        np.testing.assert_array_equal(series["a"]["nav"], [0.0, 1.0])
+
+    def test_03_load_empty_backtest(self) -> None:
+        self.assertEqual(self._load([], 0), {})
+
+    # ───────────────────────────────────────────────────────────
+    # PRIVATE METHODS
+    # ───────────────────────────────────────────────────────────
+    def _load(
+        self,
+        documents: List[Dict[str, Any]],
+        count: int,
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        with (
+            mock.patch.object(self._model, "count", return_value=count),
+            mock.patch.object(self._model, "stream", return_value=iter(documents)),
+        ):
+            return self._model.load_series(str(ObjectId()))
+
+
+if __name__ == "__main__":
+    unittest.main()